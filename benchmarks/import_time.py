@@ -0,0 +1,131 @@
+"""Measure how long project modules take to import in a fresh interpreter.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py src.run src.fetchers --repeat 10 --top 15
+    python benchmarks/import_time.py --check --repeat 1
+
+Each module is imported ``--repeat`` times in a new ``python -X importtime``
+process, so nothing is cached in ``sys.modules`` between runs (the OS file
+cache is warm after the first run). The table shows the median and best
+cumulative import time of the module itself, plus the heavy third-party
+packages it pulled in. ``--top`` lists the slowest imports of the median run.
+``--check`` exits with status 1 when a module in ``LIGHT_MODULES`` loads any
+of them, so it can guard against a heavy import creeping back in.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = [
+    "src",
+    "src.config",
+    "src.http",
+    "src.scrapers",
+    "src.fetchers",
+    "src.service.server",
+    "src.run",
+    "src.fetch_company_details",
+]
+# Third-party packages worth knowing about when they show up
+HEAVY_PACKAGES = ("pandas", "numpy", "pyarrow", "requests", "bs4", "faker", "openpyxl", "tqdm")
+# Modules that import none of HEAVY_PACKAGES until they are used (--check)
+LIGHT_MODULES = (
+    "src",
+    "src.config",
+    "src.http",
+    "src.scrapers",
+    "src.fetchers",
+    "src.run",
+    "src.fetch_company_details",
+)
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Cumulative microseconds per imported module for one fresh import of ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(module: str, repeat: int) -> Tuple[List[float], Dict[str, int]]:
+    """Milliseconds for each run and the per-module times of the median run."""
+    runs = [import_times(module) for _ in range(repeat)]
+    runs.sort(key=lambda times: times.get(module, 0))
+    median_run = runs[len(runs) // 2]
+    return [times.get(module, 0) / 1000 for times in runs], median_run
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="Show the N slowest imports.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if a light module loads a heavy package.",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        milliseconds, times = measure(module, args.repeat)
+        results[module] = {
+            "median_ms": round(statistics.median(milliseconds), 1),
+            "best_ms": round(min(milliseconds), 1),
+            "heavy": sorted(name for name in HEAVY_PACKAGES if name in times),
+            "slowest": sorted(times.items(), key=lambda item: -item[1])[1 : args.top + 1],
+        }
+
+    violations = {
+        module: result["heavy"]
+        for module, result in results.items()
+        if module in LIGHT_MODULES and result["heavy"]
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+    if args.check and violations:
+        for module, heavy in violations.items():
+            print(f"{module} loads {', '.join(heavy)} at import time", file=sys.stderr)
+        sys.exit(1)
+
+
+def _print_table(results: Dict[str, dict]):
+    width = max(len(module) for module in results)
+    print(f"{'module':<{width}}  {'median ms':>9}  {'best ms':>8}  heavy dependencies loaded")
+    for module, result in results.items():
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(
+            f"{module:<{width}}  {result['median_ms']:>9.1f}  {result['best_ms']:>8.1f}  {heavy}"
+        )
+        for name, microseconds in result["slowest"]:
+            print(f"{'':<{width}}    {microseconds / 1000:>8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
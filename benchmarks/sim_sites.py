@@ -0,0 +1,248 @@
+"""Local HTTP server imitating the profile pages the scrapers read.
+
+One server answers for Google Finance, CNBC, MarketWatch and Yahoo Finance;
+the site is picked from the ``Host`` header, which ``HTTPClient`` keeps when
+``Settings.host_override`` points it here. Pages come from ``fixtures/`` and
+are padded to a realistic size. Latency, injected errors and per-client rate
+limits are configurable per run, and every response is tallied as useful
+(a profile with data) or wasted (errors, rate limits, misses).
+
+Run standalone to poke at it with curl:
+    python benchmarks/sim_sites.py --port 8900 --latency-ms 80
+    curl -H "Host: www.cnbc.com" http://127.0.0.1:8900/quotes/SIM00001
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# Host -> (path pattern, fixture, fixture served for unknown symbols or None for a 404)
+SITES = {
+    "www.google.com": (
+        re.compile(r"^/finance/quote/(?P<ticker>[^:/?]+):(?P<exchange>\w+)"),
+        "google_finance.html",
+        "google_finance_no_match.html",
+    ),
+    "www.cnbc.com": (re.compile(r"^/quotes/(?P<ticker>[^/?]+)"), "cnbc.html", None),
+    "www.marketwatch.com": (
+        re.compile(r"^/investing/stock/(?P<ticker>[^/?]+)/company-profile"),
+        "marketwatch.html",
+        None,
+    ),
+    "finance.yahoo.com": (
+        re.compile(r"^/quote/(?P<ticker>[^/?]+)/profile"),
+        "yahoo_finance.html",
+        None,
+    ),
+}
+YAHOO_LOOKUP = re.compile(r"^/lookup\?s=(?P<ticker>[^&]+)")
+PADDING_BLOCK = '<div class="filler"><span>Market data delayed by 15 minutes.</span></div>\n'
+
+
+@dataclass
+class SimulationConfig:
+    """How the simulated sites behave.
+
+    Latency is log-normal around ``latency_ms`` (``jitter`` is the sigma of
+    the underlying normal; 0 gives a fixed delay). Error rates are the share
+    of requests answered with that status. ``client_rate`` requests per
+    second (burst ``client_burst``) are allowed per client address and site;
+    requests above it get a 429. ``missing`` is the share of symbols a site
+    has no profile for. Odd-numbered symbols are NYSE listings, so Google's
+    NASDAQ page misses them.
+    """
+
+    latency_ms: float = 50.0
+    jitter: float = 0.5
+    error_429: float = 0.0
+    error_403: float = 0.0
+    error_5xx: float = 0.0
+    client_rate: float = 0.0
+    client_burst: int = 5
+    missing: float = 0.05
+    page_kb: int = 100
+    seed: int = 0
+    site_latency_ms: Dict[str, float] = field(default_factory=dict)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class SimulatedSites:
+    """Threaded server for the four sites; use as a context manager."""
+
+    def __init__(self, config: Optional[SimulationConfig] = None, port: int = 0):
+        self.config = config or SimulationConfig()
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._buckets: Dict[Tuple[str, str], _TokenBucket] = {}
+        padding = PADDING_BLOCK * (self.config.page_kb * 1024 // len(PADDING_BLOCK))
+        self._pages = {
+            path.name: path.read_text().replace("{{padding}}", padding)
+            for path in FIXTURES.glob("*.html")
+        }
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SimulatedSites":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="sim-sites", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "SimulatedSites":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def wasted(self) -> int:
+        """Requests that did not return a profile with data."""
+        with self._lock:
+            return sum(
+                count for (_, outcome), count in self.stats.items() if outcome != "useful"
+            )
+
+    def respond(
+        self, host: str, path: str, client: str
+    ) -> Tuple[int, Dict[str, str], str, str]:
+        """Status, headers, body and outcome label for one request."""
+        if host not in SITES:
+            return 404, {}, "unknown host", "unknown host"
+        pattern, fixture, miss_fixture = SITES[host]
+        config = self.config
+        with self._lock:
+            draw = self._random.random()
+            latency = config.site_latency_ms.get(host, config.latency_ms) / 1000
+            if config.jitter:
+                latency *= self._random.lognormvariate(0, config.jitter)
+            allowed = True
+            if config.client_rate > 0:
+                bucket = self._buckets.get((client, host))
+                if bucket is None:
+                    bucket = self._buckets[(client, host)] = _TokenBucket(
+                        config.client_rate, config.client_burst
+                    )
+                allowed = bucket.take()
+        time.sleep(latency)
+
+        if not allowed:
+            return 429, {"Retry-After": "1"}, "Too Many Requests", "rate limited"
+        injected = ((429, config.error_429), (403, config.error_403), (503, config.error_5xx))
+        for status, rate in injected:
+            if draw < rate:
+                return status, {}, "Injected error", f"injected {status}"
+            draw -= rate
+
+        lookup = YAHOO_LOOKUP.match(path) if host == "finance.yahoo.com" else None
+        if lookup:
+            return 200, {}, self._page("yahoo_finance_lookup.html", lookup["ticker"]), "soft 404"
+        match = pattern.match(path)
+        if match is None:
+            return 404, {}, "Not Found", "not found"
+        ticker = match["ticker"]
+        listed = not self._is_missing(host, ticker)
+        if host == "www.google.com":
+            listed = listed and match["exchange"] == self._exchange(ticker)
+        if listed:
+            return 200, {}, self._page(fixture, ticker), "useful"
+        if host == "finance.yahoo.com":
+            return 302, {"Location": f"/lookup?s={ticker}"}, "", "redirect"
+        if miss_fixture:
+            return 200, {}, self._page(miss_fixture, ticker), "soft 404"
+        return 404, {}, "Not Found", "not found"
+
+    def _page(self, fixture: str, ticker: str) -> str:
+        return self._pages[fixture].replace("{{ticker}}", ticker)
+
+    def _is_missing(self, host: str, ticker: str) -> bool:
+        # Stable per (site, symbol) so repeated runs miss the same pages
+        return zlib.crc32(f"{host}|{ticker}".encode()) % 10_000 < self.config.missing * 10_000
+
+    @staticmethod
+    def _exchange(ticker: str) -> str:
+        digits = "".join(ch for ch in ticker if ch.isdigit())
+        return "NYSE" if digits and int(digits) % 2 else "NASDAQ"
+
+    def _handler_class(self):
+        sites = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                host = (self.headers.get("Host") or "").split(":")[0]
+                status, headers, body, outcome = sites.respond(
+                    host, self.path, self.client_address[0]
+                )
+                with sites._lock:
+                    sites.stats[(host, outcome)] += 1
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--client-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    config = SimulationConfig(latency_ms=args.latency_ms, client_rate=args.client_rate)
+    with SimulatedSites(config, port=args.port) as sites:
+        print(f"Serving simulated sites on {sites.url} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
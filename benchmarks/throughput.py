@@ -0,0 +1,196 @@
+"""End-to-end throughput benchmark against locally simulated sites.
+
+Usage:
+    python benchmarks/throughput.py --tickers 500
+    python benchmarks/throughput.py --config production --latency-ms 120 --error-429 0.02
+    python benchmarks/throughput.py --max-workers 32 --rate 0 --client-rate 5 --json
+
+Starts ``sim_sites.SimulatedSites``, writes a synthetic screener snapshot of
+``--tickers`` symbols and runs ``DataProcessor`` over it with every request
+sent to the local server (``Settings.host_override``). Settings come from
+``--config`` plus the tuning flags; AIE_* environment variables are ignored,
+and the reference index, negative cache, geocoding and classification are
+off so runs are comparable. Reports tickers/sec, CPU time, peak RSS and how
+many requests were wasted (errors, rate limits, pages without data).
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# The progress bar would interleave with the report
+os.environ.setdefault("TQDM_DISABLE", "1")
+
+from sim_sites import SimulatedSites, SimulationConfig  # noqa: E402
+
+from src.config.settings import load_settings  # noqa: E402
+from src.observability.manifest import fill_counts  # noqa: E402
+from src.observability.metrics import HTTP_REQUESTS  # noqa: E402
+from src.run import DataProcessor, NasdaqDataProcessor  # noqa: E402
+
+
+# Settings fields the tuning flags override
+TUNING_FIELDS = (
+    "max_workers", "window", "scrapers", "rate", "burst", "concurrency", "timeout",
+    "max_retries", "retry_delay",
+)
+
+
+def write_universe(path: Path, tickers: int) -> Path:
+    """Synthetic screener snapshot with ``tickers`` distinct issuers."""
+    lines = ["Symbol,Name,Market Capital"]
+    lines += [
+        f"SIM{i:05d},Simulated Company {i} Common Stock,{i}000000"
+        for i in range(1, tickers + 1)
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one enrichment pass against the simulated sites and collect the numbers."""
+    config = SimulationConfig(
+        latency_ms=args.latency_ms,
+        jitter=args.jitter,
+        error_429=args.error_429,
+        error_403=args.error_403,
+        error_5xx=args.error_5xx,
+        client_rate=args.client_rate,
+        client_burst=args.client_burst,
+        missing=args.missing,
+        page_kb=args.page_kb,
+        seed=args.seed,
+    )
+    settings = load_settings(
+        args.config, env={}, overrides={name: getattr(args, name) for name in TUNING_FIELDS}
+    )
+    with tempfile.TemporaryDirectory() as tmp, SimulatedSites(config) as sites:
+        settings = dataclasses.replace(
+            settings,
+            host_override=sites.url,
+            negative_cache="",
+            reference="",
+            gazetteer="",
+            classifier="",
+            test_mode=False,
+        )
+        snapshot = write_universe(Path(tmp) / "universe.csv", args.tickers)
+        processor = DataProcessor(
+            nasdaq_processor=NasdaqDataProcessor(offline_snapshot=str(snapshot)),
+            settings=settings,
+        )
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        df = processor.process_stock_data()
+        seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        processor.fetcher.close()
+
+        outcomes: Dict[str, int] = {}
+        for (_, outcome), count in sorted(sites.stats.items()):
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+        requests = sum(outcomes.values())
+        wasted = sites.wasted()
+
+    counts = fill_counts(df)
+    return {
+        "tickers": len(df),
+        "seconds": round(seconds, 3),
+        "tickers_per_second": round(len(df) / seconds, 2),
+        "cpu_seconds": round(cpu_seconds, 3),
+        "cpu_percent": round(100 * cpu_seconds / seconds, 1),
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "requests": requests,
+        "wasted_requests": wasted,
+        "wasted_share": round(wasted / requests, 3) if requests else 0.0,
+        "client_429s": int(HTTP_REQUESTS.value(status="429")),
+        "ceo_hit_rate": round(counts["ceo"] / max(counts["rows"], 1), 3),
+        "outcomes": outcomes,
+        "settings": {
+            "max_workers": settings.max_workers,
+            "window": settings.window,
+            "scrapers": list(settings.scrapers),
+            "rate": settings.http.rate,
+            "burst": settings.http.burst,
+            "concurrency": settings.http.concurrency,
+        },
+        "simulation": dataclasses.asdict(config),
+    }
+
+
+def _parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's logs.")
+
+    tuning = parser.add_argument_group("client", "Pipeline settings under test.")
+    tuning.add_argument("--config", default=None, help="Config file or profile name.")
+    tuning.add_argument("--max-workers", type=int, default=None)
+    tuning.add_argument("--window", type=int, default=None)
+    tuning.add_argument("--scrapers", default=None)
+    tuning.add_argument("--rate", type=float, default=None)
+    tuning.add_argument("--burst", type=int, default=None)
+    tuning.add_argument("--concurrency", type=int, default=None)
+    tuning.add_argument("--timeout", type=float, default=None)
+    tuning.add_argument("--max-retries", type=int, default=None)
+    tuning.add_argument("--retry-delay", type=float, default=None)
+
+    simulation = parser.add_argument_group("simulation", "How the simulated sites behave.")
+    simulation.add_argument("--latency-ms", type=float, default=50.0, help="Median latency.")
+    simulation.add_argument("--jitter", type=float, default=0.5, help="Log-normal sigma.")
+    simulation.add_argument("--error-429", type=float, default=0.0, help="Share of 429s.")
+    simulation.add_argument("--error-403", type=float, default=0.0, help="Share of 403s.")
+    simulation.add_argument("--error-5xx", type=float, default=0.0, help="Share of 503s.")
+    simulation.add_argument(
+        "--client-rate", type=float, default=0.0, help="Allowed requests/sec per site (0: off)."
+    )
+    simulation.add_argument("--client-burst", type=int, default=5)
+    simulation.add_argument(
+        "--missing", type=float, default=0.05, help="Share of symbols a site has no page for."
+    )
+    simulation.add_argument("--page-kb", type=int, default=100, help="Size of each page.")
+    simulation.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None):
+    args = _parse_args(argv)
+    # src.run configures logging on import; only adjust the level
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.ERROR)
+    result = run_benchmark(args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(
+        f"{result['tickers']} tickers in {result['seconds']:.1f}s: "
+        f"{result['tickers_per_second']:.1f} tickers/s"
+    )
+    print(
+        f"CPU {result['cpu_seconds']:.1f}s ({result['cpu_percent']:.0f}% of one core), "
+        f"peak RSS {result['peak_rss_mb']:.0f} MB"
+    )
+    print(
+        f"{result['requests']} requests, {result['wasted_requests']} wasted "
+        f"({100 * result['wasted_share']:.1f}%), CEO hit rate {result['ceo_hit_rate']:.0%}"
+    )
+    for outcome, count in result["outcomes"].items():
+        print(f"  {outcome:<14} {count:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,25 @@ __all__ = [
     "run",
 ]
 
-# Re-export commonly used classes for convenience
-from src.models.company_details import CompanyDetails  # noqa: F401
-from src.fetchers.company_details_fetcher import CompanyDetailsFetcher  # noqa: F401
+# Commonly used classes, re-exported lazily (PEP 562) so that importing a
+# light submodule such as ``src.config`` does not load the whole scraping
+# stack (requests, scrapers, pandas) first
+_LAZY_EXPORTS = {
+    "CompanyDetails": "src.models.company_details",
+    "CompanyDetailsFetcher": "src.fetchers.company_details_fetcher",
+}
 
 
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
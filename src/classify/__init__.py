@@ -0,0 +1,13 @@
+
+
+# CEO name classification package
+
+from .backends import (  # noqa: F401
+    CLASSIFIERS,
+    LlamaCppClassifier,
+    NameClassifier,
+    TransformersClassifier,
+    create_classifier,
+)
+from .cache import ClassificationCache  # noqa: F401
+from .stage import add_ceo_classification, classify_names  # noqa: F401
@@ -0,0 +1,161 @@
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.classify.cache import Classification
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_LABELS = ("American Indian or Alaska Native", "other")
+DEFAULT_TRANSFORMERS_MODEL = "facebook/bart-large-mnli"
+HYPOTHESIS_TEMPLATE = "This person is {}."
+LLAMA_PROMPT = (
+    "For each numbered person below, answer with the number and one label from: "
+    "{labels}. Answer one per line as '<number>: <label>' and nothing else.\n\n"
+    "{names}\n"
+)
+LLAMA_ANSWER_PATTERN = re.compile(r"^\s*(\d+)\s*[:.)-]\s*(.+?)\s*$", re.MULTILINE)
+
+
+def _require(module: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as error:
+        raise ImportError(
+            f"CEO classification requires the '{module}' package (uv sync --extra ml)"
+        ) from error
+
+
+class NameClassifier(ABC):
+    """Label batches of person names.
+
+    Subclasses implement ``_load()`` (build the model) and
+    ``_classify(model, names)``. Models are loaded lazily, once per worker
+    thread, so a run whose names are all cached never loads one and workers
+    never share a model object between threads.
+    """
+
+    backend = ""
+
+    def __init__(self, model: str, labels: Sequence[str] = DEFAULT_LABELS):
+        self.model = model
+        self.labels = tuple(labels)
+        self._local = threading.local()
+
+    @property
+    def model_id(self) -> str:
+        """Identifies the model and labels; part of the cache key."""
+        return f"{self.backend}:{self.model}:{'|'.join(self.labels)}"
+
+    def classify(self, names: Sequence[str]) -> List[Classification]:
+        """Return ``(label, score)`` for each name, in order."""
+        model = getattr(self._local, "model", None)
+        if model is None:
+            logger.info(f"Loading {self.model_id}")
+            model = self._local.model = self._load()
+        return self._classify(model, list(names))
+
+    @abstractmethod
+    def _load(self) -> Any:
+        """Build the model used by ``_classify``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _classify(self, model: Any, names: List[str]) -> List[Classification]:
+        """Label ``names`` with ``model``."""
+        raise NotImplementedError
+
+
+class TransformersClassifier(NameClassifier):
+    """Zero-shot classification with a Hugging Face NLI model on the CPU.
+
+    Each call runs the whole batch through the pipeline in one forward pass
+    per ``batch_size`` names.
+    """
+
+    backend = "transformers"
+
+    def __init__(
+        self,
+        model: str = DEFAULT_TRANSFORMERS_MODEL,
+        labels: Sequence[str] = DEFAULT_LABELS,
+        batch_size: int = 32,
+    ):
+        super().__init__(model, labels)
+        self.batch_size = batch_size
+
+    def _load(self) -> Any:
+        transformers = _require("transformers")
+        return transformers.pipeline("zero-shot-classification", model=self.model, device=-1)
+
+    def _classify(self, model: Any, names: List[str]) -> List[Classification]:
+        outputs = model(
+            names,
+            candidate_labels=list(self.labels),
+            hypothesis_template=HYPOTHESIS_TEMPLATE,
+            batch_size=self.batch_size,
+        )
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        return [(output["labels"][0], float(output["scores"][0])) for output in outputs]
+
+
+class LlamaCppClassifier(NameClassifier):
+    """Prompt a local GGUF model through llama.cpp, one prompt per batch.
+
+    ``model`` is the path to the GGUF file. Answers that cannot be matched
+    to a label are returned as ``"unknown"`` and are not retried.
+    """
+
+    backend = "llama_cpp"
+
+    def __init__(
+        self, model: str, labels: Sequence[str] = DEFAULT_LABELS, threads: Optional[int] = None
+    ):
+        super().__init__(model, labels)
+        self.threads = threads
+
+    def _load(self) -> Any:
+        llama_cpp = _require("llama_cpp")
+        return llama_cpp.Llama(
+            model_path=self.model, n_ctx=4096, n_gpu_layers=0, n_threads=self.threads, verbose=False
+        )
+
+    def _classify(self, model: Any, names: List[str]) -> List[Classification]:
+        prompt = LLAMA_PROMPT.format(
+            labels=", ".join(self.labels),
+            names="\n".join(f"{number}. {name}" for number, name in enumerate(names, 1)),
+        )
+        completion = model(prompt, max_tokens=16 * len(names), temperature=0.0)
+        return self._parse_answers(completion["choices"][0]["text"], len(names))
+
+    def _parse_answers(self, text: str, count: int) -> List[Classification]:
+        by_label = {label.casefold(): label for label in self.labels}
+        answers: Dict[int, str] = {}
+        for number, answer in LLAMA_ANSWER_PATTERN.findall(text):
+            label = by_label.get(answer.strip(" .'\"").casefold())
+            if label is not None:
+                answers.setdefault(int(number), label)
+        return [(answers.get(number, "unknown"), None) for number in range(1, count + 1)]
+
+
+# Settings.classifier -> backend class
+CLASSIFIERS: Dict[str, type] = {
+    TransformersClassifier.backend: TransformersClassifier,
+    LlamaCppClassifier.backend: LlamaCppClassifier,
+}
+
+
+def create_classifier(backend: str, model: str = "", batch_size: int = 32) -> NameClassifier:
+    """Build the classifier named by ``Settings.classifier``."""
+    if backend not in CLASSIFIERS:
+        raise ValueError(f"Unknown classifier {backend!r}; choose from {sorted(CLASSIFIERS)}")
+    if backend == TransformersClassifier.backend:
+        return TransformersClassifier(model or DEFAULT_TRANSFORMERS_MODEL, batch_size=batch_size)
+    if not model:
+        raise ValueError("The llama_cpp classifier needs a GGUF model path (classifier_model)")
+    return LlamaCppClassifier(model)
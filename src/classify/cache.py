@@ -0,0 +1,69 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = ".cache/ceo_classification.sqlite"
+
+# SQLite caps the number of bound parameters per statement
+LOOKUP_BATCH = 500
+
+# (label, score); llama.cpp results carry no score
+Classification = Tuple[str, Optional[float]]
+
+
+class ClassificationCache:
+    """Persistent name -> classification cache, shared across runs.
+
+    Rows are keyed by the classifier's ``model_id`` as well as the name, so
+    changing the model or its labels starts from an empty cache instead of
+    mixing results.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS classification ("
+            " model TEXT NOT NULL, name TEXT NOT NULL, label TEXT NOT NULL, score REAL,"
+            " PRIMARY KEY (model, name)) WITHOUT ROWID"
+        )
+
+    def get_many(self, model_id: str, names: Sequence[str]) -> Dict[str, Classification]:
+        """Cached results for the given name keys; missing names are left out."""
+        found: Dict[str, Classification] = {}
+        with self._lock:
+            for start in range(0, len(names), LOOKUP_BATCH):
+                chunk = list(names[start : start + LOOKUP_BATCH])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT name, label, score FROM classification"
+                    f" WHERE model = ? AND name IN ({placeholders})",
+                    [model_id, *chunk],
+                )
+                for name, label, score in rows:
+                    found[name] = (label, score)
+        return found
+
+    def put_many(self, model_id: str, results: Iterable[Tuple[str, Classification]]):
+        """Store ``(name key, (label, score))`` pairs in one transaction."""
+        rows = [(model_id, name, label, score) for name, (label, score) in results]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO classification VALUES (?, ?, ?, ?)", rows
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM classification").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,92 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.classify.backends import NameClassifier
+from src.classify.cache import Classification, ClassificationCache
+from src.observability.metrics import CEO_CLASSIFICATIONS
+
+
+logger = logging.getLogger(__name__)
+
+
+CLASSIFICATION_COLUMNS = ["CEO Classification", "CEO Classification Score"]
+
+
+def name_key(name: str) -> str:
+    """Cache key for a name: whitespace collapsed, case folded."""
+    return " ".join(str(name).split()).casefold()
+
+
+def classify_names(
+    names: Iterable[str],
+    classifier: NameClassifier,
+    cache: Optional[ClassificationCache] = None,
+    batch_size: int = 32,
+    workers: int = 1,
+) -> Dict[str, Classification]:
+    """Classify distinct names, keyed by ``name_key``.
+
+    Names are deduplicated first and looked up in ``cache``; only the misses
+    are sent to the classifier, ``batch_size`` at a time across ``workers``
+    threads. Each finished batch is written to the cache straight away, so an
+    interrupted run keeps its progress.
+    """
+    originals: Dict[str, str] = {}
+    for name in names:
+        if isinstance(name, str) and name.strip():
+            originals.setdefault(name_key(name), " ".join(name.split()))
+    keys = list(originals)
+
+    results = cache.get_many(classifier.model_id, keys) if cache is not None else {}
+    CEO_CLASSIFICATIONS.inc(len(results), outcome="cached")
+    missing = [key for key in keys if key not in results]
+    logger.info(
+        f"Classifying {len(missing)} of {len(keys)} distinct CEO names "
+        f"({len(results)} cached) with {classifier.model_id}"
+    )
+    if not missing:
+        return results
+
+    batches: List[List[str]] = [
+        missing[start : start + batch_size] for start in range(0, len(missing), batch_size)
+    ]
+
+    def run(batch: List[str]) -> List[Classification]:
+        labelled = classifier.classify([originals[key] for key in batch])
+        if cache is not None:
+            cache.put_many(classifier.model_id, zip(batch, labelled))
+        CEO_CLASSIFICATIONS.inc(len(batch), outcome="classified")
+        return labelled
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="classify") as pool:
+        for batch, labelled in zip(batches, pool.map(run, batches)):
+            results.update(zip(batch, labelled))
+    return results
+
+
+def add_ceo_classification(
+    df: pd.DataFrame,
+    classifier: NameClassifier,
+    cache: Optional[ClassificationCache] = None,
+    batch_size: int = 32,
+    workers: int = 1,
+) -> pd.DataFrame:
+    """Return ``df`` with a label and score column for its ``CEO`` values."""
+    ceos = df["CEO"].astype("string").fillna("")
+    results = classify_names(
+        ceos.unique().tolist(), classifier, cache, batch_size=batch_size, workers=workers
+    )
+    keys = ceos.map(name_key)
+    return df.assign(
+        **{
+            "CEO Classification": keys.map({k: label for k, (label, _) in results.items()}).astype(
+                "category"
+            ),
+            "CEO Classification Score": pd.to_numeric(
+                keys.map({k: score for k, (_, score) in results.items()}), errors="coerce"
+            ),
+        }
+    )
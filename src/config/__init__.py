@@ -0,0 +1,5 @@
+
+
+# Config package
+
+from .settings import HostPolicy, Settings, load_settings  # noqa: F401
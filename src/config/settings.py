@@ -0,0 +1,180 @@
+import dataclasses
+import logging
+import os
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# Built-in defaults, used when no config file, env var or flag overrides them
+DEFAULT_REQUEST_TIMEOUT = 30
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_RATE_LIMIT_DELAY = 1.0
+DEFAULT_SCRAPERS = ("google", "cnbc", "marketwatch", "yahoo")
+
+ENV_PREFIX = "AIE_"
+# Directory searched for named profiles, e.g. ``--config laptop``
+CONFIG_DIR = Path("config")
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Request policy for one host.
+
+    ``rate`` is the sustained requests per second (0 disables pacing) and
+    ``burst`` how many requests may go out back to back after an idle
+    period. ``concurrency`` caps simultaneous requests to the host; ``None``
+    leaves it to the worker count.
+    """
+
+    rate: float = 1 / DEFAULT_RATE_LIMIT_DELAY
+    burst: int = 1
+    concurrency: Optional[int] = None
+    timeout: float = DEFAULT_REQUEST_TIMEOUT
+    max_retries: int = DEFAULT_MAX_RETRIES
+    retry_delay: float = DEFAULT_RETRY_DELAY
+
+    @property
+    def min_interval(self) -> float:
+        return 1 / self.rate if self.rate > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Run configuration: worker pool, enabled scrapers and HTTP policies.
+
+    ``http`` applies to every host; ``hosts`` holds per-host overrides of
+    individual ``HostPolicy`` fields, applied on top of it by ``policy()``.
+    """
+
+    max_workers: int = min(32, (os.cpu_count() or 1) * 5)
+    window: int = 100
+    test_mode: bool = False
+    test_limit: int = 5
+    scrapers: Tuple[str, ...] = DEFAULT_SCRAPERS
+    # Reference index built by ``src.reference.importers``; "" disables prefill
+    reference: str = ""
+    # GeoNames postal-code file used to geocode headquarters; "" disables it
+    gazetteer: str = ""
+    # CEO name classifier backend ("transformers" or "llama_cpp"); "" disables it
+    classifier: str = ""
+    classifier_model: str = ""
+    classifier_batch_size: int = 32
+    # Each worker thread loads its own model copy (bart-large-mnli is ~1.6 GB)
+    classifier_workers: int = 1
+    # Scrape one listing per issuer and copy its details to share classes,
+    # warrants, units and rights of the same issuer
+    dedupe_issuers: bool = True
+    # SQLite file of (source, ticker) pairs that recently yielded nothing, which
+    # are skipped until they expire; "" (the default) disables it
+    negative_cache: str = ""
+    negative_cache_days: float = 14.0
+    # Send every request to this base URL (e.g. http://127.0.0.1:8900) with the
+    # original host in the Host header; used to run against simulated sites
+    host_override: str = ""
+    http: HostPolicy = field(default_factory=HostPolicy)
+    hosts: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+
+    def policy(self, host: str) -> HostPolicy:
+        overrides = self.hosts.get(host)
+        return dataclasses.replace(self.http, **overrides) if overrides else self.http
+
+
+RUN_FIELDS = {
+    f.name: f for f in dataclasses.fields(Settings) if f.name not in ("http", "hosts")
+}
+HOST_FIELDS = {f.name: f for f in dataclasses.fields(HostPolicy)}
+
+
+def load_settings(
+    config: Optional[str] = None,
+    env: Optional[Mapping[str, str]] = None,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> Settings:
+    """Build settings from defaults, a config file, env vars and flags, in that order.
+
+    ``config`` is a TOML file path or the name of a profile in ``config/``
+    (``laptop`` -> ``config/laptop.toml``); it defaults to ``$AIE_CONFIG``.
+    Env vars are ``AIE_<FIELD>`` for run fields (``AIE_MAX_WORKERS``,
+    ``AIE_SCRAPERS=google,cnbc``) and for the default host policy
+    (``AIE_RATE``, ``AIE_TIMEOUT``). ``overrides`` holds flag values keyed by
+    field name; ``None`` values are ignored.
+    """
+    env = os.environ if env is None else env
+    run_values: Dict[str, Any] = {}
+    http_values: Dict[str, Any] = {}
+    hosts: Dict[str, Dict[str, Any]] = {}
+
+    config = config or env.get(f"{ENV_PREFIX}CONFIG")
+    if config:
+        path = resolve_config_path(config)
+        with open(path, "rb") as file:
+            data = tomllib.load(file)
+        logger.info(f"Loaded config from {path}")
+        run_values.update(_checked(data.get("run", {}), RUN_FIELDS, f"{path} [run]"))
+        http_table = dict(data.get("http", {}))
+        for host, host_table in http_table.pop("hosts", {}).items():
+            hosts[host] = _checked(host_table, HOST_FIELDS, f"{path} [http.hosts.{host!r}]")
+        http_values.update(_checked(http_table, HOST_FIELDS, f"{path} [http]"))
+
+    # Pre-existing switch, kept working alongside AIE_TEST_MODE
+    if "TEST_MODE" in env:
+        run_values["test_mode"] = _coerce(RUN_FIELDS["test_mode"], env["TEST_MODE"])
+    for fields, values in ((RUN_FIELDS, run_values), (HOST_FIELDS, http_values)):
+        for name, spec in fields.items():
+            raw = env.get(f"{ENV_PREFIX}{name.upper()}")
+            if raw is not None:
+                values[name] = _coerce(spec, raw)
+
+    for name, value in (overrides or {}).items():
+        if value is None:
+            continue
+        if name in RUN_FIELDS:
+            run_values[name] = _coerce(RUN_FIELDS[name], value)
+        elif name in HOST_FIELDS:
+            http_values[name] = _coerce(HOST_FIELDS[name], value)
+        else:
+            raise ValueError(f"Unknown setting {name!r}")
+
+    return Settings(**run_values, http=HostPolicy(**http_values), hosts=hosts)
+
+
+def resolve_config_path(config: str) -> Path:
+    path = Path(config)
+    if not path.exists() and not path.suffix:
+        path = CONFIG_DIR / f"{config}.toml"
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {config}")
+    return path
+
+
+def _checked(
+    table: Mapping[str, Any], fields: Mapping[str, dataclasses.Field], where: str
+) -> Dict[str, Any]:
+    unknown = set(table) - set(fields)
+    if unknown:
+        raise ValueError(f"Unknown setting(s) {sorted(unknown)} in {where}")
+    return {name: _coerce(fields[name], value) for name, value in table.items()}
+
+
+def _coerce(spec: dataclasses.Field, value: Any) -> Any:
+    """Convert a TOML, env or flag value to the type of field ``spec``."""
+    kind = spec.type if spec.type in (bool, int, float) else None
+    if spec.name == "concurrency":
+        return None if value in (None, "", 0, "0") else int(value)
+    if spec.name == "scrapers":
+        if isinstance(value, str):
+            value = value.split(",")
+        return tuple(name.strip().lower() for name in value if name.strip())
+    if kind is bool:
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+    if kind in (int, float):
+        return kind(value)
+    return value
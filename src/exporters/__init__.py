@@ -0,0 +1,9 @@
+
+
+# Exporters package
+
+from .base import BaseSink  # noqa: F401
+from .columns import EXPORT_COLUMNS, prepare_export  # noqa: F401
+from .csv_sink import StreamingCSVSink  # noqa: F401
+from .excel_writer import StreamingExcelWriter  # noqa: F401
+from .snapshot_diff import SnapshotDiff, diff_snapshots, find_previous_snapshot  # noqa: F401
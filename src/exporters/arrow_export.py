@@ -0,0 +1,127 @@
+import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from src.exporters.columns import prepare_export
+from src.screener.filters import parse_market_cap
+
+
+# Exported columns with few distinct values, dictionary-encoded in Arrow
+DICTIONARY_COLUMNS = (
+    "Industry", "Source", "HQ State", "HQ Country", "Sector", "HQ Geocode Match",
+    "CEO Classification",
+)
+INTEGER_COLUMNS = ("Employee Count", "Founded Year")
+FLOAT_COLUMNS = ("Market Capital", "HQ Latitude", "HQ Longitude", "CEO Classification Score")
+PARTITION_COLUMNS = {"snapshot_date": "Snapshot Date", "sector": "Sector"}
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Parquet/Arrow export requires the 'pyarrow' package "
+            "(uv sync --extra export)"
+        ) from error
+    return pyarrow
+
+
+def to_arrow_table(
+    df: pd.DataFrame, snapshot_date: Optional[datetime.date] = None
+) -> Any:
+    """Build a typed Arrow table from a processed screener frame.
+
+    Market capital is stored as a float, derived counts and years as int64 and
+    low-cardinality text columns as dictionaries; everything else is a string.
+    The screener sector is kept when present, and ``snapshot_date`` adds a
+    date column (used for partitioning).
+    """
+    pa = _require_pyarrow()
+
+    export_df = prepare_export(df)
+    export_df["Market Capital"] = parse_market_cap(export_df["Market Capital"])
+    if "sector" in df.columns:
+        export_df["Sector"] = df["sector"].to_numpy()
+    if snapshot_date is not None:
+        export_df["Snapshot Date"] = snapshot_date
+
+    arrays = []
+    fields = []
+    for column in export_df.columns:
+        values = export_df[column]
+        if column in FLOAT_COLUMNS:
+            array = pa.array(values.to_numpy(), type=pa.float64(), from_pandas=True)
+        elif column in INTEGER_COLUMNS:
+            array = pa.array(values.astype("Int64"), type=pa.int64(), from_pandas=True)
+        elif column == "Snapshot Date":
+            array = pa.array(values.tolist(), type=pa.date32())
+        else:
+            strings = values.astype("string").replace("", pd.NA)
+            array = pa.array(strings, type=pa.string(), from_pandas=True)
+            if column in DICTIONARY_COLUMNS:
+                array = array.dictionary_encode()
+        arrays.append(array)
+        fields.append(pa.field(column, array.type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    path: Path,
+    compression: str = "zstd",
+    partition_by: Optional[str] = None,
+    snapshot_date: Optional[datetime.date] = None,
+) -> Path:
+    """Write a Parquet file, or a hive-partitioned dataset directory.
+
+    ``partition_by`` is ``"snapshot_date"`` or ``"sector"``; with it, ``path``
+    is the dataset root and each run adds files under its partition.
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    snapshot_date = snapshot_date or datetime.date.today()
+    table = to_arrow_table(df, snapshot_date)
+    if partition_by is None:
+        pq.write_table(table, path, compression=compression)
+        return path
+
+    if partition_by not in PARTITION_COLUMNS:
+        raise ValueError(f"Unsupported partitioning: {partition_by!r}")
+    column = PARTITION_COLUMNS[partition_by]
+    if column not in table.column_names:
+        raise ValueError(f"Cannot partition by {partition_by}: no {column!r} column")
+    if column in DICTIONARY_COLUMNS:
+        # Partition values are taken from plain strings
+        index = table.column_names.index(column)
+        table = table.set_column(
+            index, column, table.column(column).cast(_require_pyarrow().string())
+        )
+    pq.write_to_dataset(
+        table,
+        path,
+        partition_cols=[column],
+        compression=compression,
+        basename_template=f"part-{datetime.datetime.now():%Y%m%d_%H%M%S}-{{i}}.parquet",
+    )
+    return path
+
+
+def write_arrow_ipc(
+    df: pd.DataFrame, path: Path, compression: Optional[str] = None
+) -> Path:
+    """Write an Arrow IPC (Feather v2) file.
+
+    Uncompressed files (the default) can be memory-mapped and read zero-copy;
+    ``"lz4"`` or ``"zstd"`` trade that for smaller files.
+    """
+    pa = _require_pyarrow()
+    table = to_arrow_table(df)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    return path
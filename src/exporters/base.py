@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+
+class BaseSink(ABC):
+    """Abstract base class for writers that receive rows during a run.
+
+    ``flush_rows`` and ``flush_seconds`` tell producers how often to hand over
+    finished rows; used as a context manager the sink is finalized on success.
+    """
+
+    def __init__(self, flush_rows: int = 100, flush_seconds: float = 5.0):
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.rows_written = 0
+
+    @abstractmethod
+    def write_frame(self, df: pd.DataFrame):
+        """Append the rows of ``df`` (already in export column order)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> str:
+        """Finalize the output and return its path."""
+        raise NotImplementedError
+
+    def abort(self):
+        """Release resources after a failed run without finalizing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,44 @@
+from typing import List
+
+import pandas as pd
+
+from src.classify.stage import CLASSIFICATION_COLUMNS
+from src.pipeline.geocode import GEOCODE_COLUMNS
+from src.pipeline.normalize import NORMALIZED_COLUMNS
+
+
+# Screener/detail column -> exported column name
+EXPORT_COLUMNS = {
+    "symbol": "Symbol",
+    "name": "Name",
+    "marketCap": "Market Capital",
+    "CEO": "CEO",
+    "Employees": "Employees",
+    "Headquarters": "Headquarters",
+    "Founded": "Founded",
+    "Industry": "Industry",
+    "Source": "Source",
+    "Source Link": "Source Link",
+}
+
+
+def export_header(include_normalized: bool = True, include_geocode: bool = False) -> List[str]:
+    """Exported column names, in file order."""
+    header = list(EXPORT_COLUMNS.values())
+    if include_normalized:
+        header += NORMALIZED_COLUMNS
+    if include_geocode:
+        header += GEOCODE_COLUMNS
+    return header
+
+
+def prepare_export(df: pd.DataFrame) -> pd.DataFrame:
+    """Select and rename export columns, appending derived columns if present."""
+    export_columns = list(EXPORT_COLUMNS) + [
+        col
+        for col in NORMALIZED_COLUMNS + GEOCODE_COLUMNS + CLASSIFICATION_COLUMNS
+        if col in df.columns
+    ]
+    export_df = df[export_columns].copy()
+    export_df.columns = [EXPORT_COLUMNS.get(col, col) for col in export_columns]
+    return export_df
@@ -0,0 +1,109 @@
+import csv
+import gzip
+import io
+import logging
+import os
+import time
+from pathlib import Path
+from typing import IO, List, Optional
+
+import pandas as pd
+
+from src.exporters.base import BaseSink
+
+
+logger = logging.getLogger(__name__)
+
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class StreamingCSVSink(BaseSink):
+    """Append-only CSV writer for results produced during a run.
+
+    Rows are written to ``<path>.partial`` as they arrive, so a run in progress
+    can be followed with ``tail -f`` (or ``zcat``/``zstdcat`` for compressed
+    output). The file is flushed every ``flush_rows`` rows or
+    ``flush_seconds`` seconds and atomically renamed to its final name by
+    ``close()``. If the run fails, the ``.partial`` file is left in place.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: List[str],
+        compression: Optional[str] = None,
+        flush_rows: int = 100,
+        flush_seconds: float = 5.0,
+    ):
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        super().__init__(flush_rows, flush_seconds)
+        suffix = COMPRESSION_SUFFIXES[compression]
+        path = Path(path)
+        self.path = path if str(path).endswith(suffix) else Path(f"{path}{suffix}")
+        self.partial_path = Path(f"{self.path}.partial")
+        self.columns = columns
+        self.compression = compression
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._raw: Optional[IO[bytes]] = None
+        self._file = self._open()
+        csv.writer(self._file).writerow(columns)
+        self.flush()
+
+    def _open(self) -> IO[str]:
+        self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.compression == "gzip":
+            return gzip.open(self.partial_path, "wt", newline="", encoding="utf-8")
+        if self.compression == "zstd":
+            try:
+                import zstandard
+            except ImportError as error:
+                raise ImportError(
+                    "zstd compression requires the 'zstandard' package "
+                    "(uv sync --extra export)"
+                ) from error
+            self._raw = open(self.partial_path, "wb")
+            writer = zstandard.ZstdCompressor().stream_writer(self._raw)
+            return io.TextIOWrapper(writer, encoding="utf-8", newline="")
+        return open(self.partial_path, "w", newline="", encoding="utf-8")
+
+    def write_frame(self, df: pd.DataFrame):
+        if df.empty:
+            return
+        df.to_csv(self._file, header=False, index=False)
+        self.rows_written += len(df)
+        self._unflushed += len(df)
+        if (
+            self._unflushed >= self.flush_rows
+            or time.monotonic() - self._last_flush >= self.flush_seconds
+        ):
+            self.flush()
+
+    def flush(self):
+        """Push buffered rows to disk so readers of the partial file see them."""
+        self._file.flush()
+        if self.compression == "zstd":
+            self._file.buffer.flush()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> str:
+        """Flush, close and atomically move the file to its final name."""
+        self._close_file()
+        os.replace(self.partial_path, self.path)
+        logger.info(f"Streamed {self.rows_written} rows to CSV: {self.path}")
+        return str(self.path)
+
+    def _close_file(self):
+        if self._file.closed:
+            return
+        self._file.flush()
+        self._file.close()
+        if self._raw is not None and not self._raw.closed:
+            self._raw.close()
+
+    def abort(self):
+        self._close_file()
+        logger.warning(f"Run failed; partial results left in {self.partial_path}")
@@ -0,0 +1,83 @@
+import logging
+import os
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from src.exporters.base import BaseSink
+
+
+logger = logging.getLogger(__name__)
+
+
+# Rows per worksheet supported by Excel, including the header row
+EXCEL_MAX_ROWS = 1_048_576
+
+
+class StreamingExcelWriter(BaseSink):
+    """Constant-memory Excel writer built on openpyxl's write-only mode.
+
+    Rows are serialized to the worksheet's temporary XML stream as they are
+    appended instead of being kept as cell objects, so memory stays bounded
+    regardless of the number of rows. When a sheet reaches ``max_rows`` a new
+    sheet (``Sheet1``, ``Sheet2``, ...) with the same header is started. The
+    workbook is saved to a temporary name and renamed by ``close()``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: List[str],
+        sheet_prefix: str = "Sheet",
+        max_rows: int = EXCEL_MAX_ROWS,
+        flush_rows: int = 1000,
+        flush_seconds: float = 30.0,
+    ):
+        super().__init__(flush_rows, flush_seconds)
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(f".{self.path.name}.partial")
+        self.columns = columns
+        self.sheet_prefix = sheet_prefix
+        self.max_rows = max_rows
+        self.sheet_count = 0
+        # Imported here so that loading src.exporters does not pay for openpyxl
+        from openpyxl import Workbook
+
+        self._workbook = Workbook(write_only=True)
+        self._sheet = None
+        self._sheet_rows = 0
+        self._new_sheet()
+
+    def _new_sheet(self):
+        self.sheet_count += 1
+        self._sheet = self._workbook.create_sheet(
+            title=f"{self.sheet_prefix}{self.sheet_count}"
+        )
+        self._sheet.append(self.columns)
+        self._sheet_rows = 1
+
+    def write_frame(self, df: pd.DataFrame):
+        if df.empty:
+            return
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if self._sheet_rows >= self.max_rows:
+                self._new_sheet()
+            self._sheet.append(row)
+            self._sheet_rows += 1
+        self.rows_written += len(df)
+
+    def close(self) -> str:
+        """Save the workbook and move it to its final name."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(self.partial_path)
+        os.replace(self.partial_path, self.path)
+        logger.info(
+            f"Wrote {self.rows_written} rows to Excel across "
+            f"{self.sheet_count} sheet(s): {self.path}"
+        )
+        return str(self.path)
+
+    def abort(self):
+        self._workbook.close()
@@ -0,0 +1,149 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.exporters.columns import EXPORT_COLUMNS
+
+
+# Exported columns compared between snapshots
+DIFF_FIELDS = ["CEO", "Headquarters", "Industry", "Employees"]
+DELTA_COLUMNS = ["Symbol", "Name", "Change", "Field", "Old Value", "New Value"]
+CHANGE_ORDER = {"added": 0, "removed": 1, "changed": 2}
+
+# Full snapshots written by DataExporter (not deltas or partitioned datasets)
+SNAPSHOT_PATTERN = re.compile(
+    r"^nasdaq_screener_\d{8}_\d{6}\.(csv|csv\.gz|csv\.zst|xlsx|parquet|arrow)$"
+)
+
+
+@dataclass
+class SnapshotDiff:
+    """Rows that differ between two snapshots, in long form, plus counts."""
+
+    delta: pd.DataFrame
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+
+def find_previous_snapshot(
+    output_dir: str | Path, exclude: Optional[str | Path] = None
+) -> Optional[Path]:
+    """Newest full snapshot in ``output_dir`` other than ``exclude``."""
+    exclude_name = Path(exclude).name if exclude else None
+    names = sorted(
+        path.name
+        for path in Path(output_dir).iterdir()
+        if SNAPSHOT_PATTERN.match(path.name) and path.name != exclude_name
+    )
+    return Path(output_dir) / names[-1] if names else None
+
+
+def load_snapshot(path: str | Path) -> pd.DataFrame:
+    """Read the compared columns of an exported snapshot."""
+    path = Path(path)
+    columns = ["Symbol", "Name"] + DIFF_FIELDS
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    if path.suffix == ".arrow":
+        return pd.read_feather(path, columns=columns)
+    if path.suffix == ".xlsx":
+        # Streamed workbooks continue on further sheets past Excel's row limit
+        sheets = pd.read_excel(path, sheet_name=None, usecols=columns, dtype=str)
+        return pd.concat(sheets.values(), ignore_index=True).fillna("")
+    return pd.read_csv(path, usecols=columns, dtype=str, keep_default_na=False)
+
+
+def diff_snapshots(previous: pd.DataFrame, current: pd.DataFrame) -> SnapshotDiff:
+    """Compare two snapshots on Symbol with one outer join.
+
+    Frames may use screener or exported column names. Each changed field of
+    a symbol present in both becomes a ``changed`` row with old and new
+    values; added and removed symbols get a row per non-empty field (or one
+    bare row), so the delta alone is enough to apply the change downstream.
+    """
+    merged = _comparable(previous).merge(
+        _comparable(current),
+        on="Symbol",
+        how="outer",
+        suffixes=(" old", " new"),
+        indicator=True,
+    )
+    side = merged.pop("_merge")
+    change = pd.Series(
+        np.select(
+            [side.eq("right_only"), side.eq("left_only")], ["added", "removed"], "changed"
+        ),
+        index=merged.index,
+    )
+    name = merged["Name new"].where(side.ne("left_only"), merged["Name old"])
+
+    parts = []
+    for column in DIFF_FIELDS:
+        old = merged[f"{column} old"].fillna("")
+        new = merged[f"{column} new"].fillna("")
+        differs = old.ne(new)
+        parts.append(
+            pd.DataFrame(
+                {
+                    "Symbol": merged["Symbol"][differs],
+                    "Name": name[differs],
+                    "Change": change[differs],
+                    "Field": column,
+                    "Old Value": old[differs],
+                    "New Value": new[differs],
+                }
+            )
+        )
+    delta = pd.concat(parts, ignore_index=True)
+
+    # Added/removed symbols without any tracked value still need a row
+    bare = change.ne("changed") & ~merged["Symbol"].isin(delta["Symbol"])
+    delta = pd.concat(
+        [
+            delta,
+            pd.DataFrame(
+                {
+                    "Symbol": merged["Symbol"][bare],
+                    "Name": name[bare],
+                    "Change": change[bare],
+                    "Field": "",
+                    "Old Value": "",
+                    "New Value": "",
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+    delta["Name"] = delta["Name"].fillna("")
+    field_order = {column: index for index, column in enumerate([""] + DIFF_FIELDS)}
+    delta = delta.assign(
+        _change=delta["Change"].map(CHANGE_ORDER), _field=delta["Field"].map(field_order)
+    )
+    delta = delta.sort_values(["_change", "Symbol", "_field"], ignore_index=True)[
+        DELTA_COLUMNS
+    ]
+
+    changed = delta[delta["Change"].eq("changed")]
+    summary = {
+        "previous_rows": int(len(previous)),
+        "current_rows": int(len(current)),
+        "added": int(change.eq("added").sum()),
+        "removed": int(change.eq("removed").sum()),
+        "changed_symbols": int(changed["Symbol"].nunique()),
+        "changes_by_field": {
+            column: int(changed["Field"].eq(column).sum()) for column in DIFF_FIELDS
+        },
+    }
+    return SnapshotDiff(delta=delta, summary=summary)
+
+
+def _comparable(df: pd.DataFrame) -> pd.DataFrame:
+    """Symbol, Name and compared fields as stripped strings, one row per symbol."""
+    frame = df.rename(columns=EXPORT_COLUMNS)
+    frame = frame[["Symbol", "Name"] + DIFF_FIELDS].astype("string").fillna("")
+    frame = frame.apply(lambda column: column.str.strip())
+    return frame[frame["Symbol"].ne("")].drop_duplicates("Symbol", keep="last")
+
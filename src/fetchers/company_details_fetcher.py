@@ -1,17 +1,20 @@
 import logging
 import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, Sequence
 
+from src.config.settings import Settings
+from src.fetchers.deadline_planner import DeadlinePlanner, HostThroughput
 from src.http.http_client import HTTPClient
-from src.models.company_details import CompanyDetails
+from src.models.company_details import DETAIL_FIELDS, CompanyDetails
+from src.observability.metrics import SCRAPES_SKIPPED
+from src.observability.tracing import span
+from src.reference.index import ReferenceIndex
+from src.scrapers import SCRAPERS
 from src.scrapers.base import BaseScraper
-from src.scrapers.cnbc import CNBCScraper
-from src.scrapers.cnn_money import CNNScraper
-from src.scrapers.google_finance import GoogleFinanceScraper
-from src.scrapers.marketwatch import MarketWatchScraper
-from src.scrapers.yahoo_finance import YahooFinanceScraper
+from src.scrapers.negative_cache import NegativeCache
 
 
 logger = logging.getLogger(__name__)
@@ -20,22 +23,56 @@ logger = logging.getLogger(__name__)
 class CompanyDetailsFetcher:
     """Main class for fetching company details from multiple sources."""
 
-    def __init__(self, max_workers: int | None = None):
-        self.http_client = HTTPClient()
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        settings: Settings | None = None,
+        reference: ReferenceIndex | None = None,
+    ):
+        self.settings = settings or Settings()
+        if reference is None and self.settings.reference:
+            reference = ReferenceIndex(self.settings.reference)
+        self.reference = reference
+        self.http_client = HTTPClient(self.settings)
+        unknown = [name for name in self.settings.scrapers if name not in SCRAPERS]
+        if unknown:
+            raise ValueError(
+                f"Unknown scraper(s) {unknown}; choose from {sorted(SCRAPERS)}"
+            )
+        self.negative_cache = (
+            NegativeCache(self.settings.negative_cache, self.settings.negative_cache_days)
+            if self.settings.negative_cache
+            else None
+        )
         self.scrapers: list[BaseScraper] = [
-            GoogleFinanceScraper(self.http_client),
-            CNBCScraper(self.http_client),
-            MarketWatchScraper(self.http_client),
-            YahooFinanceScraper(self.http_client),
-            # CNNScraper(self.http_client),  # optional
+            SCRAPERS[name](self.http_client, negative_cache=self.negative_cache)
+            for name in self.settings.scrapers
         ]
         self.max_workers = max_workers or min(4, (os.cpu_count() or 1))
         self.rate_limit_count = 0
         self.last_rate_limit_time = 0
+        self.host_throughput = HostThroughput()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
-    def fetch_company_details(self, ticker: str) -> CompanyDetails:
-        company_details = CompanyDetails()
+    def fetch_company_details(
+        self, ticker: str, scrapers: Sequence[BaseScraper] | None = None
+    ) -> CompanyDetails:
+        symbol = ticker
         ticker = self._clean_ticker(ticker)
+        with span("ticker", ticker=ticker) as ticker_span:
+            company_details = self._fetch_company_details(ticker, scrapers, symbol)
+            ticker_span.set_attribute("fields.filled", self._filled_fields(company_details))
+            ticker_span.set_attribute("sources", ",".join(sorted(company_details.sources)))
+            return company_details
+
+    def _fetch_company_details(
+        self, ticker: str, scrapers: Sequence[BaseScraper] | None, symbol: str
+    ) -> CompanyDetails:
+        company_details = CompanyDetails(ticker=ticker)
+        if self.reference is not None and self.reference.prefill(company_details, symbol):
+            if company_details.is_complete():
+                return company_details
 
         logger.info(f"Fetching details for ticker: {ticker}")
 
@@ -44,9 +81,22 @@ class CompanyDetailsFetcher:
             logger.warning("Rate limit cooldown active, skipping request")
             return company_details
 
-        for scraper in self.scrapers:
+        for scraper in self.scrapers if scrapers is None else scrapers:
+            if scraper.fields and all(
+                getattr(company_details, field) is not None for field in scraper.fields
+            ):
+                SCRAPES_SKIPPED.inc(source=scraper.__class__.__name__, reason="prefilled")
+                continue
             try:
-                company_details = scraper.scrape(ticker, company_details)
+                filled_before = self._filled_fields(company_details)
+                scrape_start = time.time()
+                with span("scrape", source=scraper.__class__.__name__) as scrape_span:
+                    company_details = scraper.scrape(ticker, company_details)
+                    filled = self._filled_fields(company_details) - filled_before
+                    scrape_span.set_attribute("fields.filled", filled)
+                self.host_throughput.record(
+                    scraper.host, time.time() - scrape_start, filled
+                )
                 if company_details.is_complete():
                     logger.info(
                         f"Complete data found for {ticker} from {scraper.__class__.__name__}"
@@ -63,22 +113,93 @@ class CompanyDetailsFetcher:
 
         return company_details
 
-    def fetch_multiple_companies(self, tickers: list[str]) -> Dict[str, CompanyDetails]:
-        results: Dict[str, CompanyDetails] = {}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_ticker = {
-                executor.submit(self.fetch_company_details, ticker): ticker
-                for ticker in tickers
-            }
-            for future in as_completed(future_to_ticker):
-                ticker = future_to_ticker[future]
+    def fetch_multiple_companies(
+        self, tickers: list[str], planner: DeadlinePlanner | None = None
+    ) -> Dict[str, CompanyDetails]:
+        """Fetch several tickers concurrently and return them keyed by ticker."""
+        return {
+            tickers[position]: details
+            for position, details in self.iter_companies(tickers, planner=planner)
+        }
+
+    def iter_companies(
+        self,
+        tickers: Sequence[str],
+        window: int | None = None,
+        planner: DeadlinePlanner | None = None,
+    ) -> Iterator[tuple[int, CompanyDetails]]:
+        """Yield ``(position, details)`` for each ticker as soon as it completes.
+
+        Tickers are fed to a long-lived executor through a sliding window of at
+        most ``window`` in-flight requests, so a new ticker starts whenever a
+        slot frees up instead of waiting for a whole batch. Pacing comes from
+        the per-host rate limiter in ``HTTPClient``. With a ``planner`` each
+        ticker only runs the scrapers that still fit the time budget, and no
+        new tickers are started once it has expired; ``tickers`` are added to
+        the planner's backlog.
+        """
+        window = max(1, window or self.max_workers * 2)
+        executor = self._get_executor()
+        total = len(tickers)
+        if planner is not None:
+            planner.add_backlog(total)
+
+        def fetch(ticker: str) -> CompanyDetails:
+            if planner is None:
+                return self.fetch_company_details(ticker)
+            scrapers = planner.select_scrapers(self.scrapers, planner.start_ticker())
+            if not scrapers:
+                return CompanyDetails(ticker=self._clean_ticker(ticker))
+            return self.fetch_company_details(ticker, scrapers)
+
+        in_flight: Dict[Future, int] = {}
+        next_position = 0
+        while in_flight or next_position < total:
+            while next_position < total and len(in_flight) < window:
+                if planner is not None and planner.expired():
+                    logger.warning(
+                        f"Deadline reached; not starting the remaining "
+                        f"{total - next_position} of {total} tickers"
+                    )
+                    planner.add_backlog(next_position - total)
+                    next_position = total
+                    break
+                future = executor.submit(fetch, tickers[next_position])
+                in_flight[future] = next_position
+                next_position += 1
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                position = in_flight.pop(future)
                 try:
-                    results[ticker] = future.result()
-                    time.sleep(0.5)
+                    details = future.result()
                 except Exception as error:
-                    logger.error(f"Error processing {ticker}: {error}")
-                    results[ticker] = CompanyDetails()
-        return results
+                    logger.error(f"Error processing {tickers[position]}: {error}")
+                    details = CompanyDetails(ticker=tickers[position])
+                yield position, details
+
+    def close(self):
+        """Shut down the worker pool; a new one is created on next use."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="fetcher"
+                )
+            return self._executor
+
+    @staticmethod
+    def _filled_fields(company_details: CompanyDetails) -> int:
+        return sum(
+            getattr(company_details, field) is not None for field in DETAIL_FIELDS
+        )
 
     def _clean_ticker(self, ticker: str) -> str:
         ticker = ticker.replace("^", "").replace("/", "")
@@ -0,0 +1,173 @@
+import datetime
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+from src.scrapers.base import BaseScraper
+
+
+logger = logging.getLogger(__name__)
+
+
+# Assumed cost of a scrape against a host we have not measured yet (seconds)
+DEFAULT_SCRAPE_SECONDS = 3.0
+# Weight of the newest observation in the moving averages
+EWMA_ALPHA = 0.2
+
+
+@dataclass
+class HostEstimate:
+    """Moving averages of scrape cost and yield for a single host."""
+
+    seconds: float = DEFAULT_SCRAPE_SECONDS
+    fields: float = 1.0
+    samples: int = 0
+
+
+class HostThroughput:
+    """Thread-safe per-host measurements of scrape duration and yield."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, HostEstimate] = {}
+
+    def record(self, host: str, seconds: float, fields_filled: int):
+        """Fold one finished scrape into the host's moving averages."""
+        with self._lock:
+            estimate = self._hosts.get(host)
+            if estimate is None or estimate.samples == 0:
+                self._hosts[host] = HostEstimate(seconds, float(fields_filled), 1)
+                return
+            estimate.seconds += EWMA_ALPHA * (seconds - estimate.seconds)
+            estimate.fields += EWMA_ALPHA * (fields_filled - estimate.fields)
+            estimate.samples += 1
+
+    def estimate(self, host: str) -> HostEstimate:
+        """Return the current estimate for a host (a prior if never measured)."""
+        with self._lock:
+            estimate = self._hosts.get(host)
+            if estimate is None:
+                return HostEstimate()
+            return HostEstimate(estimate.seconds, estimate.fields, estimate.samples)
+
+
+class DeadlinePlanner:
+    """Plans which (ticker, source) requests fit into a wall-clock budget.
+
+    The planner compares the time left before the deadline (minus a reserve
+    kept for exporting) against the measured per-host cost of each scraper and
+    the number of tickers still waiting. Sources with the best yield per second
+    are kept first; once nothing fits, no new work is scheduled.
+
+    The waiting tickers are a ``backlog`` shared by everything run against the
+    planner, so a chunked run can count the chunks it has not read yet.
+    """
+
+    def __init__(
+        self,
+        deadline: datetime.datetime,
+        concurrency: int,
+        throughput: HostThroughput,
+        reserve_seconds: float = 30.0,
+    ):
+        self.deadline = deadline.timestamp()
+        self.concurrency = max(1, concurrency)
+        self.throughput = throughput
+        self.reserve_seconds = reserve_seconds
+        self.skipped_requests = 0
+        self.backlog = 0
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, excluding the export reserve."""
+        return self.deadline - time.time() - self.reserve_seconds
+
+    def expired(self) -> bool:
+        """True once no new work should be started."""
+        return self.remaining() <= 0
+
+    def add_backlog(self, tickers: int):
+        """Add tickers that will be started later (negative to retract an estimate)."""
+        with self._lock:
+            self.backlog = max(0, self.backlog + tickers)
+
+    def start_ticker(self) -> int:
+        """Take one ticker off the backlog; return how many were waiting, itself included."""
+        with self._lock:
+            waiting = max(1, self.backlog)
+            self.backlog = max(0, self.backlog - 1)
+            return waiting
+
+    def select_scrapers(
+        self, scrapers: Sequence[BaseScraper], pending_tickers: int
+    ) -> list[BaseScraper]:
+        """Pick the scrapers to run for one ticker given the work still queued.
+
+        The chosen scrapers keep their original priority order so that the
+        fill-first behaviour of the fetcher is unchanged.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            with self._lock:
+                self.skipped_requests += len(scrapers)
+            return []
+
+        budget = remaining * self.concurrency / max(1, pending_tickers)
+        estimates = {id(s): self.throughput.estimate(s.host) for s in scrapers}
+        ranked = sorted(
+            scrapers,
+            key=lambda s: estimates[id(s)].fields / max(estimates[id(s)].seconds, 1e-3),
+            reverse=True,
+        )
+
+        chosen = set()
+        spent = 0.0
+        for scraper in ranked:
+            cost = estimates[id(scraper)].seconds
+            if spent + cost > budget:
+                continue
+            chosen.add(id(scraper))
+            spent += cost
+
+        # Always try the single most valuable source while there is time left
+        # for it on its own, even if the average budget is tighter.
+        if not chosen and ranked and estimates[id(ranked[0])].seconds <= remaining:
+            chosen.add(id(ranked[0]))
+
+        with self._lock:
+            self.skipped_requests += len(scrapers) - len(chosen)
+        return [s for s in scrapers if id(s) in chosen]
+
+
+def parse_deadline(value: str, now: datetime.datetime | None = None) -> datetime.datetime:
+    """Parse a CLI deadline into an absolute local datetime.
+
+    Accepts a duration (``"5400"``, ``"90m"``, ``"2h"``), a clock time for the
+    next occurrence (``"05:30"``) or an ISO-8601 timestamp.
+    """
+    now = now or datetime.datetime.now()
+    text = value.strip().lower()
+
+    units = {"s": 1, "m": 60, "h": 3600}
+    number, unit = (text[:-1], text[-1]) if text[-1:] in units else (text, "s")
+    try:
+        return now + datetime.timedelta(seconds=float(number) * units[unit])
+    except ValueError:
+        pass
+
+    try:
+        clock = datetime.time.fromisoformat(text)
+    except ValueError:
+        clock = None
+    if clock is not None:
+        candidate = datetime.datetime.combine(now.date(), clock)
+        if candidate <= now:
+            candidate += datetime.timedelta(days=1)
+        return candidate
+
+    try:
+        return datetime.datetime.fromisoformat(value.strip())
+    except ValueError as error:
+        raise ValueError(f"Unrecognised deadline: {value!r}") from error
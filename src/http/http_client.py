@@ -1,10 +1,31 @@
+import contextlib
 import logging
 import random
+import threading
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, ContextManager, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlparse
 
-import requests
-from faker import Faker
+from src.config.settings import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RATE_LIMIT_DELAY,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_RETRY_DELAY,
+    Settings,
+)
+from src.http.rate_limiter import HostRateLimiter
+from src.observability.metrics import (
+    HTTP_BACKOFF,
+    HTTP_BYTES,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    HTTP_RETRIES,
+    RATE_LIMIT_WAIT,
+)
+from src.observability.tracing import span
+
+if TYPE_CHECKING:
+    import requests
 
 
 logger = logging.getLogger(__name__)
@@ -20,27 +41,62 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
 ]
 
-REQUEST_TIMEOUT = 30
-MAX_RETRIES = 2
-RETRY_DELAY = 1.0
-RATE_LIMIT_DELAY = 1.0
+# Defaults only; per-host values come from ``Settings`` (see src.config)
+REQUEST_TIMEOUT = DEFAULT_REQUEST_TIMEOUT
+MAX_RETRIES = DEFAULT_MAX_RETRIES
+RETRY_DELAY = DEFAULT_RETRY_DELAY
+RATE_LIMIT_DELAY = DEFAULT_RATE_LIMIT_DELAY
 
 
 class HTTPClient:
-    """Handles HTTP requests with proper error handling and retry logic."""
+    """Handles HTTP requests with proper error handling and retry logic.
+
+    Pacing, concurrency, timeouts and retries follow the per-host policies
+    in ``settings``.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.fake = None
+        self._headers: Optional[Dict[str, str]] = None
+        # requests is imported on first use so that importing the scraping
+        # modules stays cheap
+        import requests
 
-    def __init__(self):
-        self.fake = Faker()
         self.session = requests.Session()
-        self.last_request_time = 0
-        self._update_headers()
+        self.settings = settings or Settings()
+        default = self.settings.http
+        self.rate_limiter = HostRateLimiter(default.min_interval, default.burst)
+        for host in self.settings.hosts:
+            policy = self.settings.policy(host)
+            self.rate_limiter.set_limit(host, policy.min_interval, policy.burst)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def last_status(self) -> Optional[int]:
+        """HTTP status of the calling thread's last request (None if it never got one)."""
+        return getattr(self._local, "status", None)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Current request headers, built on first use."""
+        if self._headers is None:
+            self._update_headers()
+        return self._headers
 
     def _update_headers(self):
         """Update request headers with random user agent and more realistic headers."""
+        if self.fake is None:
+            # Faker takes longer to import and set up than the rest of the
+            # client; defer it until headers are first needed
+            from faker import Faker
+
+            self.fake = Faker()
         self.fake.seed_instance(random.randint(0, 1000))
         ip = self.fake.ipv4()
 
-        self.headers = {
+        self._headers = {
             "User-Agent": random.choice(USER_AGENTS),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
@@ -58,18 +114,61 @@ class HTTPClient:
             "X-Requested-With": "XMLHttpRequest",
         }
 
-    def _rate_limit_delay(self):
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < RATE_LIMIT_DELAY:
-            time.sleep(RATE_LIMIT_DELAY - time_since_last_request)
-        self.last_request_time = time.time()
+    def _rate_limit_delay(self, url: str):
+        """Pace requests per host so concurrent workers share each site's budget."""
+        host = urlparse(url).hostname or ""
+        with span("rate_limit.wait", **{"server.address": host}) as wait_span:
+            waited = self.rate_limiter.acquire(host)
+            wait_span.set_attribute("wait.seconds", waited)
+        if waited > 0:
+            RATE_LIMIT_WAIT.inc(waited, host=host)
+
+    def _host_slot(self, host: str) -> ContextManager:
+        """Semaphore capping concurrent requests to ``host``, if its policy sets one."""
+        concurrency = self.settings.policy(host).concurrency
+        if not concurrency:
+            return contextlib.nullcontext()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(concurrency)
+        return slot
+
+    def _backoff(self, host: str, reason: str, seconds: float):
+        """Sleep before a retry, recording why."""
+        HTTP_RETRIES.inc(host=host, reason=reason)
+        attributes = {"server.address": host, "retry.reason": reason}
+        with span("http.backoff", **attributes) as backoff_span:
+            backoff_span.set_attribute("backoff.seconds", seconds)
+            time.sleep(seconds)
+        HTTP_BACKOFF.inc(seconds, host=host)
 
-    def get(self, url: str, **kwargs) -> Optional[requests.Response]:
+    def _target(self, url: str, host: str) -> Tuple[str, Dict[str, str]]:
+        """URL to request and extra headers, honouring ``Settings.host_override``."""
+        if not self.settings.host_override:
+            return url, {}
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        return self.settings.host_override.rstrip("/") + path, {"Host": host}
+
+    def get(self, url: str, **kwargs) -> Optional["requests.Response"]:
         """Make HTTP GET request with improved retry logic and rate limiting."""
-        self._rate_limit_delay()
+        host = urlparse(url).hostname or ""
+        with span("http.get", **{"url.full": url, "server.address": host}) as get_span:
+            response = self._get(url, host, **kwargs)
+            get_span.set_attribute("http.succeeded", response is not None)
+            return response
+
+    def _get(self, url: str, host: str, **kwargs) -> Optional["requests.Response"]:
+        import requests
 
-        for attempt in range(MAX_RETRIES):
+        self._rate_limit_delay(url)
+        policy = self.settings.policy(host)
+        max_retries = max(1, policy.max_retries)
+        status = self._local.status = None
+        request_url, extra_headers = self._target(url, host)
+
+        for attempt in range(max_retries):
             try:
                 self._update_headers()
 
@@ -83,31 +182,47 @@ class HTTPClient:
                 elif "marketwatch.com" in url:
                     kwargs["cookies"] = {"wsod_region": "us", "wsod_language": "en"}
 
-                response = self.session.get(
-                    url, headers=self.headers, timeout=REQUEST_TIMEOUT, **kwargs
-                )
+                attributes = {"server.address": host, "http.attempt": attempt + 1}
+                with span("http.attempt", **attributes) as attempt_span:
+                    with self._host_slot(host):
+                        request_start = time.perf_counter()
+                        response = self.session.get(
+                            request_url,
+                            headers={**self.headers, **extra_headers},
+                            timeout=policy.timeout,
+                            **kwargs,
+                        )
+                    HTTP_LATENCY.observe(time.perf_counter() - request_start, host=host)
 
-                status = response.status_code
+                    status = self._local.status = response.status_code
+                    size = len(response.content)
+                    attempt_span.set_attribute("http.response.status_code", status)
+                    attempt_span.set_attribute("http.response.body.size", size)
+                HTTP_REQUESTS.inc(host=host, status=str(status))
+                HTTP_BYTES.inc(size, host=host)
                 if status < 300:
                     return response
 
                 if status == 429:
                     logger.warning(
-                        f"Rate limited (429) for {url}, attempt {attempt + 1}/{MAX_RETRIES}"
+                        f"Rate limited (429) for {url}, attempt {attempt + 1}/{max_retries}"
                     )
-                    if attempt < MAX_RETRIES - 1:
-                        backoff = (2 ** attempt) * RATE_LIMIT_DELAY * 2
-                        time.sleep(backoff)
+                    if attempt < max_retries - 1:
+                        self._backoff(
+                            host,
+                            "429",
+                            (2 ** attempt) * max(policy.min_interval, policy.retry_delay) * 2,
+                        )
                         continue
                     return None
 
                 if status == 403:
                     logger.warning(
-                        f"Forbidden (403) for {url}, attempt {attempt + 1}/{MAX_RETRIES}"
+                        f"Forbidden (403) for {url}, attempt {attempt + 1}/{max_retries}"
                     )
-                    if attempt < MAX_RETRIES - 1:
+                    if attempt < max_retries - 1:
                         self._update_headers()
-                        time.sleep(RETRY_DELAY)
+                        self._backoff(host, "403", policy.retry_delay)
                         continue
                     return None
 
@@ -117,11 +232,11 @@ class HTTPClient:
 
                 if status >= 500:
                     logger.warning(
-                        f"Server error {status} for {url}, attempt {attempt + 1}/{MAX_RETRIES}"
+                        f"Server error {status} for {url}, attempt {attempt + 1}/{max_retries}"
                     )
-                    
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep((2 ** attempt) * RETRY_DELAY)
+
+                    if attempt < max_retries - 1:
+                        self._backoff(host, "5xx", (2 ** attempt) * policy.retry_delay)
                         continue
                     return None
 
@@ -130,18 +245,17 @@ class HTTPClient:
                 requests.exceptions.Timeout,
                 requests.exceptions.RequestException,
             ) as error:
+                HTTP_REQUESTS.inc(host=host, status="error")
                 logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {error}"
+                    f"Request failed (attempt {attempt + 1}/{max_retries}): {error}"
                 )
                 logger.error(
                         f"Error Occurred {status} for {url}",
                         exc_info=True
                 )
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep((2 ** attempt) * RETRY_DELAY)
+                if attempt < max_retries - 1:
+                    self._backoff(host, "error", (2 ** attempt) * policy.retry_delay)
                 else:
                     return None
 
         return None
-
-
@@ -0,0 +1,41 @@
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class HostRateLimiter:
+    """Thread-safe pacing of requests per host.
+
+    Each call reserves the next free send slot for its host under a lock and
+    then sleeps outside the lock until that slot, so concurrent workers are
+    spaced ``min_interval`` apart per host while different hosts proceed in
+    parallel. ``burst`` lets that many requests through back to back after an
+    idle period (a generic cell rate algorithm, i.e. a token bucket without
+    the bookkeeping). Hosts can get their own limits with ``set_limit()``.
+    """
+
+    def __init__(self, min_interval: float, burst: int = 1):
+        self.min_interval = min_interval
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+        self._limits: Dict[str, Tuple[float, int]] = {}
+
+    def set_limit(self, host: str, min_interval: float, burst: int = 1):
+        """Use ``min_interval``/``burst`` for ``host`` instead of the defaults."""
+        with self._lock:
+            self._limits[host] = (min_interval, max(1, burst))
+
+    def acquire(self, host: str) -> float:
+        """Block until a request to ``host`` may be sent; return seconds waited."""
+        with self._lock:
+            interval, burst = self._limits.get(host, (self.min_interval, self.burst))
+            now = time.monotonic()
+            # Theoretical arrival time of the next request at the sustained rate
+            expected = max(now, self._next_slot.get(host, now))
+            slot = max(now, expected - (burst - 1) * interval)
+            self._next_slot[host] = expected + interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
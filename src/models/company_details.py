@@ -1,18 +1,53 @@
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Set
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional
 
+from src.models.source_registry import SOURCES
 
-@dataclass
+
+# Scraped detail fields, in export order
+DETAIL_FIELDS = ("ceo", "employees", "headquarters", "founded", "industry")
+
+
+@dataclass(slots=True)
 class CompanyDetails:
-    """Data class to store company information."""
+    """Data class to store company information.
+
+    Sources are kept as a bitmask over the registered sources (see
+    ``src.models.source_registry``); ``sources`` and ``urls`` are derived from
+    it, with URLs rebuilt from the source templates and ``ticker``. Both are
+    frozensets: record a source with ``add_source``, or assign names to
+    ``sources`` (such sources have no URL).
+    """
 
     ceo: Optional[str] = None
     employees: Optional[str] = None
     headquarters: Optional[str] = None
     founded: Optional[str] = None
     industry: Optional[str] = None
-    sources: Set[str] = field(default_factory=set)
-    urls: Set[str] = field(default_factory=set)
+    ticker: str = ""
+    source_mask: int = 0
+
+    def add_source(self, bit: int):
+        """Mark the registered source ``bit`` as having contributed data."""
+        self.source_mask |= 1 << bit
+
+    @property
+    def sources(self) -> FrozenSet[str]:
+        return frozenset(SOURCES.name(bit) for bit in SOURCES.bits(self.source_mask))
+
+    @sources.setter
+    def sources(self, names: Iterable[str]):
+        self.source_mask = 0
+        for name in names:
+            self.add_source(SOURCES.register(name))
+
+    @property
+    def urls(self) -> FrozenSet[str]:
+        return frozenset(self._urls())
+
+    def _urls(self) -> list[str]:
+        urls = (SOURCES.url(bit, self.ticker) for bit in SOURCES.bits(self.source_mask))
+        return [url for url in urls if url]
 
     def is_complete(self) -> bool:
         """Check if all required fields are populated."""
@@ -28,14 +63,15 @@ class CompanyDetails:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for DataFrame storage."""
+        names = dict.fromkeys(
+            SOURCES.name(bit) for bit in SOURCES.bits(self.source_mask)
+        )
         return {
             "ceo": self.ceo or "",
             "employees": self.employees or "",
             "headquarters": self.headquarters or "",
             "founded": self.founded or "",
             "industry": self.industry or "",
-            "sources": ",".join(self.sources) if self.sources else "",
-            "urls": ",".join(self.urls) if self.urls else "",
+            "sources": ",".join(names),
+            "urls": ",".join(self._urls()),
         }
-
-
@@ -0,0 +1,52 @@
+import sys
+import threading
+from typing import Iterator, Optional
+
+
+class SourceRegistry:
+    """Interned registry of data sources and their URL templates.
+
+    Every (source name, URL template) pair gets a bit index so that
+    ``CompanyDetails`` can record where its data came from in a single integer
+    instead of per-instance sets of repeated strings. URLs are rebuilt from the
+    templates on demand.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names: list[str] = []
+        self._templates: list[Optional[str]] = []
+        self._index: dict[tuple[str, Optional[str]], int] = {}
+
+    def register(self, name: str, url_template: Optional[str] = None) -> int:
+        """Register a source and return its bit index (idempotent)."""
+        key = (name, url_template)
+        with self._lock:
+            bit = self._index.get(key)
+            if bit is None:
+                bit = len(self._names)
+                self._names.append(sys.intern(name))
+                self._templates.append(url_template)
+                self._index[key] = bit
+            return bit
+
+    def name(self, bit: int) -> str:
+        return self._names[bit]
+
+    def url(self, bit: int, ticker: str) -> Optional[str]:
+        template = self._templates[bit]
+        if template is None:
+            return None
+        return template.format(ticker=ticker)
+
+    def bits(self, mask: int) -> Iterator[int]:
+        """Yield the bit indexes set in ``mask`` in registration order."""
+        bit = 0
+        while mask:
+            if mask & 1:
+                yield bit
+            mask >>= 1
+            bit += 1
+
+
+SOURCES = SourceRegistry()
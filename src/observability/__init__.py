@@ -0,0 +1,7 @@
+
+
+# Observability package
+
+from .metrics import REGISTRY, Counter, Histogram, MetricsRegistry  # noqa: F401
+from .metrics_server import start_metrics_server  # noqa: F401
+from .tracing import configure_tracing, shutdown_tracing, span  # noqa: F401
@@ -0,0 +1,171 @@
+import datetime
+import json
+import logging
+import math
+import platform
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from src.observability.metrics import (
+    FIELDS_FILLED,
+    HTTP_BACKOFF,
+    HTTP_BYTES,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    HTTP_RETRIES,
+    PARSE_LATENCY,
+    RATE_LIMIT_WAIT,
+    TICKERS_PROCESSED,
+    Histogram,
+)
+from src.observability.profiling import STAGES
+
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_VERSION = 1
+QUANTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+# Export column -> field name used by the scrapers and metrics
+HIT_RATE_COLUMNS = {
+    "CEO": "ceo",
+    "Employees": "employees",
+    "Headquarters": "headquarters",
+    "Founded": "founded",
+    "Industry": "industry",
+}
+
+
+def fill_counts(df: pd.DataFrame) -> Dict[str, int]:
+    """Row count and non-empty values per detail field of a result frame."""
+    counts = {"rows": len(df)}
+    for column, field in HIT_RATE_COLUMNS.items():
+        if column in df.columns:
+            counts[field] = int(df[column].astype("string").fillna("").ne("").sum())
+        else:
+            counts[field] = 0
+    return counts
+
+
+def build_run_manifest(
+    df: Optional[pd.DataFrame],
+    config: Dict[str, Any],
+    started_at: datetime.datetime,
+    finished_at: datetime.datetime,
+    output_file: Optional[str] = None,
+    counts: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """Summarize a finished run from the result frame and the metrics registry.
+
+    Chunked runs keep no result frame; they pass ``counts`` (see
+    ``fill_counts``) instead of ``df``. Metrics are process-wide, so the
+    manifest describes everything the process has done so far; ``main()``
+    runs one pipeline per process.
+    """
+    duration = (finished_at - started_at).total_seconds()
+    tickers = int(TICKERS_PROCESSED.value())
+    counts = counts if counts is not None else fill_counts(df)
+    rows = counts["rows"]
+
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "finished_at": finished_at.isoformat(timespec="seconds"),
+        "duration_seconds": round(duration, 3),
+        "output_file": output_file,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": config,
+        "throughput": {
+            "rows": rows,
+            "tickers_processed": tickers,
+            "tickers_per_second": round(tickers / duration, 4) if duration > 0 else None,
+        },
+        "stages": {
+            name: {"wall_seconds": round(wall, 3), "cpu_seconds": round(cpu, 3)}
+            for name, (wall, cpu, _) in STAGES.snapshot().items()
+        },
+        "requests": _request_summary(),
+        "latency_seconds": {
+            "http": _latency_summary(HTTP_LATENCY, "host"),
+            "parse": _latency_summary(PARSE_LATENCY, "source"),
+        },
+        "hit_rates": _hit_rates(counts, tickers),
+    }
+
+
+def write_run_manifest(manifest: Dict[str, Any], output_file: str | Path) -> Path:
+    """Write ``manifest`` as ``<output_file>.manifest.json`` and return its path."""
+    output_path = Path(output_file)
+    path = output_path.with_name(f"{output_path.name}.manifest.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2, default=str) + "\n")
+    logger.info(f"Run manifest written to {path}")
+    return path
+
+
+def _request_summary() -> Dict[str, Any]:
+    by_host: Dict[str, Dict[str, Any]] = {}
+    for labels, count in HTTP_REQUESTS.samples():
+        host = by_host.setdefault(labels["host"], {"total": 0, "by_status": {}})
+        host["total"] += int(count)
+        host["by_status"][labels["status"]] = int(count)
+    for host, summary in by_host.items():
+        summary["retries"] = {
+            labels["reason"]: int(count)
+            for labels, count in HTTP_RETRIES.samples()
+            if labels["host"] == host
+        }
+        summary["bytes"] = int(HTTP_BYTES.value(host=host))
+        summary["rate_limit_wait_seconds"] = round(RATE_LIMIT_WAIT.value(host=host), 3)
+        summary["backoff_seconds"] = round(HTTP_BACKOFF.value(host=host), 3)
+
+    return {
+        "total": int(HTTP_REQUESTS.value()),
+        "status_429": int(HTTP_REQUESTS.value(status="429")),
+        "retries": int(HTTP_RETRIES.value()),
+        "by_host": dict(sorted(by_host.items())),
+    }
+
+
+def _quantiles(histogram: Histogram, **labels: str) -> Dict[str, Optional[float]]:
+    summary: Dict[str, Optional[float]] = {"count": histogram.count(**labels)}
+    for name, q in QUANTILES.items():
+        value = histogram.quantile(q, **labels)
+        summary[name] = None if math.isnan(value) else round(value, 4)
+    return summary
+
+
+def _latency_summary(histogram: Histogram, label: str) -> Dict[str, Any]:
+    return {
+        "all": _quantiles(histogram),
+        **{
+            name: _quantiles(histogram, **{label: name})
+            for name in histogram.label_values(label)
+        },
+    }
+
+
+def _hit_rates(counts: Dict[str, int], tickers: int) -> Dict[str, Any]:
+    by_field = {}
+    if counts["rows"]:
+        for field in HIT_RATE_COLUMNS.values():
+            by_field[field] = round(counts[field] / counts["rows"], 4)
+
+    by_source: Dict[str, Dict[str, float]] = {}
+    for labels, count in FIELDS_FILLED.samples():
+        source = by_source.setdefault(labels["source"], {})
+        source[labels["field"]] = round(count / tickers, 4) if tickers else 0.0
+
+    return {
+        "by_field": by_field,
+        "by_source": {
+            source: dict(sorted(fields.items()))
+            for source, fields in sorted(by_source.items())
+        },
+    }
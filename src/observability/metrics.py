@@ -0,0 +1,278 @@
+import bisect
+import math
+import threading
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+
+# Default latency buckets in seconds (upper bounds, +Inf implied)
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    """Common label handling for metrics."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _format_labels(self, values: LabelValues, extra: str = "") -> str:
+        parts = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, values)
+        ]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def expose(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Value for an exact label set, or the sum over label sets matching ``labels``."""
+        with self._lock:
+            return sum(
+                value
+                for key, value in self._values.items()
+                if all(key[self.label_names.index(k)] == str(v) for k, v in labels.items())
+            )
+
+    def samples(self) -> Iterator[Tuple[Dict[str, str], float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield dict(zip(self.label_names, key)), value
+
+    def expose(self) -> List[str]:
+        return [
+            f"{self.name}{self._format_labels(tuple(labels.values()))} {_number(value)}"
+            for labels, value in self.samples()
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observations per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def _merged(self, labels: Dict[str, str]) -> Tuple[List[int], float, int]:
+        counts = [0] * (len(self.buckets) + 1)
+        total, count = 0.0, 0
+        with self._lock:
+            for key, (bucket_counts, series_sum, series_count) in self._series.items():
+                if all(key[self.label_names.index(k)] == str(v) for k, v in labels.items()):
+                    counts = [a + b for a, b in zip(counts, bucket_counts)]
+                    total += series_sum
+                    count += series_count
+        return counts, total, count
+
+    def label_values(self, label: str) -> List[str]:
+        """Distinct observed values of ``label``, sorted."""
+        index = self.label_names.index(label)
+        with self._lock:
+            return sorted({key[index] for key in self._series})
+
+    def count(self, **labels: str) -> int:
+        return self._merged(labels)[2]
+
+    def sum(self, **labels: str) -> float:
+        return self._merged(labels)[1]
+
+    def quantile(self, q: float, **labels: str) -> float:
+        """Estimate a quantile by linear interpolation within buckets.
+
+        ``labels`` may be a subset of the label names, in which case the
+        matching series are merged. Returns NaN when nothing was observed.
+        """
+        counts, _, count = self._merged(labels)
+        if count == 0:
+            return math.nan
+        rank = q * count
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    return lower
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            items = [(key, [list(s[0]), s[1], s[2]]) for key, s in self._series.items()]
+        lines = []
+        for key, (bucket_counts, series_sum, series_count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else _number(bound)
+                labels = self._format_labels(key, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_number(series_sum)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {series_count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, label_names, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "aie_http_requests_total",
+    "HTTP responses received, by host and status code (\"error\" for transport failures).",
+    ("host", "status"),
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "aie_http_request_duration_seconds",
+    "Time per HTTP attempt, by host.",
+    ("host",),
+)
+HTTP_BYTES = REGISTRY.counter(
+    "aie_http_response_bytes_total",
+    "Response body bytes received, by host.",
+    ("host",),
+)
+HTTP_RETRIES = REGISTRY.counter(
+    "aie_http_retries_total",
+    "Retried HTTP attempts, by host and reason.",
+    ("host", "reason"),
+)
+HTTP_BACKOFF = REGISTRY.counter(
+    "aie_http_backoff_seconds_total",
+    "Seconds slept before retries, by host.",
+    ("host",),
+)
+RATE_LIMIT_WAIT = REGISTRY.counter(
+    "aie_rate_limit_wait_seconds_total",
+    "Seconds spent waiting on the per-host rate limiter.",
+    ("host",),
+)
+PARSE_LATENCY = REGISTRY.histogram(
+    "aie_parse_duration_seconds",
+    "Time spent parsing a fetched page, by source.",
+    ("source",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+FIELDS_FILLED = REGISTRY.counter(
+    "aie_fields_filled_total",
+    "Company fields filled, by source and field.",
+    ("source", "field"),
+)
+SCRAPES_SKIPPED = REGISTRY.counter(
+    "aie_scrapes_skipped_total",
+    "Scraper runs skipped because every field they provide was already known.",
+    ("source", "reason"),
+)
+DEAD_ENDS = REGISTRY.counter(
+    "aie_dead_ends_total",
+    "Source pages found to have nothing for a ticker and added to the negative cache.",
+    ("source", "reason"),
+)
+TICKERS_PROCESSED = REGISTRY.counter(
+    "aie_tickers_processed_total",
+    "Tickers that finished processing.",
+)
+TICKERS_DEDUPLICATED = REGISTRY.counter(
+    "aie_tickers_deduplicated_total",
+    "Tickers filled from another listing of the same issuer instead of being scraped.",
+)
+CEO_CLASSIFICATIONS = REGISTRY.counter(
+    "aie_ceo_classifications_total",
+    "Distinct CEO names labelled, by whether the result came from the cache.",
+    ("outcome",),
+)
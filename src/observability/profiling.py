@@ -0,0 +1,369 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter as TallyCounter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.observability.metrics import (
+    HTTP_BACKOFF,
+    HTTP_LATENCY,
+    PARSE_LATENCY,
+    RATE_LIMIT_WAIT,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds between stack samples in sampling mode
+SAMPLE_INTERVAL = 0.005
+# Rows shown in each "top" table of the report
+REPORT_TOP = 20
+TRACEMALLOC_FRAMES = 10
+
+# Leaf frames in these files are threads waiting for work, not doing it
+IDLE_FILES = (
+    os.path.join("concurrent", "futures"),
+    "threading.py",
+    "queue.py",
+    "selectors.py",
+    "socketserver.py",
+)
+
+
+class StageTimes:
+    """Accumulated wall-clock and process CPU seconds per pipeline stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._times: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            with self._lock:
+                totals = self._times.setdefault(name, [0.0, 0.0, 0])
+                totals[0] += wall
+                totals[1] += cpu
+                totals[2] += 1
+
+    def snapshot(self) -> Dict[str, Tuple[float, float, int]]:
+        """``{stage: (wall seconds, cpu seconds, entries)}`` in first-seen order."""
+        with self._lock:
+            return {name: tuple(values) for name, values in self._times.items()}
+
+    def reset(self):
+        with self._lock:
+            self._times.clear()
+
+
+STAGES = StageTimes()
+
+
+def stage(name: str):
+    """Time a block as part of the named pipeline stage."""
+    return STAGES.stage(name)
+
+
+class SamplingProfiler:
+    """Periodically samples the Python stacks of all threads.
+
+    Cheap enough to leave on for a full run. Leaf frames show where threads
+    actually are (``html.parser`` code vs. a ``time.sleep`` in the rate
+    limiter); inclusive counts attribute samples to every function on the
+    stack.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self.idle_samples = 0
+        self.leaves: TallyCounter = TallyCounter()
+        self.inclusive: TallyCounter = TallyCounter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._record(frame)
+
+    def _record(self, frame):
+        code = frame.f_code
+        if any(part in code.co_filename for part in IDLE_FILES):
+            self.idle_samples += 1
+            return
+        self.samples += 1
+        self.leaves[f"{_short_path(code.co_filename)}:{frame.f_lineno} {code.co_name}"] += 1
+        seen = set()
+        while frame is not None:
+            code = frame.f_code
+            key = f"{_short_path(code.co_filename)}:{code.co_firstlineno} {code.co_name}"
+            if key not in seen:
+                seen.add(key)
+                self.inclusive[key] += 1
+            frame = frame.f_back
+
+    def report(self) -> List[str]:
+        lines = [
+            f"Sampling profile: {self.samples} busy samples, "
+            f"{self.idle_samples} idle-thread samples, every {self.interval * 1000:.0f} ms",
+            "",
+            "Top leaf lines (where threads were when sampled):",
+        ]
+        lines.extend(_tally_rows(self.leaves, self.samples))
+        lines.extend(["", "Top functions (inclusive):"])
+        lines.extend(_tally_rows(self.inclusive, self.samples))
+        return lines
+
+
+class ThreadedCProfile:
+    """Deterministic cProfile across the main thread and threads started later.
+
+    From Python 3.12 cProfile is built on ``sys.monitoring``, which reports
+    events from every thread but allows one active profiler, so a single
+    ``cProfile.Profile`` covers the run. Older versions profile one thread per
+    ``Profile``: ``threading.setprofile`` runs a hook as each new thread starts
+    and the hook enables a fresh profile in that thread. ``disable()`` only
+    detaches the calling thread there, so ``stop()`` freezes the stats of
+    threads that are still alive; each of those threads drops its profile when
+    it exits. Per-thread stats are merged for the report.
+    """
+
+    SINGLE_PROFILER = sys.version_info >= (3, 12)
+
+    def __init__(self):
+        self.profiles: List[cProfile.Profile] = []
+        self._frozen: List["_FrozenStats"] = []
+        self._lock = threading.Lock()
+
+    def _start_thread_profile(self, *args):
+        profile = cProfile.Profile()
+        with self._lock:
+            self.profiles.append(profile)
+        profile.enable()
+
+    def start(self):
+        if not self.SINGLE_PROFILER:
+            threading.setprofile(self._start_thread_profile)
+        self._start_thread_profile()
+
+    def stop(self):
+        if not self.SINGLE_PROFILER:
+            threading.setprofile(None)
+        with self._lock:
+            profiles = list(self.profiles)
+        # The first profile belongs to the thread that called start()
+        profiles[0].disable()
+        self._frozen = [_FrozenStats(profile) for profile in profiles]
+
+    def stats(self) -> pstats.Stats:
+        sources = self._frozen or self.profiles
+        stats = pstats.Stats(sources[0])
+        for source in sources[1:]:
+            stats.add(source)
+        return stats
+
+    def report(self) -> List[str]:
+        buffer = io.StringIO()
+        stats = self.stats()
+        stats.stream = buffer
+        stats.sort_stats("tottime").print_stats(REPORT_TOP)
+        stats.sort_stats("cumulative").print_stats(REPORT_TOP)
+        return [f"cProfile: {len(self.profiles)} profile(s) merged", ""] + buffer.getvalue().splitlines()
+
+
+class _FrozenStats:
+    """Stats of one profile as of ``ThreadedCProfile.stop()``, loadable by ``pstats``."""
+
+    def __init__(self, profile: cProfile.Profile):
+        # snapshot_stats() reads the profile without detaching the calling thread
+        profile.snapshot_stats()
+        self._stats = profile.stats
+        self.stats = {}
+
+    def create_stats(self):
+        # pstats.Stats empties .stats after loading it
+        self.stats = dict(self._stats)
+
+
+class RunProfiler:
+    """Profiles a run and writes a stage-by-stage report.
+
+    ``mode`` is ``"sample"`` (default, low overhead, all threads),
+    ``"cprofile"`` (deterministic, also dumps a ``.pstats`` file) or ``None``
+    to only collect stage timings. With ``trace_allocations`` tracemalloc
+    snapshots are taken at every ``checkpoint()`` to find top allocators.
+    """
+
+    def __init__(self, mode: Optional[str] = "sample", trace_allocations: bool = False):
+        if mode not in (None, "sample", "cprofile"):
+            raise ValueError(f"Unsupported profiling mode: {mode!r}")
+        self.mode = mode
+        self.trace_allocations = trace_allocations
+        self.sampler: Optional[SamplingProfiler] = None
+        self.cprofile: Optional[ThreadedCProfile] = None
+        self.memory_checkpoints: List[Tuple[str, int, int]] = []
+        self._first_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._worker_baseline: Dict[str, float] = {}
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    def start(self):
+        global _active
+        STAGES.reset()
+        self._worker_baseline = _worker_seconds()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        if self.trace_allocations:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self.checkpoint("start")
+        if self.mode == "sample":
+            self.sampler = SamplingProfiler()
+            self.sampler.start()
+        elif self.mode == "cprofile":
+            self.cprofile = ThreadedCProfile()
+            self.cprofile.start()
+        _active = self
+
+    def checkpoint(self, label: str):
+        """Record memory use and take a tracemalloc snapshot, if enabled."""
+        if not tracemalloc.is_tracing():
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.memory_checkpoints.append((label, current, peak))
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            )
+        )
+        if self._first_snapshot is None:
+            self._first_snapshot = snapshot
+        self._last_snapshot = snapshot
+
+    def stop(self):
+        global _active
+        _active = None
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.cprofile is not None:
+            self.cprofile.stop()
+        if self.trace_allocations:
+            self.checkpoint("end")
+            tracemalloc.stop()
+
+    def report(self) -> str:
+        lines = [
+            f"Run: {self.wall_seconds:.2f}s wall, {self.cpu_seconds:.2f}s CPU "
+            f"({self.cpu_seconds / max(self.wall_seconds, 1e-9):.0%} of one core)",
+            "",
+            "Pipeline stages (main thread):",
+            f"  {'stage':<24}{'wall s':>10}{'cpu s':>10}{'% run':>8}{'calls':>8}",
+        ]
+        for name, (wall, cpu, calls) in STAGES.snapshot().items():
+            lines.append(
+                f"  {name:<24}{wall:>10.2f}{cpu:>10.2f}"
+                f"{wall / max(self.wall_seconds, 1e-9):>8.0%}{calls:>8}"
+            )
+
+        worker = _worker_seconds()
+        lines.extend(["", "Worker time inside fetch (summed over threads):"])
+        for name, total in worker.items():
+            lines.append(f"  {name:<24}{total - self._worker_baseline.get(name, 0.0):>10.2f}")
+
+        if self.sampler is not None:
+            lines.extend([""] + self.sampler.report())
+        if self.cprofile is not None:
+            lines.extend([""] + self.cprofile.report())
+        if self.memory_checkpoints:
+            lines.extend([""] + self._memory_report())
+        return "\n".join(lines) + "\n"
+
+    def _memory_report(self) -> List[str]:
+        lines = ["tracemalloc checkpoints:", f"  {'checkpoint':<32}{'current MB':>12}{'peak MB':>10}"]
+        for label, current, peak in self.memory_checkpoints:
+            lines.append(f"  {label:<32}{current / 2**20:>12.1f}{peak / 2**20:>10.1f}")
+        if self._last_snapshot is not None:
+            lines.extend(["", "Top allocators at end of run:"])
+            for stat in self._last_snapshot.statistics("lineno")[:REPORT_TOP]:
+                lines.append(f"  {stat.size / 2**10:>10.1f} KiB {stat.count:>8} blocks  {stat.traceback[0]}")
+        if self._first_snapshot is not None and self._last_snapshot is not self._first_snapshot:
+            lines.extend(["", "Largest growth since start:"])
+            for stat in self._last_snapshot.compare_to(self._first_snapshot, "lineno")[:REPORT_TOP]:
+                lines.append(f"  {stat.size_diff / 2**10:>+10.1f} KiB  {stat.traceback[0]}")
+        return lines
+
+    def write_report(self, path: str | Path) -> Path:
+        """Write the text report (and ``.pstats`` in cprofile mode) to ``path``."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.report())
+        if self.cprofile is not None:
+            self.cprofile.stats().dump_stats(str(path.with_suffix(".pstats")))
+        logger.info(f"Profile report written to {path}")
+        return path
+
+
+_active: Optional[RunProfiler] = None
+
+
+def checkpoint(label: str):
+    """Take a memory checkpoint on the active profiler, if there is one."""
+    profiler = _active
+    if profiler is not None:
+        profiler.checkpoint(label)
+
+
+def _worker_seconds() -> Dict[str, float]:
+    return {
+        "network": HTTP_LATENCY.sum(),
+        "rate-limit wait": RATE_LIMIT_WAIT.value(),
+        "retry backoff": HTTP_BACKOFF.value(),
+        "parse": PARSE_LATENCY.sum(),
+    }
+
+
+def _short_path(filename: str) -> str:
+    for prefix in sorted(sys.path, key=len, reverse=True):
+        if prefix and filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1:]
+    return filename
+
+
+def _tally_rows(tally: TallyCounter, total: int) -> List[str]:
+    return [
+        f"  {count / max(total, 1):>6.1%} {count:>8}  {key}"
+        for key, count in tally.most_common(REPORT_TOP)
+    ]
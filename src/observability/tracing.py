@@ -0,0 +1,196 @@
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+SERVICE_NAME = "american-indian-entrepreneurs"
+SCOPE_NAME = "src.observability.tracing"
+
+# Spans buffered before a line of OTLP JSON is written
+EXPORT_BATCH_SPANS = 256
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    """A timed operation with attributes, nested under the current span.
+
+    Used as a context manager: entering makes it the parent of spans opened
+    in the same thread/context, leaving ends it and hands it to the exporter.
+    An exception escaping the block marks the span as failed.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "attributes",
+        "start_ns", "end_ns", "error", "_exporter", "_token",
+    )
+
+    def __init__(self, name: str, attributes: Dict[str, Any], exporter: "JSONLSpanExporter"):
+        parent = _current_span.get()
+        self.name = name
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent.span_id if parent else ""
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+        self._exporter = exporter
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self._exporter.export(self)
+        return False
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode as an OTLP/JSON span."""
+        status = (
+            {"code": 2, "message": self.error} if self.error is not None else {"code": 1}
+        )
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": 3 if self.name.startswith("http.attempt") else 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": status,
+        }
+
+
+class _NoopSpan:
+    """Stand-in used when tracing is off; costs one call per span."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class JSONLSpanExporter:
+    """Append finished spans to a file as OTLP/JSON lines.
+
+    Each line is an ``ExportTraceServiceRequest`` (``{"resourceSpans": ...}``)
+    holding a batch of spans, the layout read by the OpenTelemetry
+    Collector's ``otlpjsonfile`` receiver.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = EXPORT_BATCH_SPANS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.spans_exported = 0
+        self._lock = threading.Lock()
+        self._pending: List[Span] = []
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def export(self, span: Span):
+        with self._lock:
+            self._pending.append(span)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def flush(self):
+        with self._lock:
+            self._write_pending()
+
+    def close(self):
+        with self._lock:
+            self._write_pending()
+            self._file.close()
+        logger.info(f"Wrote {self.spans_exported} trace spans to {self.path}")
+
+    def _write_pending(self):
+        if not self._pending or self._file.closed:
+            return
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", SERVICE_NAME)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME},
+                            "spans": [span.to_otlp() for span in self._pending],
+                        }
+                    ],
+                }
+            ]
+        }
+        self._file.write(json.dumps(request, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.spans_exported += len(self._pending)
+        self._pending = []
+
+
+_exporter: Optional[JSONLSpanExporter] = None
+
+
+def configure_tracing(path: str | Path) -> JSONLSpanExporter:
+    """Start recording spans to ``path``; returns the exporter."""
+    global _exporter
+    shutdown_tracing()
+    _exporter = JSONLSpanExporter(path)
+    return _exporter
+
+
+def shutdown_tracing():
+    """Flush and stop recording spans."""
+    global _exporter
+    exporter, _exporter = _exporter, None
+    if exporter is not None:
+        exporter.close()
+
+
+def span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """Open a span named ``name`` under the current one, if tracing is on."""
+    exporter = _exporter
+    if exporter is None:
+        return _NOOP_SPAN
+    return Span(name, attributes, exporter)
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
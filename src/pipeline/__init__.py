@@ -0,0 +1,7 @@
+
+
+# Pipeline package
+
+from .geocode import Gazetteer, geocode_headquarters  # noqa: F401
+from .normalize import normalize_company_fields  # noqa: F401
+from .result_columns import ResultColumns  # noqa: F401
@@ -0,0 +1,184 @@
+import logging
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+# Columns added by the geocoding stage
+GEOCODE_COLUMNS = ["HQ Latitude", "HQ Longitude", "HQ County", "HQ Geocode Match"]
+
+# GeoNames postal-code dump layout (https://download.geonames.org/export/zip/US.zip)
+GEONAMES_COLUMNS = [
+    "country", "postal", "city", "state_name", "state", "county",
+    "county_code", "community", "community_code", "latitude", "longitude", "accuracy",
+]
+US_COUNTRY_NAMES = ("", "United States")
+
+_PUNCTUATION = re.compile(r"[.,']")
+_WHITESPACE = re.compile(r"\s+")
+_LEADING_ABBREVIATIONS = {"st": "saint", "ste": "sainte", "ft": "fort", "mt": "mount"}
+
+# (latitude, longitude, state, county, match)
+GeocodeResult = Tuple[float, float, str, str, str]
+NO_MATCH: GeocodeResult = (np.nan, np.nan, "", "", "")
+
+
+def city_key(city: str) -> str:
+    """Normalize a city name for lookup ("St. Louis" -> "saint louis")."""
+    words = _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", city)).strip().casefold().split(" ")
+    if words and words[0] in _LEADING_ABBREVIATIONS:
+        words[0] = _LEADING_ABBREVIATIONS[words[0]]
+    return " ".join(words)
+
+
+class Gazetteer:
+    """Offline US place index built from a GeoNames postal-code file.
+
+    Postal codes and ``STATE|city`` keys are held in sorted NumPy arrays and
+    found with binary search; a city that is not an exact match resolves to
+    the single indexed city that starts with it (``"new york"`` ->
+    ``"new york city"``), if there is exactly one. City coordinates are the
+    mean of their postal codes and the county is the most common one.
+    Results are memoized per (postal code, state, city).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        places = _read_geonames(self.path)
+        self._state_codes = dict(
+            zip(places["state_name"].str.casefold(), places["state"].str.upper())
+        )
+
+        places = places.sort_values("postal", kind="stable").drop_duplicates("postal")
+        self._postal_keys = places["postal"].to_numpy(dtype=str)
+        self._postal_values = places[["latitude", "longitude", "state", "county"]].to_numpy(
+            dtype=object
+        )
+
+        places = places.assign(key=places["state"] + "|" + places["city"].map(city_key))
+        counties = (
+            places.groupby(["key", "county"]).size().rename("postal_codes").reset_index()
+            .sort_values(["key", "postal_codes"], ascending=[True, False], kind="stable")
+            .drop_duplicates("key")
+            .set_index("key")["county"]
+        )
+        cities = places.groupby("key").agg(
+            latitude=("latitude", "mean"), longitude=("longitude", "mean"), state=("state", "first")
+        )
+        cities = cities.join(counties).sort_index()
+        self._city_keys = cities.index.to_numpy(dtype=str)
+        self._city_values = cities[["latitude", "longitude", "state", "county"]].to_numpy(
+            dtype=object
+        )
+        self._memo: Dict[Tuple[str, str, str], GeocodeResult] = {}
+        logger.info(
+            f"Loaded gazetteer {self.path}: {len(self._postal_keys)} postal codes, "
+            f"{len(self._city_keys)} cities"
+        )
+
+    def resolve(self, postal: str = "", state: str = "", city: str = "") -> GeocodeResult:
+        """Coordinates, state and county for an address, or ``NO_MATCH``.
+
+        The postal code wins when it is known; otherwise the city is looked
+        up within ``state`` (a USPS code or full state name).
+        """
+        postal = postal[:5] if postal[:5].isdigit() else ""
+        state = self._state_codes.get(state.casefold(), state.upper())
+        memo_key = (postal, state, city_key(city) if city else "")
+        result = self._memo.get(memo_key)
+        if result is None:
+            result = self._memo[memo_key] = self._resolve(*memo_key)
+        return result
+
+    def _resolve(self, postal: str, state: str, city: str) -> GeocodeResult:
+        if postal:
+            row = _find(self._postal_keys, postal)
+            if row is not None:
+                return (*self._postal_values[row], "postal")
+        if state and city:
+            key = f"{state}|{city}"
+            row = _find(self._city_keys, key)
+            if row is not None:
+                return (*self._city_values[row], "city")
+            start = np.searchsorted(self._city_keys, key, side="left")
+            end = np.searchsorted(self._city_keys, key + "\uffff", side="left")
+            if end - start == 1:
+                return (*self._city_values[start], "city prefix")
+        return NO_MATCH
+
+
+def _find(keys: np.ndarray, key: str) -> Optional[int]:
+    position = int(np.searchsorted(keys, key))
+    if position < len(keys) and keys[position] == key:
+        return position
+    return None
+
+
+def _read_geonames(path: Path) -> pd.DataFrame:
+    """Read US rows of a GeoNames postal file (``US.txt`` or ``US.zip``)."""
+    options = dict(
+        sep="\t", header=None, names=GEONAMES_COLUMNS, dtype=str, keep_default_na=False
+    )
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            name = next(n for n in archive.namelist() if n.endswith(".txt") and "readme" not in n)
+            with archive.open(name) as file:
+                places = pd.read_csv(file, **options)
+    else:
+        places = pd.read_csv(path, **options)
+    places = places[places["country"].eq("US")]
+    return places.assign(
+        latitude=pd.to_numeric(places["latitude"], errors="coerce"),
+        longitude=pd.to_numeric(places["longitude"], errors="coerce"),
+    )
+
+
+def geocode_headquarters(df: pd.DataFrame, gazetteer: Gazetteer) -> pd.DataFrame:
+    """Add latitude, longitude, county and match type for US headquarters.
+
+    Works on the normalized ``HQ *`` columns, so it runs after
+    ``normalize_company_fields``. Each distinct (postal code, state, city) is
+    resolved once; missing ``HQ State`` values are filled from the match.
+    Addresses outside the US are left empty.
+    """
+    address = pd.DataFrame(
+        {
+            column: df[column].astype("string").fillna("").str.strip()
+            for column in ("HQ Postal Code", "HQ State", "HQ City", "HQ Country")
+        },
+        index=df.index,
+    )
+    us = address["HQ Country"].isin(US_COUNTRY_NAMES) & address[
+        ["HQ Postal Code", "HQ City"]
+    ].ne("").any(axis=1)
+    keys = address.loc[us, ["HQ Postal Code", "HQ State", "HQ City"]]
+    unique = keys.drop_duplicates()
+    resolved = pd.DataFrame(
+        [gazetteer.resolve(*row) for row in unique.itertuples(index=False)],
+        columns=["latitude", "longitude", "state", "county", "match"],
+        index=unique.index,
+    )
+    # Map every row to the resolution of its first identical address
+    matches = keys.merge(
+        pd.concat([unique, resolved], axis=1), on=list(keys.columns), how="left"
+    ).set_axis(keys.index)
+    matches = matches.reindex(df.index)
+
+    state = df["HQ State"].astype("string")
+    filled_state = state.where(state.notna() & state.ne(""), matches["state"].replace("", pd.NA))
+    return df.assign(
+        **{
+            "HQ State": filled_state.astype("category"),
+            "HQ Latitude": pd.to_numeric(matches["latitude"], errors="coerce"),
+            "HQ Longitude": pd.to_numeric(matches["longitude"], errors="coerce"),
+            "HQ County": matches["county"].replace("", pd.NA).astype("string"),
+            "HQ Geocode Match": matches["match"].replace("", pd.NA).astype("category"),
+        }
+    )
@@ -0,0 +1,156 @@
+import re
+
+import pandas as pd
+
+
+# Typed columns derived from the scraped string columns
+NORMALIZED_COLUMNS = [
+    "Employee Count",
+    "Founded Year",
+    "HQ Street",
+    "HQ City",
+    "HQ State",
+    "HQ Postal Code",
+    "HQ Country",
+]
+
+# Countries that appear as the trailing fragment of scraped addresses
+COUNTRIES = [
+    "United States",
+    "Canada",
+    "China",
+    "Hong Kong",
+    "Taiwan",
+    "Singapore",
+    "Japan",
+    "South Korea",
+    "Korea, Republic of",
+    "India",
+    "Malaysia",
+    "Thailand",
+    "Vietnam",
+    "Indonesia",
+    "Philippines",
+    "Australia",
+    "New Zealand",
+    "Israel",
+    "Turkey",
+    "United Arab Emirates",
+    "Saudi Arabia",
+    "Cyprus",
+    "Greece",
+    "United Kingdom",
+    "Ireland",
+    "Isle of Man",
+    "Jersey",
+    "Guernsey",
+    "Netherlands",
+    "Belgium",
+    "Luxembourg",
+    "France",
+    "Germany",
+    "Switzerland",
+    "Austria",
+    "Italy",
+    "Spain",
+    "Portugal",
+    "Denmark",
+    "Sweden",
+    "Norway",
+    "Finland",
+    "Iceland",
+    "Poland",
+    "Monaco",
+    "Malta",
+    "Gibraltar",
+    "Bermuda",
+    "Cayman Islands",
+    "British Virgin Islands",
+    "Virgin Islands, British",
+    "Virgin Islands (British)",
+    "Bahamas",
+    "Puerto Rico",
+    "Panama",
+    "Mexico",
+    "Costa Rica",
+    "Colombia",
+    "Peru",
+    "Chile",
+    "Argentina",
+    "Uruguay",
+    "Brazil",
+    "South Africa",
+    "Nigeria",
+    "Kenya",
+    "Egypt",
+    "Jordan",
+    "Cambodia",
+    "Macau",
+    "Kazakhstan",
+    "Mongolia",
+]
+
+# Street types and unit designators that usually end the street part of an
+# address; whatever follows them (up to the state/postal code) is the city.
+_STREET_ENDINGS = (
+    r"street|st|avenue|ave|av|boulevard|blvd|road|rd|drive|dr|lane|ln|way|"
+    r"parkway|pkwy|place|pl|plaza|plz|court|ct|circle|cir|highway|hwy|freeway|"
+    r"square|sq|terrace|trail|center|centre|park|tower|building|floor|fl|"
+    r"broadway|suite|ste|unit|box|n\.?e|n\.?w|s\.?e|s\.?w"
+)
+
+EMPLOYEES_PATTERN = re.compile(r"^\s*(?P<count>\d{1,3}(?:,\d{3})+|\d+)\b")
+FOUNDED_PATTERN = re.compile(r"\b(?P<year>1[6-9]\d\d|20\d\d)\b")
+ADDRESS_PATTERN = re.compile(
+    r"^(?P<head>.*?)"
+    r"(?:,\s*(?P<state>[A-Z]{2,3}|[A-Z][a-z]+(?: [A-Z][a-z]+)*))?"
+    r"(?:\s+(?P<postal>(?:[A-Z]{1,3}-?)?\d[\dA-Z.\-]*(?:\s[\dA-Z]{2,3})?))?"
+    r"(?:\s+(?P<country>" + "|".join(re.escape(c) for c in COUNTRIES) + r"))?$"
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+STREET_CITY_PATTERN = re.compile(
+    r"^(?P<street>.*(?:\d[\w/\-]*|\b(?:" + _STREET_ENDINGS + r")\.?))"
+    r"[\s,]+(?P<city>[^\d,:]+)$",
+    re.IGNORECASE,
+)
+
+
+def normalize_company_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """Add typed columns parsed from the scraped string columns.
+
+    Employees become integer counts, Founded an integer year and Headquarters
+    is split into street, city, state, postal code and country. All parsing is
+    done with precompiled patterns over whole columns; values that cannot be
+    parsed are left missing rather than guessed.
+    """
+    employees = _strings(df, "Employees").str.extract(EMPLOYEES_PATTERN)["count"]
+    founded = _strings(df, "Founded").str.extract(FOUNDED_PATTERN)["year"]
+
+    headquarters = _strings(df, "Headquarters").str.replace(
+        WHITESPACE_PATTERN, " ", regex=True
+    )
+    address = headquarters.str.strip().replace("", pd.NA).str.extract(ADDRESS_PATTERN)
+    parts = address["head"].str.extract(STREET_CITY_PATTERN)
+    street = parts["street"].fillna(address["head"]).str.strip(" ,")
+
+    return df.assign(
+        **{
+            "Employee Count": _to_int(employees.str.replace(",", "", regex=False)),
+            "Founded Year": _to_int(founded),
+            "HQ Street": street.replace("", pd.NA).astype("string"),
+            "HQ City": parts["city"].str.strip().astype("string"),
+            "HQ State": address["state"].astype("category"),
+            "HQ Postal Code": address["postal"].astype("string"),
+            "HQ Country": address["country"].astype("category"),
+        }
+    )
+
+
+def _strings(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="string")
+    return df[column].astype("string")
+
+
+def _to_int(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values, errors="coerce").astype("Int64")
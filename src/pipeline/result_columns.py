@@ -0,0 +1,73 @@
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.models.company_details import CompanyDetails
+
+
+# DataFrame column -> CompanyDetails.to_dict() key
+DETAIL_COLUMNS: Dict[str, str] = {
+    "CEO": "ceo",
+    "Employees": "employees",
+    "Headquarters": "headquarters",
+    "Founded": "founded",
+    "Industry": "industry",
+    "Source": "sources",
+    "Source Link": "urls",
+}
+
+# Columns with few distinct values, stored as categoricals
+CATEGORICAL_COLUMNS = ("Industry", "Source")
+
+
+class ResultColumns:
+    """Preallocated column buffers for scraped company details.
+
+    Results are written by row position into plain object arrays and joined
+    into the screener frame in one operation at the end, instead of issuing
+    scalar ``df.at`` writes for every field of every ticker. Buffers start
+    from the frame's own detail columns, so values an offline snapshot
+    carried over are kept unless a scrape replaces them.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.index = df.index
+        self.columns: Dict[str, np.ndarray] = {}
+        for column in DETAIL_COLUMNS:
+            if column in df.columns:
+                values = df[column].to_numpy(dtype=object, na_value="", copy=True)
+            else:
+                values = np.full(len(df), "", dtype=object)
+            self.columns[column] = values
+
+    def set_row(self, position: int, details: CompanyDetails):
+        """Store the details for the row at ``position``.
+
+        Fields the scrape left empty keep the row's existing value rather than
+        erasing it.
+        """
+        details_dict = details.to_dict()
+        for column, key in DETAIL_COLUMNS.items():
+            if details_dict[key]:
+                self.columns[column][position] = details_dict[key]
+
+    def take(self, df: pd.DataFrame, positions: Sequence[int]) -> pd.DataFrame:
+        """Return the rows at ``positions`` of ``df`` with their buffered details."""
+        rows = df.iloc[list(positions)]
+        return rows.assign(
+            **{
+                column: values[list(positions)]
+                for column, values in self.columns.items()
+            }
+        )
+
+    def join_into(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return ``df`` with the buffered columns assigned in a single step."""
+        assigned = {}
+        for column, values in self.columns.items():
+            if column in CATEGORICAL_COLUMNS:
+                assigned[column] = pd.Categorical(values)
+            else:
+                assigned[column] = values
+        return df.assign(**{k: pd.Series(v, index=self.index) for k, v in assigned.items()})
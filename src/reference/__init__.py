@@ -0,0 +1,6 @@
+
+
+# Reference data package
+
+from .index import ReferenceIndex, ReferenceRecord  # noqa: F401
+from .importers import build_index, iter_csv_records, iter_sec_submissions  # noqa: F401
@@ -0,0 +1,164 @@
+"""Build a reference index from bulk company-registry files.
+
+Usage:
+    python -m src.reference.importers submissions.zip
+    python -m src.reference.importers registry.csv --format csv --output .cache/reference.sqlite
+
+``submissions.zip`` is the SEC EDGAR bulk download
+(https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip):
+one JSON document per filer with its tickers, SIC industry and business
+address. Any CSV with a ticker/symbol column and some of the detail columns
+(including this project's own exports) can be imported as well.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.reference.index import ReferenceIndex, ReferenceRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INDEX_PATH = ".cache/reference.sqlite"
+
+US_STATES = frozenset(
+    "AL AK AZ AR CA CO CT DE DC FL GA HI ID IL IN IA KS KY LA ME MD MA MI MN MS MO "
+    "MT NE NV NH NJ NM NY NC ND OH OK OR PA RI SC SD TN TX UT VT VA WA WV WI WY "
+    "PR VI GU AS MP".split()
+)
+
+# Accepted CSV header (lowercased) -> ReferenceRecord field
+CSV_COLUMNS = {
+    "ticker": "ticker",
+    "symbol": "ticker",
+    "headquarters": "headquarters",
+    "address": "headquarters",
+    "industry": "industry",
+    "sic_description": "industry",
+    "sicdescription": "industry",
+    "founded": "founded",
+    "incorporated": "founded",
+    "employees": "employees",
+    "ceo": "ceo",
+}
+
+
+def iter_sec_submissions(path: str | Path) -> Iterator[ReferenceRecord]:
+    """Yield one record per ticker from SEC EDGAR submissions JSON.
+
+    ``path`` is the bulk ``submissions.zip`` or a directory of its extracted
+    ``CIK##########.json`` files. Filers without tickers (funds, individuals)
+    and the per-filer continuation files are skipped.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for file in sorted(path.glob("CIK*.json")):
+            if "-submissions-" not in file.name:
+                yield from _sec_records(json.loads(file.read_bytes()))
+        return
+    with zipfile.ZipFile(path) as archive:
+        for name in archive.namelist():
+            if name.endswith(".json") and "-submissions-" not in name:
+                yield from _sec_records(json.loads(archive.read(name)))
+
+
+def _sec_records(filer: Dict[str, Any]) -> Iterator[ReferenceRecord]:
+    tickers = filer.get("tickers") or []
+    if not tickers:
+        return
+    headquarters = _sec_address((filer.get("addresses") or {}).get("business") or {})
+    industry = (filer.get("sicDescription") or "").strip() or None
+    for ticker in tickers:
+        yield ReferenceRecord(
+            ticker=ticker,
+            source="SEC EDGAR",
+            headquarters=headquarters,
+            industry=industry,
+        )
+
+
+def _sec_address(address: Dict[str, Any]) -> Optional[str]:
+    """Format an EDGAR address like the scraped ones: "street city, ST zip country"."""
+    street = " ".join(
+        part.strip() for part in (address.get("street1"), address.get("street2")) if part
+    )
+    city = (address.get("city") or "").strip()
+    state = (address.get("stateOrCountry") or "").strip()
+    postal = (address.get("zipCode") or "").strip()
+    if not (street or city):
+        return None
+    if state in US_STATES:
+        country = "United States"
+        region = f"{city}, {state} {postal}".strip()
+    else:
+        country = (address.get("stateOrCountryDescription") or "").strip()
+        region = f"{city} {postal}".strip()
+    return " ".join(part for part in (street, region, country) if part)
+
+
+def iter_csv_records(path: str | Path, source: str = "Reference CSV") -> Iterator[ReferenceRecord]:
+    """Yield records from a CSV with a ticker/symbol column.
+
+    Headers are matched case-insensitively against ``CSV_COLUMNS``; other
+    columns are ignored and empty cells are treated as missing.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        positions: Dict[str, int] = {}
+        for index, name in enumerate(header):
+            field = CSV_COLUMNS.get(name.strip().lower().replace(" ", "_"))
+            if field and field not in positions:
+                positions[field] = index
+        if "ticker" not in positions:
+            raise ValueError(f"{path} has no ticker or symbol column")
+        for row in reader:
+            values = {
+                field: (row[index].strip() or None) if index < len(row) else None
+                for field, index in positions.items()
+            }
+            if values["ticker"]:
+                yield ReferenceRecord(source=source, **values)
+
+
+def build_index(
+    source_path: str | Path,
+    output: str | Path = DEFAULT_INDEX_PATH,
+    source_format: str = "sec",
+) -> ReferenceIndex:
+    """Import ``source_path`` into the index at ``output`` and return it."""
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if source_format == "sec":
+        records = iter_sec_submissions(source_path)
+    elif source_format == "csv":
+        records = iter_csv_records(source_path)
+    else:
+        raise ValueError(f"Unsupported reference format: {source_format!r}")
+    index = ReferenceIndex(output, create=True)
+    written = index.add(records)
+    logger.info(f"Imported {written} reference records into {output} ({len(index)} tickers)")
+    return index
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Build the ticker reference index used to pre-fill company details."
+    )
+    parser.add_argument("source", help="Bulk file: SEC submissions.zip (or its directory) or a CSV.")
+    parser.add_argument("--format", choices=["sec", "csv"], default=None)
+    parser.add_argument("--output", default=DEFAULT_INDEX_PATH)
+    args = parser.parse_args(argv)
+    source_format = args.format or ("csv" if args.source.lower().endswith(".csv") else "sec")
+    build_index(args.source, args.output, source_format).close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,139 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from src.models.company_details import CompanyDetails
+from src.models.source_registry import SOURCES
+from src.observability.metrics import FIELDS_FILLED
+
+
+logger = logging.getLogger(__name__)
+
+
+# Reference sources and the page each record can be checked against
+REFERENCE_SOURCES = {
+    "SEC EDGAR": "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={ticker}",
+    "Reference CSV": None,
+}
+PREFILL_FIELDS = ("ceo", "employees", "headquarters", "founded", "industry")
+
+# Rows inserted per transaction while building an index
+INSERT_BATCH_ROWS = 5000
+
+
+class ReferenceRecord(NamedTuple):
+    """Company fields known ahead of scraping, keyed by ticker."""
+
+    ticker: str
+    source: str
+    headquarters: Optional[str] = None
+    industry: Optional[str] = None
+    founded: Optional[str] = None
+    employees: Optional[str] = None
+    ceo: Optional[str] = None
+
+
+class ReferenceIndex:
+    """SQLite-backed ticker index of bulk reference data.
+
+    The index is built once from a downloaded registry dump (see
+    ``src.reference.importers``) and queried by primary key during runs, so
+    lookups stay fast and memory use stays flat however large the dump was.
+    ``prefill()`` copies known fields into a fresh ``CompanyDetails`` before
+    any scraper runs.
+
+    An existing index is opened read-only, so a mistyped path raises
+    ``FileNotFoundError`` instead of running against a new, empty index;
+    only ``create=True`` (used by ``build_index``) creates or writes one.
+    """
+
+    def __init__(self, path: str | Path, create: bool = False):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        if create:
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS reference ("
+                " ticker TEXT PRIMARY KEY, source TEXT NOT NULL, headquarters TEXT,"
+                " industry TEXT, founded TEXT, employees TEXT, ceo TEXT)"
+                " WITHOUT ROWID"
+            )
+        else:
+            if not self.path.is_file():
+                raise FileNotFoundError(f"Reference index not found: {self.path}")
+            self._connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+        self._source_bits: Dict[str, int] = {}
+
+    def add(self, records: Iterable[ReferenceRecord]) -> int:
+        """Insert or replace records; return how many were written."""
+        written = 0
+        batch = []
+        with self._lock:
+            for record in records:
+                batch.append(record._replace(ticker=normalize_ticker(record.ticker)))
+                if len(batch) >= INSERT_BATCH_ROWS:
+                    written += self._insert(batch)
+                    batch = []
+            written += self._insert(batch)
+        return written
+
+    def _insert(self, batch) -> int:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO reference VALUES (?, ?, ?, ?, ?, ?, ?)", batch
+            )
+        return len(batch)
+
+    def get(self, ticker: str) -> Optional[ReferenceRecord]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM reference WHERE ticker = ?", (normalize_ticker(ticker),)
+            ).fetchone()
+        return ReferenceRecord(*row) if row else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM reference").fetchone()[0]
+
+    def prefill(self, company_details: CompanyDetails, ticker: Optional[str] = None) -> bool:
+        """Fill missing fields of ``company_details`` from the index.
+
+        ``ticker`` is the screener symbol, before the cleaning that drops
+        share-class separators; it defaults to ``company_details.ticker``.
+        Returns True if any field was filled, in which case the reference
+        source is recorded like a scraper's.
+        """
+        record = self.get(ticker or company_details.ticker)
+        if record is None:
+            return False
+        filled = False
+        for field in PREFILL_FIELDS:
+            value = getattr(record, field)
+            if value and getattr(company_details, field) is None:
+                setattr(company_details, field, value)
+                FIELDS_FILLED.inc(source=record.source, field=field)
+                filled = True
+        if filled:
+            company_details.add_source(self._source_bit(record.source))
+        return filled
+
+    def _source_bit(self, source: str) -> int:
+        bit = self._source_bits.get(source)
+        if bit is None:
+            bit = self._source_bits[source] = SOURCES.register(
+                source, REFERENCE_SOURCES.get(source)
+            )
+        return bit
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def normalize_ticker(ticker: str) -> str:
+    """Match screener symbols (``BRK/B``, ``BF^A``) to registry tickers (``BRK-B``)."""
+    return ticker.strip().upper().replace("/", "-").replace("^", "-").replace(".", "-")
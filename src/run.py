@@ -5,30 +5,39 @@ This script demonstrates the refactored, object-oriented approach to fetching
 company details from various financial websites using modern Python best practices.
 """
 
+import argparse
 import datetime
 import json
 import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+from urllib.parse import urlencode
 
-import pandas as pd
-from tqdm import tqdm
-
-from src.models.company_details import CompanyDetails
+from src.config.settings import Settings, load_settings
 from src.fetchers.company_details_fetcher import CompanyDetailsFetcher
+from src.fetchers.deadline_planner import DeadlinePlanner, parse_deadline
+from src.observability.metrics import (
+    HTTP_REQUESTS,
+    TICKERS_DEDUPLICATED,
+    TICKERS_PROCESSED,
+)
+from src.observability.metrics_server import start_metrics_server
+from src.observability.profiling import RunProfiler, checkpoint, stage
+from src.observability.tracing import configure_tracing, shutdown_tracing
+
+if TYPE_CHECKING:
+    import pandas as pd
 
-# Configuration for rate limiting - adjust these values if you encounter 429/403 errors
-RATE_LIMITING_CONFIG = {
-    "max_workers":  min(32, (os.cpu_count() or 1) * 5),  # Number of concurrent workers (lower = more conservative)
-    "batch_size": 100,  # Number of companies to process in each batch
-    "test_mode": os.getenv("TEST_MODE", "False").lower() == "true",  # Set to True for testing with limited data
-    "test_limit": 5,   # Number of companies to process in test mode
-    "batch_delay": 2,   # seconds to wait between batches
-}
+    from src.exporters.base import BaseSink
+    from src.exporters.csv_sink import StreamingCSVSink
+    from src.exporters.excel_writer import StreamingExcelWriter
+    from src.pipeline.result_columns import ResultColumns
+    from src.screener.cache import ScreenerCache
+    from src.screener.filters import ScreenerFilter
 
 # Configure logging
 logging.basicConfig(
@@ -36,52 +45,152 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows converted per step when exporting a finished frame to Excel
+EXCEL_CHUNK_ROWS = 5000
+
+# Seconds between progress log lines while processing companies
+PROGRESS_LOG_SECONDS = 30.0
+
+# Screener rows enriched per chunk in chunked mode (--chunk-rows)
+DEFAULT_CHUNK_ROWS = 10_000
+
 
 class NasdaqDataProcessor:
     """Handles fetching and processing of Nasdaq stock screener data."""
 
-    def __init__(self):
+    SCREENER_URL = "https://api.nasdaq.com/api/screener/stocks"
+
+    def __init__(
+        self,
+        offline_snapshot: Optional[str] = None,
+        cache: Optional["ScreenerCache"] = None,
+    ):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        self.offline_snapshot = offline_snapshot
+        if cache is None:
+            from src.screener.cache import ScreenerCache
 
-    def get_stock_screener_data(self) -> pd.DataFrame:
-        """Fetch stock screener data from Nasdaq API."""
-        url = "https://api.nasdaq.com/api/screener/stocks?download=true"
-        logger.info("Fetching data from Nasdaq's stock screener")
+            cache = ScreenerCache()
+        self.cache = cache
 
-        try:
-            import requests
+    def get_stock_screener_data(
+        self, screener_filter: Optional["ScreenerFilter"] = None
+    ) -> "pd.DataFrame":
+        """Fetch stock screener data from Nasdaq API (or an offline snapshot).
+
+        Filters are pushed into the API query where possible and then applied
+        exactly, so discarded instruments never reach the scrapers.
+        """
+        import pandas as pd
+
+        from src.screener.cache import load_screener_snapshot
+
+        if self.offline_snapshot:
+            df = load_screener_snapshot(self.offline_snapshot)
+        else:
+            params = {"download": "true"}
+            if screener_filter is not None:
+                params.update(screener_filter.query_params())
+            url = f"{self.SCREENER_URL}?{urlencode(params)}"
+            logger.info("Fetching data from Nasdaq's stock screener")
+
+            try:
+                data = self.cache.fetch(url, self.headers)
+                logger.info("Data fetched successfully from Nasdaq's stock screener")
+                df = pd.DataFrame(data["data"]["rows"])
+            except Exception as e:
+                logger.error(f"Failed to fetch data from Nasdaq: {e}")
+                raise
+
+        if screener_filter is not None and not screener_filter.is_empty():
+            total = len(df)
+            df = screener_filter.apply(df)
+            logger.info(f"Screener filters kept {len(df)} of {total} instruments")
+        return df
+
+    def iter_stock_screener_chunks(
+        self,
+        screener_filter: Optional["ScreenerFilter"] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> Iterator["pd.DataFrame"]:
+        """Yield the filtered screener in chunks of at most ``chunk_rows`` rows.
 
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            logger.info("Data fetched successfully from Nasdaq's stock screener")
-            return pd.DataFrame(data["data"]["rows"])
-        except Exception as e:
-            logger.error(f"Failed to fetch data from Nasdaq: {e}")
-            raise
+        Offline snapshots are read from disk a chunk at a time. The API
+        returns a single JSON document, so it is downloaded whole and then
+        sliced; its rows are small next to the scraped results.
+        """
+        from src.screener.cache import iter_screener_snapshot
+
+        if not self.offline_snapshot:
+            df = self.get_stock_screener_data(screener_filter)
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start : start + chunk_rows]
+            return
+
+        for chunk in iter_screener_snapshot(self.offline_snapshot, chunk_rows):
+            if screener_filter is not None and not screener_filter.is_empty():
+                chunk = screener_filter.apply(chunk)
+            if len(chunk):
+                yield chunk
 
 
 class DataProcessor:
     """Main data processing class with improved threading and error handling."""
 
-    def __init__(self, max_workers: int = None, batch_size: int = None):
-        # Use configuration or fallback to conservative settings
-        self.max_workers = max_workers or RATE_LIMITING_CONFIG["max_workers"]
+    def __init__(
+        self,
+        max_workers: int = None,
+        batch_size: int = None,
+        nasdaq_processor: Optional[NasdaqDataProcessor] = None,
+        settings: Optional[Settings] = None,
+    ):
+        # Explicit arguments win over the loaded settings
+        self.settings = settings or Settings()
+        self.max_workers = max_workers or self.settings.max_workers
         # If max_workers == 1 we process sequentially so batch_size is not needed;
         # set it to 1 for predictable per-item updates and to avoid large batches.
         if self.max_workers == 1:
             self.batch_size = 1
         else:
-            self.batch_size = batch_size or RATE_LIMITING_CONFIG["batch_size"]
-        self.fetcher = CompanyDetailsFetcher(max_workers=self.max_workers)
-        self.nasdaq_processor = NasdaqDataProcessor()
+            self.batch_size = batch_size or self.settings.window
+        self.fetcher = CompanyDetailsFetcher(
+            max_workers=self.max_workers, settings=self.settings
+        )
+        self.nasdaq_processor = nasdaq_processor or NasdaqDataProcessor()
+        self.gazetteer = None
+        if self.settings.gazetteer:
+            from src.pipeline.geocode import Gazetteer
+
+            self.gazetteer = Gazetteer(self.settings.gazetteer)
+
+    def process_stock_data(
+        self,
+        limit: int = None,
+        deadline: Optional[datetime.datetime] = None,
+        screener_filter: Optional["ScreenerFilter"] = None,
+        sink: Optional["BaseSink"] = None,
+    ) -> "pd.DataFrame":
+        """Process stock data and enrich with company details.
+
+        With a ``sink``, rows are appended to it (normalized and in export
+        column order) as results come out of the fetcher, in completion order.
+
+        When ``deadline`` is given, work is planned to finish before it: sources
+        that do not fit the remaining budget are skipped and no new tickers are
+        started near the deadline. Rows that were not reached keep the detail
+        columns they came with (empty unless an offline snapshot carried them)
+        so everything collected can still be exported.
+        """
+        from src.pipeline.geocode import geocode_headquarters
+        from src.pipeline.normalize import normalize_company_fields
+
+        planner = self._deadline_planner(deadline)
 
-    def process_stock_data(self, limit: int = None) -> pd.DataFrame:
-        """Process stock data and enrich with company details."""
         # Fetch stock data
-        df = self.nasdaq_processor.get_stock_screener_data()
+        with stage("screener download"):
+            df = self.nasdaq_processor.get_stock_screener_data(screener_filter)
 
         if limit:
             df = df.head(limit)
@@ -89,12 +198,120 @@ class DataProcessor:
         # Add new columns for company details
         df = self._add_company_detail_columns(df)
 
-        # Process companies in batches
-        df = self._process_companies_batch(df)
+        # Process companies through the fetcher's sliding window
+        df = self._process_companies_batch(df, planner, sink)
+
+        # Parse scraped strings into typed columns
+        with stage("normalize"):
+            df = normalize_company_fields(df)
+
+        if self.gazetteer is not None:
+            with stage("geocode"):
+                df = geocode_headquarters(df, self.gazetteer)
+
+        if self.settings.classifier:
+            with stage("classify"):
+                df = self._classify_ceos(df, streamed=sink is not None)
 
         return df
 
-    def _add_company_detail_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    def process_stock_data_chunked(
+        self,
+        sink: "BaseSink",
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        limit: int = None,
+        deadline: Optional[datetime.datetime] = None,
+        screener_filter: Optional["ScreenerFilter"] = None,
+    ) -> Dict[str, int]:
+        """Enrich the universe chunk by chunk, writing every row to ``sink``.
+
+        Only one chunk of screener rows and results is held at a time and
+        nothing is kept after it has been streamed, so peak memory depends on
+        ``chunk_rows`` rather than on the size of the universe. Returns the
+        row and filled-field counts used for the summary and run manifest.
+
+        With a ``deadline`` the universe is counted in a first pass, so the
+        planner budgets each ticker against every row still to come rather
+        than only the current chunk. Chunks are still read after the deadline
+        has passed; their rows are written with the detail columns they came
+        with, as in ``process_stock_data``.
+        """
+        import pandas as pd
+
+        from src.observability.manifest import fill_counts
+
+        planner = self._deadline_planner(deadline)
+        if self.settings.classifier:
+            logger.warning("CEO classification is not run in chunked mode")
+        if planner is not None:
+            with stage("screener download"):
+                universe = sum(
+                    len(chunk)
+                    for chunk in self.nasdaq_processor.iter_stock_screener_chunks(
+                        screener_filter, chunk_rows
+                    )
+                )
+            planner.add_backlog(min(universe, limit) if limit else universe)
+
+        counts = Counter(fill_counts(pd.DataFrame()))
+        chunks = self.nasdaq_processor.iter_stock_screener_chunks(screener_filter, chunk_rows)
+        for number, chunk in enumerate(_timed_iter(chunks, "screener download"), 1):
+            if limit:
+                chunk = chunk.head(limit - counts["rows"])
+            if planner is not None:
+                # The chunk's scraped tickers are added back by the fetcher
+                planner.add_backlog(-len(chunk))
+            chunk = self._add_company_detail_columns(chunk)
+            chunk = self._process_companies_batch(chunk, planner, sink)
+            counts.update(fill_counts(chunk))
+            logger.info(f"Chunk {number} done: {counts['rows']} rows written so far")
+            if limit and counts["rows"] >= limit:
+                break
+        return dict(counts)
+
+    def _deadline_planner(self, deadline: Optional[datetime.datetime]) -> Optional[DeadlinePlanner]:
+        if deadline is None:
+            return None
+        planner = DeadlinePlanner(deadline, self.max_workers, self.fetcher.host_throughput)
+        logger.info(
+            f"Deadline mode: {self._format_time(max(0, planner.remaining()))} "
+            f"of scraping budget until {deadline:%Y-%m-%d %H:%M:%S}"
+        )
+        return planner
+
+    def _classify_ceos(
+        self, df: "pd.DataFrame", streamed: bool = False
+    ) -> "pd.DataFrame":
+        """Label CEO names with the configured classifier, reusing cached results."""
+        from src.classify import (
+            ClassificationCache,
+            add_ceo_classification,
+            create_classifier,
+        )
+
+        if streamed:
+            logger.warning(
+                "Rows were streamed before classification; the streamed file has no "
+                "classification columns, but results are cached for the next run"
+            )
+        classifier = create_classifier(
+            self.settings.classifier,
+            self.settings.classifier_model,
+            batch_size=self.settings.classifier_batch_size,
+        )
+        cache = ClassificationCache()
+        try:
+            return add_ceo_classification(
+                df,
+                classifier,
+                cache,
+                batch_size=self.settings.classifier_batch_size,
+                workers=self.settings.classifier_workers,
+            )
+        finally:
+            cache.close()
+
+    def _add_company_detail_columns(self, df: "pd.DataFrame") -> "pd.DataFrame":
         """Add columns for company details."""
         new_columns = {
             "CEO": "",
@@ -112,74 +329,140 @@ class DataProcessor:
 
         return df
 
-    def _process_companies_batch(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Process companies in batches using ThreadPoolExecutor."""
+    def _process_companies_batch(
+        self,
+        df: "pd.DataFrame",
+        planner: Optional[DeadlinePlanner] = None,
+        sink: Optional["BaseSink"] = None,
+    ) -> "pd.DataFrame":
+        """Process companies through the fetcher's sliding window of workers.
+
+        At most ``batch_size`` tickers are queued or in flight at once; a new
+        ticker is started as soon as one finishes, so the pool never idles
+        waiting for a batch's slowest ticker. With ``dedupe_issuers`` only one
+        listing per issuer is scraped and its details are written to every
+        listing of that issuer.
+        """
+        from tqdm import tqdm
+
+        from src.pipeline.result_columns import ResultColumns
+
         total_rows = len(df)
+        listings = self._issuer_listings(df)
         logger.info(
-            f"Processing {total_rows} companies with {self.max_workers} workers"
+            f"Processing {total_rows} companies ({len(listings)} issuers) "
+            f"with {self.max_workers} workers"
         )
 
         start_time = time.time()
         processed_count = 0
-
-        # Process in batches
-        for batch_start in tqdm(
-            range(0, total_rows, self.batch_size), desc="Processing batches"
-        ):
-            batch_end = min(batch_start + self.batch_size, total_rows)
-            batch_df = df.iloc[batch_start:batch_end].copy()
-
-            # Extract tickers for this batch
-            tickers = batch_df["symbol"].tolist()
-
-            # Fetch company details for this batch
-            company_details = self.fetcher.fetch_multiple_companies(tickers)
-
-            # Update DataFrame with fetched details
-            for i, ticker in enumerate(tickers):
-                row_index = batch_start + i
-                if ticker in company_details:
-                    details = company_details[ticker]
-                    self._update_dataframe_row(df, row_index, details)
-                    processed_count += 1
-
-            # Add delay between batches to avoid overwhelming servers
-            if batch_start + self.batch_size < total_rows:
-                logger.info(f"Waiting {RATE_LIMITING_CONFIG['batch_delay']} seconds between batches to avoid rate limiting...")
-                time.sleep(RATE_LIMITING_CONFIG.get('batch_delay', 1))
-
-            # Log progress
-            if processed_count % 10 == 0:
+        symbols = df["symbol"].to_numpy().tolist()
+        representatives = list(listings)
+        results = ResultColumns(df)
+        unstreamed: List[int] = []
+        reached = [False] * total_rows
+        last_streamed = time.monotonic()
+        last_progress = time.monotonic()
+
+        companies = tqdm(
+            self.fetcher.iter_companies(
+                [symbols[position] for position in representatives],
+                window=self.batch_size,
+                planner=planner,
+            ),
+            total=len(representatives),
+            desc="Processing companies",
+        )
+        for issuer, details in _timed_iter(companies, "fetch (waiting on workers)"):
+            positions = listings[representatives[issuer]]
+            with stage("dataframe update"):
+                for position in positions:
+                    results.set_row(position, details)
+                    reached[position] = True
+            processed_count += len(positions)
+            TICKERS_PROCESSED.inc(len(positions))
+            TICKERS_DEDUPLICATED.inc(len(positions) - 1)
+
+            if sink is not None:
+                unstreamed.extend(positions)
+                if (
+                    len(unstreamed) >= sink.flush_rows
+                    or time.monotonic() - last_streamed >= sink.flush_seconds
+                ):
+                    with stage("stream to sink"):
+                        self._stream_rows(df, results, unstreamed, sink)
+                    unstreamed = []
+                    last_streamed = time.monotonic()
+
+            # Log progress on a fixed cadence, independent of throughput
+            if (
+                time.monotonic() - last_progress >= PROGRESS_LOG_SECONDS
+                or processed_count == total_rows
+            ):
+                last_progress = time.monotonic()
                 elapsed_time = time.time() - start_time
-                estimated_total = (
-                    (elapsed_time / processed_count) * total_rows
-                    if processed_count > 0
-                    else 0
-                )
+                estimated_total = (elapsed_time / processed_count) * total_rows
                 remaining_time = estimated_total - elapsed_time
+                responses = HTTP_REQUESTS.value()
+                throttled = HTTP_REQUESTS.value(status="429")
 
                 logger.info(
-                    f"Processed {processed_count}/{total_rows} companies. "
+                    f"Processed {processed_count}/{total_rows} companies "
+                    f"({processed_count / max(elapsed_time, 1e-9):.2f}/s). "
                     f"Elapsed: {self._format_time(elapsed_time)}, "
-                    f"Remaining: {self._format_time(remaining_time)}"
+                    f"Remaining: {self._format_time(remaining_time)}, "
+                    f"429s: {throttled:.0f}/{responses:.0f} responses"
                 )
-
+                checkpoint(f"{processed_count} tickers")
+
+        if sink is not None:
+            # Rows the deadline kept from starting are written with the details
+            # they came with, matching the returned frame and the manifest
+            unstreamed.extend(
+                position for position in range(total_rows) if not reached[position]
+            )
+            with stage("stream to sink"):
+                self._stream_rows(df, results, unstreamed, sink)
+
+        if planner is not None and processed_count < total_rows:
+            logger.warning(
+                f"Deadline reached; processed {processed_count}/{total_rows} "
+                f"companies ({planner.skipped_requests} requests skipped)"
+            )
         logger.info(f"Completed processing {total_rows} companies")
-        return df
+        with stage("dataframe update"):
+            return results.join_into(df)
+
+    def _issuer_listings(self, df: "pd.DataFrame") -> Dict[int, List[int]]:
+        """Row positions of each issuer's listings, keyed by the position to scrape."""
+        from src.screener.issuers import issuer_representatives
 
-    def _update_dataframe_row(
-        self, df: pd.DataFrame, row_index: int, details: CompanyDetails
+        if self.settings.dedupe_issuers and "name" in df.columns:
+            representatives = issuer_representatives(df["symbol"], df["name"]).tolist()
+        else:
+            representatives = range(len(df))
+        listings: Dict[int, List[int]] = {}
+        for position, representative in enumerate(representatives):
+            listings.setdefault(representative, []).append(position)
+        return listings
+
+    def _stream_rows(
+        self,
+        df: "pd.DataFrame",
+        results: "ResultColumns",
+        positions: List[int],
+        sink: "BaseSink",
     ):
-        """Update a DataFrame row with company details."""
-        details_dict = details.to_dict()
+        """Normalize (and geocode) the given finished rows and append them to the sink."""
+        from src.exporters.columns import prepare_export
+        from src.pipeline.geocode import geocode_headquarters
+        from src.pipeline.normalize import normalize_company_fields
 
-        df.at[row_index, "CEO"] = details_dict["ceo"]
-        df.at[row_index, "Employees"] = details_dict["employees"]
-        df.at[row_index, "Headquarters"] = details_dict["headquarters"]
-        df.at[row_index, "Founded"] = details_dict["founded"]
-        df.at[row_index, "Industry"] = details_dict["industry"]
-        df.at[row_index, "Source"] = details_dict["sources"]
-        df.at[row_index, "Source Link"] = details_dict["urls"]
+        if positions:
+            chunk = normalize_company_fields(results.take(df, positions))
+            if self.gazetteer is not None:
+                chunk = geocode_headquarters(chunk, self.gazetteer)
+            sink.write_frame(prepare_export(chunk))
 
     def _format_time(self, seconds: float) -> str:
         """Format time in seconds to human-readable format."""
@@ -193,123 +476,500 @@ class DataExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-    def export_to_csv(self, df: pd.DataFrame, filename: str = None) -> str:
+    def export_to_csv(self, df: "pd.DataFrame", filename: str = None) -> str:
         """Export DataFrame to CSV format."""
+        from src.exporters.columns import prepare_export
+
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"nasdaq_screener_{timestamp}.csv"
 
         filepath = self.output_dir / filename
 
-        # Define columns to export
-        export_columns = [
-            "symbol",
-            "name",
-            "marketCap",
-            "CEO",
-            "Employees",
-            "Headquarters",
-            "Founded",
-            "Industry",
-            "Source",
-            "Source Link",
-        ]
-
-        # Rename columns for export
-        column_mapping = {
-            "symbol": "Symbol",
-            "name": "Name",
-            "marketCap": "Market Capital",
-            "CEO": "CEO",
-            "Employees": "Employees",
-            "Headquarters": "Headquarters",
-            "Founded": "Founded",
-            "Industry": "Industry",
-            "Source": "Source",
-            "Source Link": "Source Link",
-        }
-
-        export_df = df[export_columns].copy()
-        export_df.columns = [column_mapping[col] for col in export_columns]
-
+        export_df = prepare_export(df)
         export_df.to_csv(filepath, index=False)
         logger.info(f"Data exported to CSV: {filepath}")
         return str(filepath)
 
-    def export_to_excel(self, df: pd.DataFrame, filename: str = None) -> str:
+    def export_to_excel(self, df: "pd.DataFrame", filename: str = None) -> str:
         """Export DataFrame to Excel format."""
+        from src.exporters.columns import prepare_export
+        from src.exporters.excel_writer import StreamingExcelWriter
+
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"nasdaq_screener_{timestamp}.xlsx"
 
         filepath = self.output_dir / filename
 
-        # Define columns to export
-        export_columns = [
-            "symbol",
-            "name",
-            "marketCap",
-            "CEO",
-            "Employees",
-            "Headquarters",
-            "Founded",
-            "Industry",
-            "Source",
-            "Source Link",
-        ]
-
-        # Rename columns for export
-        column_mapping = {
-            "symbol": "Symbol",
-            "name": "Name",
-            "marketCap": "Market Capital",
-            "CEO": "CEO",
-            "Employees": "Employees",
-            "Headquarters": "Headquarters",
-            "Founded": "Founded",
-            "Industry": "Industry",
-            "Source": "Source",
-            "Source Link": "Source Link",
-        }
+        # Stream rows through openpyxl's write-only mode in chunks instead of
+        # building the whole workbook in memory with DataFrame.to_excel
+        header = list(prepare_export(df.head(0)).columns)
+        with StreamingExcelWriter(filepath, header) as writer:
+            for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+                writer.write_frame(prepare_export(df.iloc[start : start + EXCEL_CHUNK_ROWS]))
+        logger.info(f"Data exported to Excel: {filepath}")
+        return str(filepath)
 
-        export_df = df[export_columns].copy()
-        export_df.columns = [column_mapping[col] for col in export_columns]
+    def export_to_parquet(
+        self,
+        df: "pd.DataFrame",
+        filename: str = None,
+        compression: str = "zstd",
+        partition_by: Optional[str] = None,
+    ) -> str:
+        """Export DataFrame to Parquet with typed, dictionary-encoded columns.
 
-        export_df.to_excel(filepath, index=False)
-        logger.info(f"Data exported to Excel: {filepath}")
+        With ``partition_by`` (``"snapshot_date"`` or ``"sector"``) the output is
+        a hive-partitioned dataset directory that successive runs add to.
+        """
+        from src.exporters.arrow_export import write_parquet
+
+        if filename is None:
+            if partition_by is None:
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"nasdaq_screener_{timestamp}.parquet"
+            else:
+                filename = f"nasdaq_screener_by_{partition_by}"
+
+        filepath = self.output_dir / filename
+
+        write_parquet(df, filepath, compression=compression, partition_by=partition_by)
+        logger.info(f"Data exported to Parquet: {filepath}")
+        return str(filepath)
+
+    def export_to_arrow(
+        self, df: "pd.DataFrame", filename: str = None, compression: Optional[str] = None
+    ) -> str:
+        """Export DataFrame to an Arrow IPC file (memory-mappable when uncompressed)."""
+        from src.exporters.arrow_export import write_arrow_ipc
+
+        if filename is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"nasdaq_screener_{timestamp}.arrow"
+
+        filepath = self.output_dir / filename
+
+        write_arrow_ipc(df, filepath, compression=compression)
+        logger.info(f"Data exported to Arrow IPC: {filepath}")
+        return str(filepath)
+
+    def open_excel_sink(
+        self, filename: str = None, geocoded: bool = False
+    ) -> "StreamingExcelWriter":
+        """Open a constant-memory Excel writer that rows can be appended to."""
+        from src.exporters.columns import export_header
+        from src.exporters.excel_writer import StreamingExcelWriter
+
+        if filename is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"nasdaq_screener_{timestamp}.xlsx"
+
+        return StreamingExcelWriter(
+            self.output_dir / filename, export_header(include_geocode=geocoded)
+        )
+
+    def open_csv_sink(
+        self,
+        filename: str = None,
+        compression: Optional[str] = None,
+        geocoded: bool = False,
+    ) -> "StreamingCSVSink":
+        """Open a streaming CSV sink that rows can be appended to during a run."""
+        from src.exporters.columns import export_header
+        from src.exporters.csv_sink import StreamingCSVSink
+
+        if filename is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"nasdaq_screener_{timestamp}.csv"
+
+        return StreamingCSVSink(
+            self.output_dir / filename,
+            export_header(include_geocode=geocoded),
+            compression=compression,
+        )
+
+    def export_delta(
+        self,
+        df: "pd.DataFrame",
+        previous: Optional[str] = None,
+        exclude: Optional[str] = None,
+        filename: str = None,
+    ) -> Optional[str]:
+        """Export changes against the previous snapshot as a delta CSV.
+
+        ``previous`` defaults to the newest full snapshot in the output
+        directory other than ``exclude`` (this run's own export). Writes the
+        delta rows to ``nasdaq_screener_delta_<timestamp>.csv`` and the change
+        counts next to it as ``.summary.json``; returns None when there is no
+        snapshot to compare against.
+        """
+        from src.exporters.snapshot_diff import (
+            diff_snapshots,
+            find_previous_snapshot,
+            load_snapshot,
+        )
+
+        if previous is None:
+            previous = find_previous_snapshot(self.output_dir, exclude=exclude)
+            if previous is None:
+                logger.info("No previous snapshot in output/, skipping delta export")
+                return None
+        if filename is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"nasdaq_screener_delta_{timestamp}.csv"
+
+        filepath = self.output_dir / filename
+
+        diff = diff_snapshots(load_snapshot(previous), df)
+        diff.delta.to_csv(filepath, index=False)
+        summary = {"previous_snapshot": str(previous), **diff.summary}
+        summary_path = filepath.with_name(f"{filepath.name}.summary.json")
+        summary_path.write_text(json.dumps(summary, indent=2) + "\n")
+        logger.info(
+            f"Delta against {previous}: {summary['added']} added, "
+            f"{summary['removed']} removed, {summary['changed_symbols']} changed"
+        )
+        logger.info(f"Delta exported to CSV: {filepath}")
         return str(filepath)
 
 
-def main():
+def _timed_iter(iterable, name: str):
+    """Yield from ``iterable``, timing each step as stage ``name``."""
+    iterator = iter(iterable)
+    while True:
+        with stage(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(
+        description="Enrich the Nasdaq screener with company details."
+    )
+    tuning = parser.add_argument_group(
+        "tuning",
+        "Override the config file ($AIE_CONFIG) and AIE_* environment variables.",
+    )
+    tuning.add_argument(
+        "--config",
+        default=None,
+        help="TOML config file, or a profile name in config/ (e.g. laptop, production).",
+    )
+    tuning.add_argument("--max-workers", type=int, default=None)
+    tuning.add_argument(
+        "--window", type=int, default=None, help="Tickers queued or in flight at once."
+    )
+    tuning.add_argument(
+        "--scrapers",
+        default=None,
+        help="Comma-separated scrapers to run, in order (google,cnbc,marketwatch,yahoo,cnn).",
+    )
+    tuning.add_argument(
+        "--reference",
+        default=None,
+        help="Reference index to pre-fill fields from (see python -m src.reference.importers).",
+    )
+    tuning.add_argument(
+        "--gazetteer",
+        default=None,
+        help="GeoNames postal-code file (US.txt or US.zip) to geocode headquarters offline.",
+    )
+    tuning.add_argument(
+        "--classifier",
+        choices=["transformers", "llama_cpp"],
+        default=None,
+        help="Label CEO names with this backend after scraping (needs the ml extra).",
+    )
+    tuning.add_argument(
+        "--classifier-model",
+        default=None,
+        help="Hugging Face model id, or GGUF file path for llama_cpp.",
+    )
+    tuning.add_argument(
+        "--no-issuer-dedup",
+        dest="dedupe_issuers",
+        action="store_const",
+        const=False,
+        default=None,
+        help="Scrape every listing instead of one per issuer (share classes, warrants, units).",
+    )
+    tuning.add_argument(
+        "--negative-cache",
+        default=None,
+        metavar="PATH",
+        help=(
+            "SQLite file of (source, ticker) pairs that yielded nothing and are skipped "
+            "until they expire, e.g. .cache/negative_cache.sqlite (default: off)."
+        ),
+    )
+    tuning.add_argument(
+        "--rate", type=float, default=None, help="Requests per second per host (0: unpaced)."
+    )
+    tuning.add_argument(
+        "--burst", type=int, default=None, help="Back-to-back requests allowed per host."
+    )
+    tuning.add_argument(
+        "--host-concurrency",
+        dest="concurrency",
+        type=int,
+        default=None,
+        help="Maximum simultaneous requests per host.",
+    )
+    tuning.add_argument("--timeout", type=float, default=None, help="Request timeout in seconds.")
+    tuning.add_argument(
+        "--max-retries", type=int, default=None, help="Attempts per request."
+    )
+    parser.add_argument(
+        "--deadline",
+        type=parse_deadline,
+        default=None,
+        help=(
+            "Finish scraping by this time: a duration (90m, 2h, 5400) or a "
+            "clock/ISO time (05:30, 2025-09-01T05:30)."
+        ),
+    )
+    parser.add_argument(
+        "--offline",
+        nargs="?",
+        const="input/nasdaq_screener_*.csv",
+        default=None,
+        metavar="SNAPSHOT",
+        help=(
+            "Read the screener from a local snapshot CSV instead of the Nasdaq "
+            "API (default: newest input/nasdaq_screener_*.csv)."
+        ),
+    )
+    parser.add_argument("--min-market-cap", type=float, default=None)
+    parser.add_argument("--max-market-cap", type=float, default=None)
+    parser.add_argument(
+        "--country", action="append", default=[], help="Keep only this country (repeatable)."
+    )
+    parser.add_argument(
+        "--sector", action="append", default=[], help="Keep only this sector (repeatable)."
+    )
+    parser.add_argument(
+        "--security-type",
+        action="append",
+        default=[],
+        choices=["common", "preferred", "ads", "warrant", "unit", "right", "other"],
+        help="Keep only this security type (repeatable).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "excel", "parquet", "arrow"],
+        default=os.getenv("OUTPUT_FORMAT", "csv").lower(),
+        help="Output format (default: $OUTPUT_FORMAT or csv).",
+    )
+    parser.add_argument(
+        "--partition-by",
+        choices=["snapshot_date", "sector"],
+        default=None,
+        help="Write Parquet as a dataset partitioned by this key.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Write rows as they are scraped: CSV to a tail-able .partial file, "
+            "or Excel (--format excel) through a constant-memory writer."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Read and enrich the universe N rows at a time, streaming each chunk to "
+            f"the output (implies --stream; e.g. {DEFAULT_CHUNK_ROWS}). Memory stays "
+            "flat however many tickers there are."
+        ),
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Compress the streamed CSV.",
+    )
+    parser.add_argument(
+        "--delta",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="SNAPSHOT",
+        help=(
+            "Also write the changes since a previous export (default: the newest "
+            "snapshot in output/) to output/nasdaq_screener_delta_<timestamp>.csv."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics during the run.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=["sample", "cprofile"],
+        default=None,
+        help=(
+            "Profile the run (sampling by default, or deterministic cProfile) and "
+            "write a stage breakdown to output/profile_<timestamp>.txt."
+        ),
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Take tracemalloc snapshots during the run and report top allocators.",
+    )
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const=f"output/trace_{datetime.datetime.now():%Y%m%d_%H%M%S}.jsonl",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Record per-ticker spans (scrapers, HTTP attempts, backoff, parse) "
+            "as OTLP/JSON lines (default: output/trace_<timestamp>.jsonl)."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function."""
+    from src.exporters.snapshot_diff import load_snapshot
+    from src.observability.manifest import (
+        build_run_manifest,
+        fill_counts,
+        write_run_manifest,
+    )
+    from src.screener.filters import ScreenerFilter
+
+    args = _parse_args(argv)
+    started_at = datetime.datetime.now().astimezone()
+    if args.metrics_port is not None:
+        start_metrics_server(args.metrics_port)
+    if args.trace:
+        configure_tracing(args.trace)
+    profiler = None
+    processor = None
+    if args.profile or args.tracemalloc:
+        profiler = RunProfiler(args.profile, trace_allocations=args.tracemalloc)
+        profiler.start()
     try:
-            # Initialize processors with configuration settings
-        processor = DataProcessor()
+        # Defaults, then config file, then AIE_* env vars, then flags
+        settings = load_settings(
+            args.config,
+            overrides={
+                name: getattr(args, name)
+                for name in (
+                    "max_workers", "window", "scrapers", "reference", "gazetteer", "classifier",
+                    "classifier_model", "dedupe_issuers", "negative_cache", "rate", "burst",
+                    "concurrency", "timeout", "max_retries",
+                )
+            },
+        )
+        processor = DataProcessor(
+            nasdaq_processor=NasdaqDataProcessor(offline_snapshot=args.offline),
+            settings=settings,
+        )
         exporter = DataExporter()
+        screener_filter = ScreenerFilter(
+            min_market_cap=args.min_market_cap,
+            max_market_cap=args.max_market_cap,
+            countries=tuple(args.country),
+            sectors=tuple(args.sector),
+            security_types=tuple(args.security_type),
+        )
 
         # Process stock data with optional test limit
         logger.info("Starting stock data processing...")
-        limit = RATE_LIMITING_CONFIG["test_limit"] if RATE_LIMITING_CONFIG["test_mode"] else None
-        df = processor.process_stock_data(limit=limit)
-
-        # Export a single CSV result
-        csv_file = exporter.export_to_csv(df)
+        limit = settings.test_limit if settings.test_mode else None
+        df = None
+        counts = None
+        if args.stream or args.chunk_rows:
+            geocoded = processor.gazetteer is not None
+            if args.format == "excel":
+                sink = exporter.open_excel_sink(geocoded=geocoded)
+            else:
+                sink = exporter.open_csv_sink(compression=args.compression, geocoded=geocoded)
+            with sink:
+                if args.chunk_rows:
+                    counts = processor.process_stock_data_chunked(
+                        sink,
+                        chunk_rows=args.chunk_rows,
+                        limit=limit,
+                        deadline=args.deadline,
+                        screener_filter=screener_filter,
+                    )
+                else:
+                    df = processor.process_stock_data(
+                        limit=limit,
+                        deadline=args.deadline,
+                        screener_filter=screener_filter,
+                        sink=sink,
+                    )
+            output_file = str(sink.path)
+        else:
+            df = processor.process_stock_data(
+                limit=limit, deadline=args.deadline, screener_filter=screener_filter
+            )
+
+            # Export a single result file
+            with stage("export"):
+                if args.format == "excel":
+                    output_file = exporter.export_to_excel(df)
+                elif args.format == "parquet":
+                    output_file = exporter.export_to_parquet(df, partition_by=args.partition_by)
+                elif args.format == "arrow":
+                    output_file = exporter.export_to_arrow(df)
+                else:
+                    output_file = exporter.export_to_csv(df)
 
         logger.info("Processing completed successfully!")
-        logger.info(f"Results saved to: {csv_file}")
+        logger.info(f"Results saved to: {output_file}")
+
+        if args.delta is not None:
+            with stage("delta"):
+                # Chunked runs kept no frame; only the compared columns are re-read
+                current = df if df is not None else load_snapshot(output_file)
+                exporter.export_delta(current, previous=args.delta or None, exclude=output_file)
+
+        config = {
+            "args": vars(args),
+            "settings": asdict(settings),
+            "max_workers": processor.max_workers,
+            "window": processor.batch_size,
+        }
+        write_run_manifest(
+            build_run_manifest(
+                df,
+                config,
+                started_at,
+                datetime.datetime.now().astimezone(),
+                output_file,
+                counts=counts,
+            ),
+            output_file,
+        )
 
         # Print summary
-        total_companies = len(df)
-        companies_with_ceo = len(df[df["CEO"].notna() & (df["CEO"] != "")])
-        companies_with_employees = len(
-            df[df["Employees"].notna() & (df["Employees"] != "")]
-        )
-        companies_with_headquarters = len(
-            df[df["Headquarters"].notna() & (df["Headquarters"] != "")]
-        )
+        counts = counts if counts is not None else fill_counts(df)
+        total_companies = max(counts["rows"], 1)
+        companies_with_ceo = counts["ceo"]
+        companies_with_employees = counts["employees"]
+        companies_with_headquarters = counts["headquarters"]
 
         logger.info(f"Summary:")
-        logger.info(f"  Total companies processed: {total_companies}")
+        logger.info(f"  Total companies processed: {counts['rows']}")
         logger.info(
             f"  Companies with CEO info: {companies_with_ceo} ({companies_with_ceo/total_companies*100:.1f}%)"
         )
@@ -325,6 +985,16 @@ def main():
     except Exception as e:
         logger.error(f"An error occurred during processing: {e}")
         raise
+    finally:
+        shutdown_tracing()
+        if profiler is not None:
+            # Let the fetch workers exit first so no thread outlives its profile
+            if processor is not None:
+                processor.fetcher.close()
+            profiler.stop()
+            profiler.write_report(
+                Path("output") / f"profile_{datetime.datetime.now():%Y%m%d_%H%M%S}.txt"
+            )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # Scrapers package
 
 from .base import BaseScraper  # noqa: F401
+from .negative_cache import NegativeCache  # noqa: F401
 from .google_finance import GoogleFinanceScraper  # noqa: F401
 from .cnbc import CNBCScraper  # noqa: F401
 from .cnn_money import CNNScraper  # noqa: F401
@@ -8,3 +9,12 @@ from .marketwatch import MarketWatchScraper  # noqa: F401
 from .yahoo_finance import YahooFinanceScraper  # noqa: F401
 
 
+
+# Scraper names accepted in config files and --scrapers, in default order
+SCRAPERS = {
+    "google": GoogleFinanceScraper,
+    "cnbc": CNBCScraper,
+    "marketwatch": MarketWatchScraper,
+    "yahoo": YahooFinanceScraper,
+    "cnn": CNNScraper,
+}
@@ -1,22 +1,132 @@
+import time
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 
 from src.http.http_client import HTTPClient
-from src.models.company_details import CompanyDetails
+from src.models.company_details import DETAIL_FIELDS, CompanyDetails
+from src.models.source_registry import SOURCES
+from src.observability.metrics import DEAD_ENDS, FIELDS_FILLED, PARSE_LATENCY, SCRAPES_SKIPPED
+from src.observability.tracing import span
+from src.scrapers.negative_cache import MISS_EMPTY, MISS_NOT_FOUND, MISS_SOFT_404, NegativeCache
+
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup
 
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
 
-    def __init__(self, http_client: HTTPClient):
+    # Pages the scraper reads, formatted with ``ticker``; each template is
+    # registered as a source so results only need to store a bitmask.
+    url_templates: tuple[str, ...] = ()
+    # Host the scraper sends its requests to; used for per-host accounting
+    host: str = ""
+    # CompanyDetails fields the scraper can fill; it is skipped once all are set
+    fields: tuple[str, ...] = ()
+    # Fingerprints of the page a source serves with a 200 for unknown symbols:
+    # text in the body, or a path the request is redirected to
+    soft_404_markers: tuple[bytes, ...] = ()
+    soft_404_paths: tuple[str, ...] = ()
+    # Text found only on the source's real profile page; a page without any
+    # fields is cached as empty only if it has one of these, so consent walls,
+    # captchas and layout changes are retried on the next run
+    profile_markers: tuple[bytes, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._source_bits = tuple(
+            SOURCES.register(cls.__name__, template) for template in cls.url_templates
+        )
+        if cls.url_templates and not cls.host:
+            cls.host = urlparse(cls.url_templates[0]).hostname or ""
+
+    def __init__(self, http_client: HTTPClient, negative_cache: Optional[NegativeCache] = None):
         self.http_client = http_client
+        self.negative_cache = negative_cache
 
     @abstractmethod
     def scrape(self, ticker: str, company_details: CompanyDetails) -> CompanyDetails:
         """Scrape company details from the source."""
         raise NotImplementedError
 
-    def _add_source(self, company_details: CompanyDetails, url: str):
-        company_details.sources.add(self.__class__.__name__)
-        company_details.urls.add(url)
+    def _url(self, ticker: str, variant: int = 0) -> str:
+        return self.url_templates[variant].format(ticker=ticker)
+
+    def _add_source(self, company_details: CompanyDetails, variant: int = 0):
+        company_details.add_source(self._source_bits[variant])
+
+    def _scrape_page(self, ticker: str, company_details: CompanyDetails, variant: int = 0) -> bool:
+        """Fetch and parse one page of the source; return True if it filled anything.
+
+        Pages known to have nothing for ``ticker`` are not requested. A 404,
+        a soft-404 page or a recognized profile page without any of
+        ``fields`` is recorded in the negative cache; rate limits, server
+        errors and unrecognized pages are not.
+        """
+        source = self.__class__.__name__
+        key = source if len(self.url_templates) == 1 else f"{source}#{variant}"
+        if self.negative_cache is not None and self.negative_cache.is_dead(key, ticker):
+            SCRAPES_SKIPPED.inc(source=source, reason="negative cache")
+            return False
+
+        response = self.http_client.get(self._url(ticker, variant))
+        if not response:
+            if self.http_client.last_status in (404, 410):
+                self._record_miss(key, ticker, MISS_NOT_FOUND)
+            return False
+        if self._is_soft_404(response):
+            self._record_miss(key, ticker, MISS_SOFT_404)
+            return False
+
+        had_fields = any(getattr(company_details, field) is not None for field in self.fields)
+        if self._parse_response(response, company_details):
+            self._add_source(company_details, variant)
+            return True
+        if not had_fields and self._is_profile_page(response):
+            self._record_miss(key, ticker, MISS_EMPTY)
+        return False
+
+    def _is_soft_404(self, response: "requests.Response") -> bool:
+        final_url = getattr(response, "url", "") or ""
+        if any(path in final_url for path in self.soft_404_paths):
+            return True
+        return any(marker in response.content for marker in self.soft_404_markers)
+
+    def _is_profile_page(self, response: "requests.Response") -> bool:
+        return any(marker in response.content for marker in self.profile_markers)
+
+    def _record_miss(self, key: str, ticker: str, reason: str):
+        DEAD_ENDS.inc(source=self.__class__.__name__, reason=reason)
+        if self.negative_cache is not None:
+            self.negative_cache.record(key, ticker, reason)
+
+    def _parse(self, soup: "BeautifulSoup", company_details: CompanyDetails) -> bool:
+        """Fill missing fields from a parsed page; return True if any were found."""
+        raise NotImplementedError
 
+    def _parse_response(
+        self, response: "requests.Response", company_details: CompanyDetails
+    ) -> bool:
+        """Parse a fetched page, recording parse time and fields filled per source."""
+        # bs4 is only needed once pages come back; importing it here keeps
+        # ``import src.scrapers`` cheap for CLI tools and pool workers
+        from bs4 import BeautifulSoup
 
+        source = self.__class__.__name__
+        before = [getattr(company_details, field) for field in DETAIL_FIELDS]
+        with span("parse", source=source) as parse_span:
+            parse_start = time.perf_counter()
+            soup = BeautifulSoup(response.content, "html.parser")
+            found = self._parse(soup, company_details)
+            PARSE_LATENCY.observe(time.perf_counter() - parse_start, source=source)
+            filled = [
+                field
+                for field, value in zip(DETAIL_FIELDS, before)
+                if value is None and getattr(company_details, field) is not None
+            ]
+            parse_span.set_attribute("fields.filled", ",".join(filled))
+        for field in filled:
+            FIELDS_FILLED.inc(source=source, field=field)
+        return found
@@ -1,22 +1,24 @@
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 from src.models.company_details import CompanyDetails
 from src.scrapers.base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class CNBCScraper(BaseScraper):
     """Scraper for CNBC."""
 
+    url_templates = ("https://www.cnbc.com/quotes/{ticker}",)
+    fields = ("ceo", "headquarters")
+    profile_markers = (b'class="CompanyProfile-',)
+
     def scrape(self, ticker: str, company_details: CompanyDetails) -> CompanyDetails:
-        url = f"https://www.cnbc.com/quotes/{ticker}"
-        response = self.http_client.get(url)
-        if response:
-            soup = BeautifulSoup(response.content, "html.parser")
-            if self._parse(soup, company_details):
-                self._add_source(company_details, url)
+        self._scrape_page(ticker, company_details)
         return company_details
 
-    def _parse(self, soup: BeautifulSoup, company_details: CompanyDetails) -> bool:
+    def _parse(self, soup: "BeautifulSoup", company_details: CompanyDetails) -> bool:
         found = False
         officer_divs = soup.find_all("div", {"class": "CompanyProfile-officer"})
         if officer_divs and not company_details.ceo:
@@ -1,22 +1,24 @@
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 from src.models.company_details import CompanyDetails
 from src.scrapers.base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class CNNScraper(BaseScraper):
     """Scraper for CNN Money."""
 
+    url_templates = ("https://money.cnn.com/quote/profile/profile.html?symb={ticker}",)
+    fields = ("ceo", "headquarters", "industry")
+    profile_markers = (b'class="wsod_DataColumnRight"',)
+
     def scrape(self, ticker: str, company_details: CompanyDetails) -> CompanyDetails:
-        url = f"https://money.cnn.com/quote/profile/profile.html?symb={ticker}"
-        response = self.http_client.get(url)
-        if response:
-            soup = BeautifulSoup(response.content, "html.parser")
-            if self._parse(soup, company_details):
-                self._add_source(company_details, url)
+        self._scrape_page(ticker, company_details)
         return company_details
 
-    def _parse(self, soup: BeautifulSoup, company_details: CompanyDetails) -> bool:
+    def _parse(self, soup: "BeautifulSoup", company_details: CompanyDetails) -> bool:
         found = False
 
         ceo_div = soup.find("div", {"class": "wsod_DataColumnRight"})
@@ -1,25 +1,43 @@
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Optional, Sequence
 
+from src.http.http_client import HTTPClient
 from src.models.company_details import CompanyDetails
 from src.scrapers.base import BaseScraper
+from src.scrapers.negative_cache import NegativeCache
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 
 class GoogleFinanceScraper(BaseScraper):
     """Scraper for Google Finance."""
 
+    url_templates = (
+        "https://www.google.com/finance/quote/{ticker}:NASDAQ?hl=en",
+        "https://www.google.com/finance/quote/{ticker}:NYSE?hl=en",
+    )
+    fields = ("ceo", "employees", "headquarters", "founded")
+    # Served with a 200 when the symbol is not listed on that exchange
+    soft_404_markers = (b"We couldn't find any match for your search",)
+    profile_markers = (b'class="gyFHrc"',)
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        variants: Sequence[int] | None = None,
+        negative_cache: Optional[NegativeCache] = None,
+    ):
+        super().__init__(http_client, negative_cache)
+        # Exchange pages to try, as indexes into ``url_templates``
+        self.variants = tuple(range(len(self.url_templates)) if variants is None else variants)
+
     def scrape(self, ticker: str, company_details: CompanyDetails) -> CompanyDetails:
-        exchanges = ["NASDAQ", "NYSE"]
-        for exchange in exchanges:
-            url = f"https://www.google.com/finance/quote/{ticker}:{exchange}?hl=en"
-            response = self.http_client.get(url)
-            if response:
-                soup = BeautifulSoup(response.content, "html.parser")
-                if self._parse(soup, company_details):
-                    self._add_source(company_details, url)
-                    break
+        for variant in self.variants:
+            if self._scrape_page(ticker, company_details, variant):
+                break
         return company_details
 
-    def _parse(self, soup: BeautifulSoup, company_details: CompanyDetails) -> bool:
+    def _parse(self, soup: "BeautifulSoup", company_details: CompanyDetails) -> bool:
         found = False
         divs = soup.body.find_all("div", attrs={"class": "gyFHrc"})
         for div in divs:
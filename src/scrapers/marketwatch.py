@@ -1,24 +1,28 @@
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 from src.models.company_details import CompanyDetails
 from src.scrapers.base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class MarketWatchScraper(BaseScraper):
     """Scraper for MarketWatch."""
 
+    url_templates = (
+        "https://www.marketwatch.com/investing/stock/{ticker}/company-profile",
+    )
+    fields = ("ceo", "headquarters", "industry", "employees")
+    # Unknown symbols land on the search results page
+    soft_404_paths = ("/search?",)
+    profile_markers = (b'class="kv__item',)
+
     def scrape(self, ticker: str, company_details: CompanyDetails) -> CompanyDetails:
-        url = (
-            f"https://www.marketwatch.com/investing/stock/{ticker}/company-profile"
-        )
-        response = self.http_client.get(url)
-        if response:
-            soup = BeautifulSoup(response.content, "html.parser")
-            if self._parse(soup, company_details):
-                self._add_source(company_details, url)
+        self._scrape_page(ticker, company_details)
         return company_details
 
-    def _parse(self, soup: BeautifulSoup, company_details: CompanyDetails) -> bool:
+    def _parse(self, soup: "BeautifulSoup", company_details: CompanyDetails) -> bool:
         found = False
 
         ceo_divs = soup.find_all("div", {"class": "element element--list"})
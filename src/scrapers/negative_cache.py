@@ -0,0 +1,73 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_NEGATIVE_CACHE_PATH = ".cache/negative_cache.sqlite"
+DEFAULT_TTL_DAYS = 14.0
+
+# Why a (source, ticker) pair is a dead end
+MISS_NOT_FOUND = "not found"  # HTTP 404/410
+MISS_SOFT_404 = "soft 404"  # 200 page recognized as a "no such symbol" page
+MISS_EMPTY = "empty"  # recognized profile page without any of the source's fields
+
+
+class NegativeCache:
+    """Persistent record of (source, ticker) pairs that yielded nothing.
+
+    Entries expire after ``ttl_days`` so listings that gain a profile are
+    picked up again. Unexpired entries are loaded into memory when the cache
+    is opened, so lookups during a run do not touch SQLite; new misses are
+    written through straight away.
+    """
+
+    def __init__(
+        self, path: str | Path = DEFAULT_NEGATIVE_CACHE_PATH, ttl_days: float = DEFAULT_TTL_DAYS
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS miss ("
+                " source TEXT NOT NULL, ticker TEXT NOT NULL, reason TEXT NOT NULL,"
+                " expires REAL NOT NULL, PRIMARY KEY (source, ticker)) WITHOUT ROWID"
+            )
+            self._connection.execute("DELETE FROM miss WHERE expires <= ?", (time.time(),))
+        self._expires: Dict[Tuple[str, str], float] = {
+            (source, ticker): expires
+            for source, ticker, expires in self._connection.execute(
+                "SELECT source, ticker, expires FROM miss"
+            )
+        }
+        logger.info(f"Loaded {len(self._expires)} known dead ends from {self.path}")
+
+    def is_dead(self, source: str, ticker: str) -> bool:
+        """True if ``source`` had nothing for ``ticker`` and the entry has not expired."""
+        expires = self._expires.get((source, ticker))
+        return expires is not None and expires > time.time()
+
+    def record(self, source: str, ticker: str, reason: str):
+        """Remember that ``source`` has nothing for ``ticker`` until the TTL passes."""
+        expires = time.time() + self.ttl
+        with self._lock, self._connection:
+            self._expires[(source, ticker)] = expires
+            self._connection.execute(
+                "INSERT OR REPLACE INTO miss VALUES (?, ?, ?, ?)", (source, ticker, reason, expires)
+            )
+
+    def __len__(self) -> int:
+        now = time.time()
+        return sum(expires > now for expires in self._expires.values())
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -1,22 +1,27 @@
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 from src.models.company_details import CompanyDetails
 from src.scrapers.base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class YahooFinanceScraper(BaseScraper):
     """Scraper for Yahoo Finance."""
 
+    url_templates = ("https://finance.yahoo.com/quote/{ticker}/profile/",)
+    fields = ("ceo", "industry", "employees", "headquarters")
+    # Unknown symbols are redirected to the symbol lookup page
+    soft_404_paths = ("/lookup",)
+    soft_404_markers = (b"<title>Symbol Lookup from Yahoo Finance",)
+    profile_markers = (b"asset-profile-container",)
+
     def scrape(self, ticker: str, company_details: CompanyDetails) -> CompanyDetails:
-        url = f"https://finance.yahoo.com/quote/{ticker}/profile/"
-        response = self.http_client.get(url)
-        if response:
-            soup = BeautifulSoup(response.content, "html.parser")
-            if self._parse(soup, company_details):
-                self._add_source(company_details, url)
+        self._scrape_page(ticker, company_details)
         return company_details
 
-    def _parse(self, soup: BeautifulSoup, company_details: CompanyDetails) -> bool:
+    def _parse(self, soup: "BeautifulSoup", company_details: CompanyDetails) -> bool:
         found = False
 
         ceo_data_table_body = soup.find_all("tbody")
@@ -0,0 +1,7 @@
+
+
+# Screener package
+
+from .cache import ScreenerCache, iter_screener_snapshot, load_screener_snapshot  # noqa: F401
+from .filters import ScreenerFilter, classify_security_types  # noqa: F401
+from .issuers import issuer_representatives  # noqa: F401
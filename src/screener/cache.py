@@ -0,0 +1,141 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import pandas as pd
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a cached screener payload is used without revalidating it
+SCREENER_MAX_AGE = 6 * 3600
+SCREENER_TIMEOUT = 30
+
+# Exported snapshot column -> screener API column
+SNAPSHOT_COLUMNS = {
+    "Symbol": "symbol",
+    "Name": "name",
+    "Market Capital": "marketCap",
+}
+
+
+class ScreenerCache:
+    """On-disk cache of screener payloads with HTTP revalidation.
+
+    Payloads are stored per URL alongside their ``ETag``/``Last-Modified``
+    validators. Fresh entries are served without a request; stale ones are
+    revalidated with a conditional GET, and if the network fails the stale
+    copy is used rather than aborting the run.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/screener", max_age: float = SCREENER_MAX_AGE):
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+
+    def fetch(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """Return the JSON payload for ``url``, downloading only when needed."""
+        payload_path, meta_path = self._paths(url)
+        meta = self._read_meta(meta_path) if payload_path.exists() else None
+
+        if meta and time.time() - meta.get("fetched_at", 0) < self.max_age:
+            logger.info(f"Using cached screener data from {payload_path}")
+            return json.loads(payload_path.read_text())
+
+        request_headers = dict(headers)
+        if meta:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = requests.get(url, headers=request_headers, timeout=SCREENER_TIMEOUT)
+            if response.status_code == 304 and meta:
+                logger.info("Cached screener data is still current (304)")
+                meta["fetched_at"] = time.time()
+                self._write_json(meta_path, meta)
+                return json.loads(payload_path.read_text())
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.exceptions.RequestException, ValueError) as error:
+            if meta:
+                logger.warning(f"Screener download failed ({error}); using stale cache")
+                return json.loads(payload_path.read_text())
+            raise
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_json(payload_path, payload)
+        self._write_json(
+            meta_path,
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            },
+        )
+        return payload
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        return (
+            self.cache_dir / f"screener_{key}.json",
+            self.cache_dir / f"screener_{key}.meta.json",
+        )
+
+    @staticmethod
+    def _read_meta(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, path)
+
+
+def load_screener_snapshot(path: str = "input/nasdaq_screener_*.csv") -> pd.DataFrame:
+    """Load a screener snapshot CSV for offline runs.
+
+    ``path`` may be a glob, in which case the lexicographically last match
+    (the newest timestamped snapshot) is used. Exported column names are mapped
+    back to the screener API names; previously scraped columns are kept.
+    """
+    snapshot = _resolve_snapshot(path)
+    logger.info(f"Offline mode: loading screener snapshot {snapshot}")
+    df = pd.read_csv(snapshot, dtype=str, keep_default_na=False)
+    return df.rename(columns=SNAPSHOT_COLUMNS)
+
+
+def iter_screener_snapshot(
+    path: str = "input/nasdaq_screener_*.csv", chunk_rows: int = 10_000
+) -> Iterator[pd.DataFrame]:
+    """Read a screener snapshot CSV ``chunk_rows`` rows at a time.
+
+    Same column handling as ``load_screener_snapshot``, but only one chunk is
+    in memory at once, however large the file is.
+    """
+    snapshot = _resolve_snapshot(path)
+    logger.info(f"Offline mode: reading screener snapshot {snapshot} in chunks of {chunk_rows}")
+    with pd.read_csv(
+        snapshot, dtype=str, keep_default_na=False, chunksize=chunk_rows
+    ) as reader:
+        for chunk in reader:
+            yield chunk.rename(columns=SNAPSHOT_COLUMNS)
+
+
+def _resolve_snapshot(path: str) -> str:
+    matches = sorted(glob.glob(path))
+    if not matches:
+        raise FileNotFoundError(f"No screener snapshot matches {path!r}")
+    return matches[-1]
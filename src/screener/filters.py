@@ -0,0 +1,129 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Nasdaq screener market-cap tiers (lower bound inclusive, upper exclusive)
+MARKET_CAP_TIERS = {
+    "mega": (200e9, np.inf),
+    "large": (10e9, 200e9),
+    "mid": (2e9, 10e9),
+    "small": (300e6, 2e9),
+    "micro": (50e6, 300e6),
+    "nano": (0, 50e6),
+}
+
+# Security type -> pattern over the screener "name" column, checked in order
+SECURITY_TYPE_PATTERNS: Dict[str, re.Pattern] = {
+    "warrant": re.compile(r"\bwarrants?\b", re.IGNORECASE),
+    "right": re.compile(r"\brights?\b", re.IGNORECASE),
+    "unit": re.compile(r"\bunits?\b", re.IGNORECASE),
+    "preferred": re.compile(
+        r"\bpreferred\b|\bpref\b|\d+(?:\.\d+)?%|\bnotes? due\b|\bdebentures?\b",
+        re.IGNORECASE,
+    ),
+    "ads": re.compile(
+        r"\bamerican depositary\b|\bdepositary (?:shares?|receipts?)\b|\bADS\b|\bADR\b",
+        re.IGNORECASE,
+    ),
+    "common": re.compile(
+        r"\bcommon (?:stock|shares?)\b|\bordinary shares?\b|\bclass [a-z] (?:common|ordinary)\b",
+        re.IGNORECASE,
+    ),
+}
+
+
+def classify_security_types(names: pd.Series) -> pd.Series:
+    """Classify screener names into security types (``"other"`` if unknown)."""
+    names = names.fillna("").astype(str)
+    types = pd.Series("other", index=names.index, dtype=object)
+    unassigned = np.ones(len(names), dtype=bool)
+    for security_type, pattern in SECURITY_TYPE_PATTERNS.items():
+        matches = names.str.contains(pattern).to_numpy() & unassigned
+        types[matches] = security_type
+        unassigned &= ~matches
+    return types.astype("category")
+
+
+def parse_market_cap(values: pd.Series) -> pd.Series:
+    """Parse screener market-cap strings (``"35695573720.00"``, ``"1,234"``)."""
+    cleaned = values.astype("string").str.replace(r"[,$\s]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+@dataclass(frozen=True)
+class ScreenerFilter:
+    """Filters applied to the screener before any scraping is scheduled.
+
+    ``query_params`` pushes what the Nasdaq API can express (tiers, country,
+    sector) into the request so fewer rows are downloaded; ``apply`` then
+    enforces the exact bounds locally, including on offline snapshots.
+    """
+
+    min_market_cap: float | None = None
+    max_market_cap: float | None = None
+    countries: Tuple[str, ...] = ()
+    sectors: Tuple[str, ...] = ()
+    security_types: Tuple[str, ...] = ()
+
+    def is_empty(self) -> bool:
+        return not (
+            self.min_market_cap is not None
+            or self.max_market_cap is not None
+            or self.countries
+            or self.sectors
+            or self.security_types
+        )
+
+    def query_params(self) -> Dict[str, str]:
+        """Nasdaq screener API parameters equivalent to (a superset of) this filter."""
+        params: Dict[str, str] = {}
+        if self.countries:
+            params["country"] = "|".join(self._slug(c) for c in self.countries)
+        if self.sectors:
+            params["sector"] = "|".join(self._slug(s) for s in self.sectors)
+        if self.min_market_cap is not None or self.max_market_cap is not None:
+            low = self.min_market_cap or 0
+            high = np.inf if self.max_market_cap is None else self.max_market_cap
+            tiers = [
+                tier
+                for tier, (tier_low, tier_high) in MARKET_CAP_TIERS.items()
+                if tier_low <= high and tier_high > low
+            ]
+            if len(tiers) < len(MARKET_CAP_TIERS):
+                params["marketcap"] = "|".join(tiers)
+        return params
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the rows of a screener frame that pass the filter."""
+        keep = np.ones(len(df), dtype=bool)
+
+        if self.min_market_cap is not None or self.max_market_cap is not None:
+            market_cap = parse_market_cap(df["marketCap"])
+            if self.min_market_cap is not None:
+                keep &= (market_cap >= self.min_market_cap).fillna(False).to_numpy()
+            if self.max_market_cap is not None:
+                keep &= (market_cap <= self.max_market_cap).fillna(False).to_numpy()
+
+        for column, wanted in (("country", self.countries), ("sector", self.sectors)):
+            if not wanted:
+                continue
+            if column not in df.columns:
+                raise ValueError(
+                    f"Cannot filter on {column}: the screener data has no {column!r} column"
+                )
+            values = df[column].fillna("").astype(str).str.strip().str.lower()
+            keep &= values.isin([w.lower() for w in wanted]).to_numpy()
+
+        if self.security_types:
+            types = classify_security_types(df["name"])
+            keep &= types.isin(self.security_types).to_numpy()
+
+        return df[keep].reset_index(drop=True)
+
+    @staticmethod
+    def _slug(value: str) -> str:
+        return re.sub(r"[^a-z0-9]+", "_", value.strip().lower()).strip("_")
@@ -0,0 +1,90 @@
+import re
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from src.screener.filters import classify_security_types
+
+
+# Where the security description starts in a screener name
+# ("Alphabet Inc. Class A Common Stock" -> "Alphabet Inc.")
+SECURITY_DESCRIPTION = re.compile(
+    r"\b(?:class [a-z]|series [a-z0-9]+|common|ordinary|capital stock|subordinate"
+    r"|voting|redeemable|warrants?|units?|rights?|depositary|american depositary"
+    r"|ads|adr|preferred|senior|notes?|each|shares?)\b|\d+(?:\.\d+)?%",
+    re.IGNORECASE,
+)
+_NON_WORD = re.compile(r"[^\w]+")
+
+# Separators between a root symbol and its class or series (BRK/B, BAC^K, BF.B)
+_SYMBOL_SEPARATOR = re.compile(r"[/^.\-= ]")
+# Suffix letters the exchanges append to the issuer's root symbol
+SECURITY_TYPE_SUFFIXES = {"warrant": ("WS", "W"), "unit": ("U",), "right": ("R",)}
+
+# Which listing of an issuer gets scraped: lower ranks first, then the shortest symbol
+REPRESENTATIVE_RANK = {
+    "common": 0,
+    "ads": 1,
+    "other": 2,
+    "preferred": 3,
+    "unit": 4,
+    "warrant": 5,
+    "right": 6,
+}
+
+
+def issuer_key(name: str) -> str:
+    """Issuer part of a screener name, normalized for grouping ("" if none)."""
+    if not isinstance(name, str):
+        return ""
+    match = SECURITY_DESCRIPTION.search(name)
+    issuer = name[: match.start()] if match else name
+    return _NON_WORD.sub(" ", issuer).strip().casefold()
+
+
+def symbol_root(symbol: str, security_type: str = "common") -> str:
+    """Issuer root of a symbol: class/series part and warrant/unit/right suffix removed."""
+    root = _SYMBOL_SEPARATOR.split(str(symbol).strip().upper())[0]
+    for suffix in SECURITY_TYPE_SUFFIXES.get(security_type, ()):
+        if root.endswith(suffix) and len(root) > len(suffix):
+            return root[: -len(suffix)]
+    return root
+
+
+def issuer_representatives(symbols: pd.Series, names: pd.Series) -> np.ndarray:
+    """Position of the row to scrape for each screener row.
+
+    Rows are listings of the same issuer when their names match once the
+    security description is removed and one root symbol is a prefix of the
+    other (``GOOG``/``GOOGL``, ``BRK/A``/``BRK/B``, ``ACAH``/``ACAHW``/``ACAHU``).
+    Each issuer is represented by its common stock if listed, otherwise the
+    shortest symbol; every other row points at that row's position. Rows
+    without a usable name point at themselves.
+    """
+    types = classify_security_types(names.reset_index(drop=True))
+    symbols = symbols.reset_index(drop=True).astype("string").fillna("")
+    frame = pd.DataFrame(
+        {
+            "key": names.reset_index(drop=True).map(issuer_key),
+            "root": [symbol_root(s, t) for s, t in zip(symbols, types)],
+            "rank": types.map(REPRESENTATIVE_RANK).astype(int),
+            "length": symbols.str.len(),
+            "symbol": symbols,
+        }
+    )
+    representatives = np.arange(len(frame))
+    candidates = frame[frame["key"].ne("") & frame["root"].ne("")]
+    candidates = candidates[candidates["key"].duplicated(keep=False)]
+    for _, group in candidates.groupby("key", sort=False):
+        group = group.sort_values(["rank", "length", "symbol"], kind="stable")
+        issuers: Dict[str, int] = {}
+        for position, root in zip(group.index, group["root"]):
+            known = next(
+                (r for r in issuers if root.startswith(r) or r.startswith(root)), None
+            )
+            if known is None:
+                issuers[root] = position
+            else:
+                representatives[position] = issuers[known]
+    return representatives
@@ -0,0 +1,6 @@
+
+
+# Snapshot query service package
+
+from .store import SnapshotStore  # noqa: F401
+from .server import create_query_server  # noqa: F401
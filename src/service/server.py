@@ -0,0 +1,130 @@
+"""Read-only HTTP/JSON service over the latest enriched snapshot.
+
+Usage:
+    python -m src.service.server
+    python -m src.service.server --snapshot output/nasdaq_screener_20250901_053000.arrow --port 8765
+
+Endpoints:
+    GET /health                              snapshot path and row count
+    GET /symbols/<symbol>                    one row by symbol
+    GET /companies?ceo=&industry=&state=     rows matching all filters (limit, offset)
+"""
+
+import argparse
+import json
+import logging
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.exporters.snapshot_diff import find_previous_snapshot
+from src.service.store import SECONDARY_INDEXES, SnapshotStore
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10_000
+
+
+def create_query_server(
+    store: SnapshotStore, port: int = DEFAULT_PORT, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Build (but do not start) a JSON server answering from ``store``.
+
+    Binds to localhost by default; pass ``port=0`` to pick a free port.
+    Responses carry the time spent in the store as ``X-Query-Time-Us``.
+    """
+
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            started = time.perf_counter()
+            try:
+                status, body = self._route(url.path, parse_qs(url.query))
+            except ValueError as error:
+                status, body = 400, {"error": str(error)}
+            elapsed_us = (time.perf_counter() - started) * 1e6
+            payload = json.dumps(body, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("X-Query-Time-Us", f"{elapsed_us:.1f}")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _route(self, path: str, params: dict) -> tuple:
+            if path == "/health":
+                return 200, {"snapshot": str(store.path), "rows": len(store)}
+            if path.startswith("/symbols/"):
+                symbol = unquote(path[len("/symbols/") :])
+                row = store.get(symbol)
+                if row is None:
+                    return 404, {"error": f"Unknown symbol {symbol!r}"}
+                return 200, row
+            if path == "/companies":
+                unknown = set(params) - set(SECONDARY_INDEXES) - {"limit", "offset"}
+                if unknown:
+                    raise ValueError(f"Unknown parameter(s): {sorted(unknown)}")
+                limit = _int_param(params, "limit", DEFAULT_LIMIT)
+                if not 0 <= limit <= MAX_LIMIT:
+                    raise ValueError(f"limit must be between 0 and {MAX_LIMIT}")
+                filters = {name: params[name][-1] for name in SECONDARY_INDEXES if name in params}
+                return 200, store.query(
+                    limit=limit, offset=_int_param(params, "offset", 0), **filters
+                )
+            return 404, {"error": f"Unknown path {path!r}"}
+
+        def log_message(self, format, *args):
+            logger.debug(f"query: {format % args}")
+
+    server = ThreadingHTTPServer((host, port), QueryHandler)
+    server.daemon_threads = True
+    return server
+
+
+def _int_param(params: dict, name: str, default: int) -> int:
+    if name not in params:
+        return default
+    try:
+        value = int(params[name][-1])
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    return value
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Serve lookups and filtered scans over the latest enriched snapshot."
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=None,
+        help="Exported snapshot (CSV, Excel, Parquet or Arrow; default: newest in output/).",
+    )
+    parser.add_argument("--output-dir", default="output")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    snapshot = args.snapshot or find_previous_snapshot(args.output_dir)
+    if snapshot is None:
+        parser.error(f"No snapshot found in {args.output_dir}/")
+    server = create_query_server(SnapshotStore(snapshot), args.port, args.host)
+    logger.info(f"Serving {snapshot} on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,164 @@
+import functools
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.exporters.arrow_export import INTEGER_COLUMNS
+from src.pipeline.normalize import normalize_company_fields
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = ".cache/service"
+# Query parameter -> exported column with a secondary index
+SECONDARY_INDEXES = {"ceo": "CEO", "industry": "Industry", "state": "HQ State"}
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "The query service requires the 'pyarrow' package (uv sync --extra export)"
+        ) from error
+    return pyarrow
+
+
+class SnapshotStore:
+    """Read-only, indexed view of one enriched snapshot.
+
+    The snapshot is held as a memory-mapped Arrow IPC file: ``.arrow``
+    exports are mapped directly, CSV and Parquet exports are converted once
+    into ``cache_dir`` and the copy is mapped. Symbols get a hash index and
+    CEO, Industry and HQ state get secondary indexes from value to sorted
+    row numbers, so lookups and filtered scans never touch unrelated rows.
+    Index keys are case-insensitive.
+    """
+
+    def __init__(self, path: str | Path, cache_dir: str | Path = DEFAULT_CACHE_DIR):
+        self.path = Path(path)
+        self.table = _open_mapped(self.path, Path(cache_dir))
+        self.columns = self.table.column_names
+
+        symbols = self.table.column("Symbol").to_pylist()
+        self._symbols: Dict[str, int] = {
+            _key(symbol): row for row, symbol in enumerate(symbols) if symbol
+        }
+        self._indexes: Dict[str, Dict[str, np.ndarray]] = {
+            name: _group_rows(self.table.column(column)) if column in self.columns else {}
+            for name, column in SECONDARY_INDEXES.items()
+        }
+        logger.info(f"Loaded {len(self)} rows from {self.path}")
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Row for ``symbol`` as a dict, or None."""
+        row = self._symbols.get(_key(symbol))
+        if row is None:
+            return None
+        return self.table.slice(row, 1).to_pylist()[0]
+
+    def query(
+        self, limit: int = 100, offset: int = 0, **filters: Optional[str]
+    ) -> Dict[str, Any]:
+        """Rows matching every given filter (``ceo``, ``industry``, ``state``).
+
+        Filters are exact, case-insensitive matches answered from the
+        secondary indexes; with none, rows are returned in file order.
+        Returns the total match count and the requested page.
+        """
+        unknown = set(filters) - set(SECONDARY_INDEXES)
+        if unknown:
+            raise ValueError(f"Unknown filter(s): {sorted(unknown)}")
+        candidates = [
+            self._indexes[name].get(_key(value), np.empty(0, dtype=np.int64))
+            for name, value in filters.items()
+            if value is not None
+        ]
+        if candidates:
+            rows = functools.reduce(
+                lambda left, right: np.intersect1d(left, right, assume_unique=True),
+                candidates,
+            )
+        else:
+            rows = np.arange(len(self), dtype=np.int64)
+        page = rows[offset : offset + limit]
+        return {
+            "total": int(len(rows)),
+            "limit": limit,
+            "offset": offset,
+            "results": self.table.take(page).to_pylist() if len(page) else [],
+        }
+
+    def values(self, name: str) -> List[str]:
+        """Indexed keys of secondary index ``name``, sorted."""
+        return sorted(self._indexes[name])
+
+
+def _key(value: Any) -> str:
+    return str(value).strip().casefold() if value is not None else ""
+
+
+def _group_rows(column: Any) -> Dict[str, np.ndarray]:
+    """Map each distinct (case-folded) value of ``column`` to its sorted rows."""
+    pa = _require_pyarrow()
+    array = column.combine_chunks()
+    if pa.types.is_dictionary(array.type):
+        array = array.cast(pa.string())
+    encoded = array.dictionary_encode()
+    codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(encoded.dictionary) + 1))
+
+    index: Dict[str, np.ndarray] = {}
+    for code, value in enumerate(encoded.dictionary.to_pylist()):
+        key = _key(value)
+        if not key:
+            continue
+        rows = order[bounds[code] : bounds[code + 1]].astype(np.int64)
+        index[key] = np.union1d(index[key], rows) if key in index else rows
+    return index
+
+
+def _open_mapped(path: Path, cache_dir: Path) -> Any:
+    """Memory-map ``path`` as an Arrow table, converting it first if needed."""
+    pa = _require_pyarrow()
+    if path.suffix == ".arrow":
+        mapped = path
+    else:
+        mapped = cache_dir / f"{path.name}.arrow"
+        if not mapped.exists() or mapped.stat().st_mtime < path.stat().st_mtime:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(_read_frame(path), preserve_index=False)
+            partial = mapped.with_name(f"{mapped.name}.partial")
+            with pa.OSFile(str(partial), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            partial.replace(mapped)
+            logger.info(f"Converted {path} to {mapped}")
+    return pa.ipc.open_file(pa.memory_map(str(mapped), "r")).read_all()
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    elif path.suffix == ".xlsx":
+        # Streamed workbooks continue on further sheets past Excel's row limit
+        sheets = pd.read_excel(path, sheet_name=None, dtype=str)
+        df = pd.concat(sheets.values(), ignore_index=True)
+    else:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False).replace("", None)
+    if "HQ State" not in df.columns and "Headquarters" in df.columns:
+        df["HQ State"] = normalize_company_fields(df)["HQ State"].astype("string")
+    for column in df.columns:
+        if column in INTEGER_COLUMNS:
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+        elif isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("string")
+    return df
@@ -46,6 +46,36 @@ def test_company_details():
     assert details_dict["ceo"] == ""
     assert details_dict["employees"] == ""
 
+def test_company_details_source_mask():
+    """Test the compact CompanyDetails source bitmask and URL rebuilding."""
+    from src.http.http_client import HTTPClient
+    from src.models.company_details import CompanyDetails
+    from src.scrapers import CNBCScraper, GoogleFinanceScraper
+
+    details = CompanyDetails(ticker="AAPL")
+    assert not hasattr(details, "__dict__")
+
+    http_client = HTTPClient()
+    GoogleFinanceScraper(http_client)._add_source(details, 1)
+    CNBCScraper(http_client)._add_source(details)
+
+    assert details.sources == {"GoogleFinanceScraper", "CNBCScraper"}
+    assert details.urls == {
+        "https://www.google.com/finance/quote/AAPL:NYSE?hl=en",
+        "https://www.cnbc.com/quotes/AAPL",
+    }
+    details_dict = details.to_dict()
+    assert details_dict["sources"] == "GoogleFinanceScraper,CNBCScraper"
+    assert details_dict["urls"].split(",") == [
+        "https://www.google.com/finance/quote/AAPL:NYSE?hl=en",
+        "https://www.cnbc.com/quotes/AAPL",
+    ]
+
+    # Assigning source names replaces the mask; such sources carry no URL
+    details.sources = ["Manual", "CNBCScraper"]
+    assert details.sources == {"Manual", "CNBCScraper"}
+    assert details.urls == frozenset()
+
 def test_http_client():
     """Test the HTTPClient class basic behavior."""
     from src.fetch_company_details import HTTPClient
@@ -108,6 +138,1198 @@ def test_data_processor():
     assert hasattr(exporter, "export_to_csv")
     assert hasattr(exporter, "export_to_excel")
 
+def test_deadline_planner():
+    """Test source selection under a wall-clock budget."""
+    import datetime
+
+    from src.fetch_company_details import HTTPClient
+    from src.fetchers.deadline_planner import (
+        DeadlinePlanner,
+        HostThroughput,
+        parse_deadline,
+    )
+    from src.scrapers import CNBCScraper, MarketWatchScraper
+
+    http_client = HTTPClient()
+    cnbc, marketwatch = CNBCScraper(http_client), MarketWatchScraper(http_client)
+    throughput = HostThroughput()
+    throughput.record(cnbc.host, 1.0, 2)
+    throughput.record(marketwatch.host, 4.0, 1)
+
+    deadline = datetime.datetime.now() + datetime.timedelta(seconds=40)
+    planner = DeadlinePlanner(deadline, 1, throughput, reserve_seconds=0)
+    # Plenty of budget for one ticker: keep both, in their original order
+    assert planner.select_scrapers([marketwatch, cnbc], 1) == [marketwatch, cnbc]
+    # Budget for 20 tickers is ~2s each: only the cheap, productive source fits
+    assert planner.select_scrapers([marketwatch, cnbc], 20) == [cnbc]
+
+    expired = DeadlinePlanner(
+        datetime.datetime.now(), 1, throughput, reserve_seconds=0
+    )
+    assert expired.expired()
+    assert expired.select_scrapers([marketwatch, cnbc], 1) == []
+
+    now = datetime.datetime(2025, 9, 1, 22, 0)
+    assert parse_deadline("90m", now) == now + datetime.timedelta(minutes=90)
+    assert parse_deadline("05:30", now) == datetime.datetime(2025, 9, 2, 5, 30)
+
+def test_result_columns():
+    """Test that buffered results are joined into the frame in one step."""
+    import pandas as pd
+
+    from src.models.company_details import CompanyDetails
+    from src.pipeline import ResultColumns
+
+    df = pd.DataFrame({"symbol": ["A", "AA", "AAPL"], "CEO": ["", "", "Old CEO"]})
+    results = ResultColumns(df)
+    results.set_row(0, CompanyDetails(ceo="Padraig Mcdonnell", industry="Medical"))
+    results.set_row(1, CompanyDetails(industry="Aluminum"))
+    joined = results.join_into(df)
+
+    assert joined["CEO"].tolist() == ["Padraig Mcdonnell", "", "Old CEO"]
+    assert joined["Industry"].dtype == "category"
+    assert joined["Industry"].tolist() == ["Medical", "Aluminum", ""]
+    assert joined["Source Link"].tolist() == ["", "", ""]
+
+    # Snapshot values survive an empty scrape and are replaced by a found one
+    snapshot = pd.DataFrame(
+        {"symbol": ["A", "B"], "CEO": ["Old CEO", "Old CEO"], "Founded": ["1999", "1999"]}
+    )
+    results = ResultColumns(snapshot)
+    results.set_row(0, CompanyDetails())
+    results.set_row(1, CompanyDetails(ceo="New CEO"))
+    joined = results.join_into(snapshot)
+
+    assert joined["CEO"].tolist() == ["Old CEO", "New CEO"]
+    assert joined["Founded"].tolist() == ["1999", "1999"]
+
+def test_normalize_company_fields():
+    """Test parsing of scraped strings into typed columns."""
+    import pandas as pd
+
+    from src.pipeline import normalize_company_fields
+
+    df = pd.DataFrame(
+        {
+            "Employees": ["17,900", "", "352"],
+            "Founded": ["", "Founded in 1999", ""],
+            "Headquarters": [
+                "5301 Stevens Creek Blvd Santa Clara, CA 95051 United States",
+                "Hachoshlim St 8 Herzliya 4672408 Israel",
+                "",
+            ],
+        }
+    )
+    result = normalize_company_fields(df)
+
+    assert result["Employee Count"].tolist() == [17900, pd.NA, 352]
+    assert result["Founded Year"].tolist() == [pd.NA, 1999, pd.NA]
+    first = result.iloc[0]
+    assert first["HQ Street"] == "5301 Stevens Creek Blvd"
+    assert first["HQ City"] == "Santa Clara"
+    assert first["HQ State"] == "CA"
+    assert first["HQ Postal Code"] == "95051"
+    assert first["HQ Country"] == "United States"
+    second = result.iloc[1]
+    assert (second["HQ City"], second["HQ Postal Code"]) == ("Herzliya", "4672408")
+    assert second["HQ Country"] == "Israel"
+    assert pd.isna(result.iloc[2]["HQ Street"])
+
+def test_iter_companies_sliding_window():
+    """Test that the fetcher keeps a bounded window of tickers in flight."""
+    import threading
+    import time
+
+    from src.fetchers.company_details_fetcher import CompanyDetailsFetcher
+    from src.models.company_details import CompanyDetails
+
+    fetcher = CompanyDetailsFetcher(max_workers=3)
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def fake_fetch(ticker, scrapers=None):
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.05 if ticker == "SLOW" else 0.01)
+        with lock:
+            active[0] -= 1
+        return CompanyDetails(ceo=f"CEO of {ticker}", ticker=ticker)
+
+    fetcher.fetch_company_details = fake_fetch
+    tickers = ["SLOW"] + [f"T{i}" for i in range(11)]
+    order = [position for position, _ in fetcher.iter_companies(tickers, window=3)]
+    fetcher.close()
+
+    assert sorted(order) == list(range(len(tickers)))
+    # The slow first ticker does not hold back the ones behind it
+    assert order[0] != 0
+    assert active[1] <= 3
+
+def test_screener_filter():
+    """Test filter pushdown parameters and exact local filtering."""
+    import pandas as pd
+
+    from src.screener import ScreenerFilter
+
+    df = pd.DataFrame(
+        {
+            "symbol": ["AAPL", "ABCDW", "BIG", "TINY"],
+            "name": [
+                "Apple Inc. Common Stock",
+                "ABCD Acquisition Corp - Warrant",
+                "Big Co Common Stock",
+                "Tiny Co Common Stock",
+            ],
+            "marketCap": ["3,400,000,000,000.00", "", "15000000000.00", "20000000.00"],
+            "country": ["United States", "United States", "Canada", "United States"],
+        }
+    )
+    screener_filter = ScreenerFilter(
+        min_market_cap=1e9, countries=("United States",), security_types=("common",)
+    )
+    params = screener_filter.query_params()
+    assert params["country"] == "united_states"
+    assert params["marketcap"] == "mega|large|mid|small"
+    assert screener_filter.apply(df)["symbol"].tolist() == ["AAPL"]
+    assert ScreenerFilter().is_empty()
+
+def test_screener_cache_revalidation(tmp_path, monkeypatch):
+    """Test that stale screener payloads are revalidated with their ETag."""
+    from src.screener import ScreenerCache
+    from src.screener import cache as cache_module
+
+    calls = []
+
+    class FakeResponse:
+        def __init__(self, status_code, payload=None):
+            self.status_code = status_code
+            self.headers = {"ETag": '"v1"'}
+            self._payload = payload
+
+        def json(self):
+            return self._payload
+
+        def raise_for_status(self):
+            pass
+
+    def fake_get(url, headers, timeout):
+        calls.append(headers.get("If-None-Match"))
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, {"data": {"rows": [{"symbol": "AAPL"}]}})
+
+    monkeypatch.setattr(cache_module.requests, "get", fake_get)
+    screener_cache = ScreenerCache(str(tmp_path), max_age=0)
+    url = "https://api.nasdaq.com/api/screener/stocks?download=true"
+
+    assert screener_cache.fetch(url, {})["data"]["rows"][0]["symbol"] == "AAPL"
+    assert screener_cache.fetch(url, {})["data"]["rows"][0]["symbol"] == "AAPL"
+    assert calls == [None, '"v1"']
+
+def test_streaming_csv_sink(tmp_path):
+    """Test that streamed rows are visible while writing and renamed on close."""
+    import gzip
+    import zlib
+
+    import pandas as pd
+
+    from src.exporters import StreamingCSVSink
+
+    sink = StreamingCSVSink(
+        tmp_path / "out.csv", ["Symbol", "CEO"], compression="gzip", flush_rows=1
+    )
+    sink.write_frame(pd.DataFrame({"Symbol": ["A"], "CEO": ["Padraig Mcdonnell"]}))
+    assert sink.partial_path.exists() and not sink.path.exists()
+    # The gzip stream is unfinished, but everything flushed so far decodes
+    partial = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(
+        sink.partial_path.read_bytes()
+    )
+    assert partial.decode().splitlines()[-1] == "A,Padraig Mcdonnell"
+
+    sink.write_frame(pd.DataFrame({"Symbol": ["AA"], "CEO": ["William Oplinger"]}))
+    final_path = sink.close()
+    assert final_path.endswith("out.csv.gz") and not sink.partial_path.exists()
+    with gzip.open(final_path, "rt") as final:
+        assert final.read().splitlines() == [
+            "Symbol,CEO",
+            "A,Padraig Mcdonnell",
+            "AA,William Oplinger",
+        ]
+
+def test_streamed_deadline_run_keeps_unreached_rows(tmp_path, monkeypatch):
+    """Test that rows the deadline never started still reach the --stream file."""
+    import json
+
+    import pandas as pd
+    import requests
+
+    from src.run import main
+
+    requested = []
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kwargs: requested.append(url)
+    )
+    monkeypatch.chdir(tmp_path)
+    snapshot = tmp_path / "snapshot.csv"
+    snapshot.write_text(
+        "Symbol,Name,Market Capital\n"
+        + "".join(f"T{i},Company {i},{i}000\n" for i in range(3))
+    )
+
+    main(["--offline", str(snapshot), "--stream", "--deadline", "0"])
+
+    assert requested == []
+    exports = list((tmp_path / "output").glob("nasdaq_screener_*.csv"))
+    assert len(exports) == 1
+    result = pd.read_csv(exports[0], dtype=str, keep_default_na=False)
+    assert sorted(result["Symbol"]) == ["T0", "T1", "T2"]
+    assert set(result["CEO"]) == {""}
+    manifest = json.loads(exports[0].with_name(exports[0].name + ".manifest.json").read_text())
+    assert manifest["throughput"]["rows"] == 3
+
+def test_parquet_and_arrow_export(tmp_path):
+    """Test typed Parquet and Arrow IPC exports (requires the export extra)."""
+    import pytest
+
+    pa = pytest.importorskip("pyarrow")
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    from src.pipeline import normalize_company_fields
+    from src.run import DataExporter
+
+    df = normalize_company_fields(
+        pd.DataFrame(
+            {
+                "symbol": ["A", "AA"],
+                "name": ["Agilent", "Alcoa"],
+                "marketCap": ["35695573720.00", ""],
+                "CEO": ["Padraig Mcdonnell", "William Oplinger"],
+                "Employees": ["17,900", "13,900"],
+                "Headquarters": ["", ""],
+                "Founded": ["", ""],
+                "Industry": ["Medical Equipment/Supplies", "Aluminum"],
+                "Source": ["CNBCScraper", "CNBCScraper"],
+                "Source Link": ["", ""],
+                "sector": ["Health Care", "Basic Materials"],
+            }
+        )
+    )
+    exporter = DataExporter(str(tmp_path))
+
+    table = pq.read_table(exporter.export_to_parquet(df, filename="out.parquet"))
+    assert table.schema.field("Market Capital").type == pa.float64()
+    assert table.schema.field("Employee Count").type == pa.int64()
+    assert pa.types.is_dictionary(table.schema.field("Source").type)
+    assert table.column("Employee Count").to_pylist() == [17900, 13900]
+
+    dataset = exporter.export_to_parquet(df, partition_by="sector")
+    assert len(list(tmp_path.joinpath(dataset).iterdir())) == 2
+    assert sorted(pq.read_table(dataset).column("Sector").to_pylist()) == [
+        "Basic Materials",
+        "Health Care",
+    ]
+
+    arrow_file = exporter.export_to_arrow(df)
+    with pa.memory_map(arrow_file) as source:
+        assert pa.ipc.open_file(source).read_all().num_rows == 2
+
+def test_streaming_excel_writer_splits_sheets(tmp_path):
+    """Test the write-only Excel writer and its sheet splitting."""
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    from src.exporters import StreamingExcelWriter
+
+    with StreamingExcelWriter(tmp_path / "out.xlsx", ["Symbol", "Employee Count"], max_rows=3) as writer:
+        writer.write_frame(
+            pd.DataFrame(
+                {
+                    "Symbol": ["A", "AA", "AAPL"],
+                    "Employee Count": pd.array([17900, None, 1], dtype="Int64"),
+                }
+            )
+        )
+
+    workbook = load_workbook(tmp_path / "out.xlsx")
+    assert workbook.sheetnames == ["Sheet1", "Sheet2"]
+    assert list(workbook["Sheet1"].values) == [
+        ("Symbol", "Employee Count"),
+        ("A", 17900),
+        ("AA", None),
+    ]
+    assert list(workbook["Sheet2"].values) == [("Symbol", "Employee Count"), ("AAPL", 1)]
+
+def test_metrics_registry_and_endpoint():
+    """Test metric rendering, quantiles and the local Prometheus endpoint."""
+    import urllib.request
+
+    from src.observability import MetricsRegistry, start_metrics_server
+
+    registry = MetricsRegistry()
+    requests_total = registry.counter("test_requests_total", "Requests.", ("host", "status"))
+    latency = registry.histogram("test_latency_seconds", "Latency.", ("host",), buckets=(0.1, 1.0))
+
+    requests_total.inc(host="a.example", status="200")
+    requests_total.inc(2, host="a.example", status="429")
+    for value in (0.05, 0.5, 0.5, 5.0):
+        latency.observe(value, host="a.example")
+
+    assert requests_total.value(status="429") == 2
+    assert requests_total.value() == 3
+    assert latency.count(host="a.example") == 4
+    assert 0.1 < latency.quantile(0.5) <= 1.0
+
+    server = start_metrics_server(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# TYPE test_requests_total counter" in body
+    assert 'test_requests_total{host="a.example",status="429"} 2' in body
+    assert 'test_latency_seconds_bucket{host="a.example",le="1"} 3' in body
+    assert 'test_latency_seconds_bucket{host="a.example",le="+Inf"} 4' in body
+    assert 'test_latency_seconds_count{host="a.example"} 4' in body
+
+def test_trace_spans_export_as_otlp_jsonl(tmp_path):
+    """Test that nested spans share a trace and are written as OTLP/JSON lines."""
+    import json
+
+    from src.observability import configure_tracing, shutdown_tracing, span
+
+    path = tmp_path / "trace.jsonl"
+    configure_tracing(path)
+    try:
+        with span("ticker", ticker="AAPL") as ticker_span:
+            with span("http.attempt", **{"http.attempt": 1}) as attempt_span:
+                attempt_span.set_attribute("http.response.status_code", 429)
+            try:
+                with span("parse", source="CNBCScraper"):
+                    raise ValueError("bad page")
+            except ValueError:
+                pass
+            ticker_span.set_attribute("fields.filled", 2)
+    finally:
+        shutdown_tracing()
+
+    with span("ignored"):
+        pass
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {item["name"]: item for item in spans}
+    assert set(by_name) == {"ticker", "http.attempt", "parse"}
+
+    root = by_name["ticker"]
+    assert root["parentSpanId"] == ""
+    for name in ("http.attempt", "parse"):
+        assert by_name[name]["traceId"] == root["traceId"]
+        assert by_name[name]["parentSpanId"] == root["spanId"]
+    assert {"key": "http.response.status_code", "value": {"intValue": "429"}} in (
+        by_name["http.attempt"]["attributes"]
+    )
+    assert by_name["parse"]["status"]["code"] == 2
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+
+def test_run_profiler_report(tmp_path):
+    """Test the stage breakdown, sampling/cProfile output and tracemalloc report."""
+    import sys
+    import threading
+    import time
+
+    from src.observability.profiling import RunProfiler, checkpoint, stage
+
+    def busy(seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            sum(range(1000))
+
+    profiler = RunProfiler("sample", trace_allocations=True)
+    profiler.start()
+    with stage("screener download"):
+        busy(0.05)
+    worker = threading.Thread(target=busy, args=(0.05,))
+    worker.start()
+    worker.join()
+    retained = [bytearray(1024) for _ in range(200)]
+    checkpoint("after allocations")
+    profiler.stop()
+    report = profiler.write_report(tmp_path / "profile.txt").read_text()
+
+    assert "screener download" in report
+    assert "Worker time inside fetch" in report
+    assert "Top leaf lines" in report
+    assert "busy" in report
+    assert "after allocations" in report
+    assert "Top allocators" in report
+    assert len(retained) == 200
+
+    profiler = RunProfiler("cprofile")
+    profiler.start()
+    worker = threading.Thread(target=busy, args=(0.02,))
+    worker.start()
+    worker.join()
+    profiler.stop()
+    profiler.write_report(tmp_path / "cprofile.txt")
+    assert "busy" in (tmp_path / "cprofile.txt").read_text()
+    assert (tmp_path / "cprofile.pstats").exists()
+
+    # Work a thread does after stop() stays out of the report
+    def after_the_run(started, release):
+        busy(0.01)
+        started.set()
+        release.wait()
+        busy(0.01)
+        late_work()
+
+    def late_work():
+        pass
+
+    started, release = threading.Event(), threading.Event()
+    profiler = RunProfiler("cprofile")
+    profiler.start()
+    worker = threading.Thread(target=after_the_run, args=(started, release))
+    worker.start()
+    started.wait()
+    profiler.stop()
+    release.set()
+    worker.join()
+    assert sys.getprofile() is None
+    functions = {name for _, _, name in profiler.cprofile.stats().stats}
+    assert "busy" in functions
+    assert "late_work" not in functions
+
+def test_run_manifest_written_next_to_export(tmp_path, monkeypatch):
+    """Test that an offline run writes a manifest with throughput, requests and latencies."""
+    import json
+
+    import requests
+
+    from src.run import main
+
+    class FakeResponse:
+        status_code = 200
+        content = (
+            b'<html><body><div class="CompanyProfile-officer"><div>Jane Doe</div>'
+            b'<div class="CompanyProfile-officerTitle">Chief Executive Officer</div>'
+            b"</div></body></html>"
+        )
+
+    monkeypatch.setenv("AIE_RATE", "0")
+    monkeypatch.setattr(requests.Session, "get", lambda self, url, **kwargs: FakeResponse())
+    monkeypatch.chdir(tmp_path)
+    snapshot = tmp_path / "snapshot.csv"
+    snapshot.write_text("Symbol,Name,Market Capital\nAAA,Alpha Inc,1000\nBBB,Beta Corp,2000\n")
+
+    main(["--offline", str(snapshot), "--format", "csv"])
+
+    manifests = list((tmp_path / "output").glob("*.manifest.json"))
+    assert len(manifests) == 1
+    manifest = json.loads(manifests[0].read_text())
+    export = manifests[0].with_name(manifests[0].name[: -len(".manifest.json")])
+    assert export.exists()
+    assert manifest["output_file"] == str(export.relative_to(tmp_path))
+    assert manifest["config"]["args"]["format"] == "csv"
+    assert manifest["throughput"]["rows"] == 2
+    assert manifest["throughput"]["tickers_per_second"] > 0
+    assert manifest["requests"]["by_host"]["www.cnbc.com"]["by_status"]["200"] >= 2
+    for key in ("p50", "p95", "p99"):
+        assert manifest["latency_seconds"]["http"]["all"][key] is not None
+    assert manifest["hit_rates"]["by_field"]["ceo"] == 1.0
+    assert manifest["hit_rates"]["by_source"]["CNBCScraper"]["ceo"] > 0
+    assert "screener download" in manifest["stages"]
+
+def test_layered_settings(tmp_path):
+    """Test config file < env < flags layering, per-host policies and burst pacing."""
+    import pytest
+
+    from src.config import load_settings
+    from src.config.settings import resolve_config_path
+    from src.fetchers.company_details_fetcher import CompanyDetailsFetcher
+    from src.http.rate_limiter import HostRateLimiter
+
+    config = tmp_path / "nightly.toml"
+    config.write_text(
+        "[run]\nmax_workers = 8\nscrapers = ['cnbc', 'yahoo']\n"
+        "[http]\nrate = 2.0\ntimeout = 10\n"
+        "[http.hosts.'www.cnbc.com']\nrate = 0.5\nconcurrency = 1\n"
+    )
+    env = {"AIE_MAX_WORKERS": "6", "AIE_TIMEOUT": "12.5", "TEST_MODE": "true"}
+    settings = load_settings(str(config), env=env, overrides={"timeout": 15, "window": None})
+
+    assert settings.max_workers == 6
+    assert settings.test_mode is True
+    assert settings.scrapers == ("cnbc", "yahoo")
+    assert settings.http.timeout == 15.0
+    cnbc = settings.policy("www.cnbc.com")
+    assert (cnbc.rate, cnbc.concurrency, cnbc.timeout) == (0.5, 1, 15.0)
+    assert settings.policy("finance.yahoo.com").min_interval == 0.5
+
+    fetcher = CompanyDetailsFetcher(settings=settings)
+    assert [type(scraper).__name__ for scraper in fetcher.scrapers] == [
+        "CNBCScraper",
+        "YahooFinanceScraper",
+    ]
+    assert fetcher.http_client.rate_limiter._limits["www.cnbc.com"] == (2.0, 1)
+
+    config.write_text("[http]\nrps = 3\n")
+    with pytest.raises(ValueError):
+        load_settings(str(config), env={})
+    with pytest.raises(ValueError):
+        CompanyDetailsFetcher(settings=load_settings(env={"AIE_SCRAPERS": "bing"}))
+    assert resolve_config_path("laptop").name == "laptop.toml"
+    assert load_settings("production", env={}).policy("www.marketwatch.com").burst == 1
+
+    limiter = HostRateLimiter(min_interval=10.0, burst=3)
+    assert [limiter.acquire("example.com") for _ in range(3)] == [0, 0, 0]
+    limiter.set_limit("fast.example.com", 0.0)
+    assert limiter.acquire("fast.example.com") == 0
+
+def test_reference_index_prefills_and_skips_scrapers(tmp_path):
+    """Test bulk SEC/CSV import, ticker lookup and scraper skipping after prefill."""
+    import json
+    import zipfile
+
+    import pytest
+
+    from src.fetchers.company_details_fetcher import CompanyDetailsFetcher
+    from src.config import Settings
+    from src.reference import ReferenceIndex, build_index
+
+    filer = {
+        "cik": "0000320193",
+        "tickers": ["AAPL"],
+        "sicDescription": "Electronic Computers",
+        "addresses": {
+            "business": {
+                "street1": "One Apple Park Way",
+                "street2": None,
+                "city": "Cupertino",
+                "stateOrCountry": "CA",
+                "zipCode": "95014",
+            }
+        },
+    }
+    archive = tmp_path / "submissions.zip"
+    with zipfile.ZipFile(archive, "w") as zipped:
+        zipped.writestr("CIK0000320193.json", json.dumps(filer))
+        zipped.writestr("CIK0000000001.json", json.dumps({"tickers": [], "name": "A Fund"}))
+        zipped.writestr("CIK0000320193-submissions-001.json", json.dumps({"filings": []}))
+    index_path = tmp_path / "reference.sqlite"
+    build_index(archive, index_path).close()
+
+    registry = tmp_path / "registry.csv"
+    registry.write_text("Symbol,CEO,Headquarters,Founded\nBRK-B,Greg Abel,\"Omaha, NE\",1839\n")
+    build_index(registry, index_path, "csv").close()
+
+    index = ReferenceIndex(index_path)
+    assert len(index) == 2
+    # Runs never create an index; a wrong path fails instead of prefilling nothing
+    missing = tmp_path / "typo.sqlite"
+    with pytest.raises(FileNotFoundError):
+        CompanyDetailsFetcher(settings=Settings(reference=str(missing)))
+    assert not missing.exists()
+    apple = index.get("aapl")
+    assert apple.headquarters == "One Apple Park Way Cupertino, CA 95014 United States"
+    assert apple.industry == "Electronic Computers"
+    assert index.get("BRK/B").ceo == "Greg Abel"
+
+    requested = []
+    fetcher = CompanyDetailsFetcher(
+        settings=Settings(scrapers=("cnbc", "google")), reference=index
+    )
+    fetcher.http_client.get = lambda url, **kwargs: requested.append(url)
+
+    details = fetcher.fetch_company_details("BRK/B")
+    assert details.ceo == "Greg Abel" and details.founded == "1839"
+    assert details.sources == {"Reference CSV"}
+    # CNBC only provides CEO and headquarters, both known: only Google is asked
+    assert [url.split("/")[2] for url in requested] == ["www.google.com", "www.google.com"]
+
+    details = fetcher.fetch_company_details("AAPL")
+    assert details.industry == "Electronic Computers"
+    assert "SEC EDGAR" in details.sources
+    assert "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK=AAPL" in details.urls
+
+def test_snapshot_delta_export(tmp_path):
+    """Test the vectorized snapshot diff and the delta export against the newest snapshot."""
+    import json
+
+    import pandas as pd
+
+    from src.exporters.snapshot_diff import diff_snapshots, find_previous_snapshot
+    from src.run import DataExporter
+
+    previous = pd.DataFrame(
+        {
+            "Symbol": ["AAA", "BBB", "CCC"],
+            "Name": ["Alpha", "Beta", "Gamma"],
+            "CEO": ["Ann", "Bob", ""],
+            "Headquarters": ["Austin", "Boston", ""],
+            "Industry": ["Software", "Banks", ""],
+            "Employees": ["10", "20", ""],
+        }
+    )
+    current = pd.DataFrame(
+        {
+            "symbol": ["AAA", "BBB", "DDD"],
+            "name": ["Alpha", "Beta", "Delta"],
+            "CEO": ["Ann", "Bea", None],
+            "Headquarters": ["Austin ", "Boston", None],
+            "Industry": ["Software", "Banks", "Oil"],
+            "Employees": ["10", "25", None],
+        }
+    )
+
+    diff = diff_snapshots(previous, current)
+    rows = diff.delta.values.tolist()
+    assert rows == [
+        ["DDD", "Delta", "added", "Industry", "", "Oil"],
+        ["CCC", "Gamma", "removed", "", "", ""],
+        ["BBB", "Beta", "changed", "CEO", "Bob", "Bea"],
+        ["BBB", "Beta", "changed", "Employees", "20", "25"],
+    ]
+    assert diff.summary["added"] == 1 and diff.summary["removed"] == 1
+    assert diff.summary["changed_symbols"] == 1
+    assert diff.summary["changes_by_field"]["CEO"] == 1
+
+    output = tmp_path / "output"
+    output.mkdir()
+    previous.to_csv(output / "nasdaq_screener_20250101_000000.csv", index=False)
+    (output / "nasdaq_screener_20250101_000000.csv.manifest.json").write_text("{}")
+    exporter = DataExporter(output)
+    assert exporter.export_delta(current, exclude=output / "missing.csv") is not None
+    latest = exporter.export_to_csv(
+        current.assign(marketCap=1.0, Founded=None, Source=None, **{"Source Link": None}),
+        filename="nasdaq_screener_20250102_000000.csv",
+    )
+    assert find_previous_snapshot(output, exclude=latest).name == "nasdaq_screener_20250101_000000.csv"
+
+    delta_path = exporter.export_delta(current, exclude=latest, filename="delta.csv")
+    delta = pd.read_csv(delta_path, dtype=str, keep_default_na=False)
+    assert delta["Change"].tolist() == ["added", "removed", "changed", "changed"]
+    summary = json.loads((output / "delta.csv.summary.json").read_text())
+    assert summary["previous_snapshot"].endswith("nasdaq_screener_20250101_000000.csv")
+
+def test_chunked_deadline_budgets_against_the_whole_universe(tmp_path, monkeypatch):
+    """Test that each ticker's deadline budget counts the rows of chunks not read yet."""
+    import requests
+
+    from src.fetchers.deadline_planner import DeadlinePlanner
+    from src.run import main
+
+    waiting = []
+    select_scrapers = DeadlinePlanner.select_scrapers
+
+    def record(self, scrapers, pending_tickers):
+        waiting.append(pending_tickers)
+        return select_scrapers(self, scrapers, pending_tickers)
+
+    monkeypatch.setattr(DeadlinePlanner, "select_scrapers", record)
+    monkeypatch.setattr(requests.Session, "get", lambda self, url, **kwargs: None)
+    monkeypatch.setenv("AIE_RATE", "0")
+    monkeypatch.chdir(tmp_path)
+    snapshot = tmp_path / "snapshot.csv"
+    snapshot.write_text(
+        "Symbol,Name,Market Capital\n"
+        + "".join(f"T{i},Company {i},{i}000\n" for i in range(4))
+    )
+
+    main(["--offline", str(snapshot), "--chunk-rows", "2", "--deadline", "1h"])
+
+    assert sorted(waiting) == [1, 2, 3, 4]
+
+def test_excel_delta_finds_previous_workbook(tmp_path, monkeypatch):
+    """Test that --format excel --delta compares against the previous workbook."""
+    import pandas as pd
+    import requests
+
+    from src.exporters.snapshot_diff import find_previous_snapshot
+    from src.run import main
+
+    ceo = ["Jane Doe"]
+
+    class FakeResponse:
+        status_code = 200
+
+        @property
+        def content(self):
+            return (
+                f'<html><body><div class="CompanyProfile-officer"><div>{ceo[0]}</div>'
+                f'<div class="CompanyProfile-officerTitle">Chief Executive Officer</div>'
+                f"</div></body></html>"
+            ).encode()
+
+    monkeypatch.setenv("AIE_RATE", "0")
+    monkeypatch.setenv("AIE_SCRAPERS", "cnbc")
+    monkeypatch.setattr(requests.Session, "get", lambda self, url, **kwargs: FakeResponse())
+    monkeypatch.chdir(tmp_path)
+    snapshot = tmp_path / "snapshot.csv"
+    snapshot.write_text("Symbol,Name,Market Capital\nAAA,Alpha Inc,1000\nBBB,Beta Corp,2000\n")
+    output = tmp_path / "output"
+
+    main(["--offline", str(snapshot), "--format", "excel"])
+    (first,) = output.glob("nasdaq_screener_*.xlsx")
+    previous = first.rename(output / "nasdaq_screener_20000101_000000.xlsx")
+    assert find_previous_snapshot(output) == previous
+
+    ceo[0] = "John Roe"
+    main(["--offline", str(snapshot), "--format", "excel", "--delta"])
+
+    (delta_file,) = output.glob("nasdaq_screener_delta_*.csv")
+    delta = pd.read_csv(delta_file, dtype=str, keep_default_na=False)
+    assert sorted(delta["Symbol"]) == ["AAA", "BBB"]
+    assert set(delta["Old Value"]) == {"Jane Doe"}
+    assert set(delta["New Value"]) == {"John Roe"}
+
+def test_snapshot_query_service(tmp_path):
+    """Test symbol lookups and indexed filtered scans over a memory-mapped snapshot."""
+    import json
+    import threading
+    import urllib.error
+    import urllib.request
+
+    import pandas as pd
+
+    from src.service import SnapshotStore, create_query_server
+
+    snapshot = tmp_path / "nasdaq_screener_20250101_000000.csv"
+    pd.DataFrame(
+        {
+            "Symbol": ["AAA", "BBB", "CCC", "DDD"],
+            "Name": ["Alpha", "Beta", "Gamma", "Delta"],
+            "CEO": ["Ann Lee", "Bob Ray", "Ann Lee", ""],
+            "Headquarters": [
+                "1 Main St Austin, TX 78701 United States",
+                "2 Elm St Boston, MA 02110 United States",
+                "3 Oak St Dallas, TX 75201 United States",
+                "",
+            ],
+            "Industry": ["Software", "Banks", "software", "Oil"],
+            "Employee Count": ["10", "20", "", "5"],
+        }
+    ).to_csv(snapshot, index=False)
+
+    # --format excel exports are picked up as the newest snapshot too
+    workbook = tmp_path / "nasdaq_screener_20250102_000000.xlsx"
+    pd.read_csv(snapshot, dtype=str, keep_default_na=False).to_excel(workbook, index=False)
+    excel_store = SnapshotStore(workbook, cache_dir=tmp_path / "cache")
+    assert excel_store.get("bbb")["Employee Count"] == 20
+    assert excel_store.get("DDD")["CEO"] is None
+    assert excel_store.query(industry="software", state="TX")["total"] == 2
+
+    store = SnapshotStore(snapshot, cache_dir=tmp_path / "cache")
+    assert (tmp_path / "cache" / f"{snapshot.name}.arrow").exists()
+    assert store.get("bbb")["CEO"] == "Bob Ray"
+    assert store.get("BBB")["Employee Count"] == 20
+    assert store.get("ZZZ") is None
+    assert store.query(industry="SOFTWARE")["total"] == 2
+    result = store.query(industry="software", state="TX", ceo="ann lee", limit=1)
+    assert result["total"] == 2 and [row["Symbol"] for row in result["results"]] == ["AAA"]
+    assert store.query(state="MA", ceo="Ann Lee")["total"] == 0
+    assert store.query(limit=2, offset=3)["results"][0]["Symbol"] == "DDD"
+
+    server = create_query_server(store, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/symbols/CCC") as response:
+            assert json.loads(response.read())["Name"] == "Gamma"
+            assert float(response.headers["X-Query-Time-Us"]) >= 0
+        with urllib.request.urlopen(f"{base}/companies?state=tx&limit=5") as response:
+            body = json.loads(response.read())
+        assert [row["Symbol"] for row in body["results"]] == ["AAA", "CCC"]
+        for path, status in (("/symbols/ZZZ", 404), ("/companies?sector=x", 400)):
+            try:
+                urllib.request.urlopen(base + path)
+            except urllib.error.HTTPError as error:
+                assert error.code == status
+            else:
+                raise AssertionError(f"{path} did not fail")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_ceo_classification_batches_and_caches(tmp_path):
+    """Test that CEO names are deduplicated, batched across workers and cached between runs."""
+    import threading
+
+    import pandas as pd
+    import pytest
+
+    from src.classify import (
+        ClassificationCache,
+        LlamaCppClassifier,
+        NameClassifier,
+        add_ceo_classification,
+    )
+    from src.exporters.columns import prepare_export
+
+    class FakeClassifier(NameClassifier):
+        backend = "fake"
+        loads = 0
+        batches = []
+
+        def _load(self):
+            FakeClassifier.loads += 1
+            return threading.get_ident()
+
+        def _classify(self, model, names):
+            FakeClassifier.batches.append(list(names))
+            return [("match" if name.startswith("W") else "other", 0.9) for name in names]
+
+    with pytest.raises(TypeError):
+        NameClassifier("incomplete")
+
+    df = pd.DataFrame(
+        {
+            "symbol": ["A", "B", "C", "D", "E"],
+            "name": list("abcde"),
+            "marketCap": ["1"] * 5,
+            "CEO": ["Wilma Mankiller", "wilma  mankiller", "Tim Cook", "", "Ada Lovelace"],
+            "Employees": [""] * 5,
+            "Headquarters": [""] * 5,
+            "Founded": [""] * 5,
+            "Industry": [""] * 5,
+            "Source": [""] * 5,
+            "Source Link": [""] * 5,
+        }
+    )
+    cache = ClassificationCache(tmp_path / "classification.sqlite")
+    classifier = FakeClassifier("fake-model", labels=("match", "other"))
+    result = add_ceo_classification(df, classifier, cache, batch_size=2, workers=2)
+
+    assert sorted(len(batch) for batch in FakeClassifier.batches) == [1, 2]
+    assert result["CEO Classification"].tolist()[:3] == ["match", "match", "other"]
+    assert pd.isna(result["CEO Classification"].iloc[3])
+    assert result["CEO Classification Score"].iloc[0] == 0.9
+    assert "CEO Classification" in prepare_export(result).columns
+    assert len(cache) == 3
+
+    # A rerun is answered from the cache without loading the model
+    loads = FakeClassifier.loads
+    FakeClassifier.batches.clear()
+    add_ceo_classification(df, FakeClassifier("fake-model", labels=("match", "other")), cache)
+    assert FakeClassifier.batches == [] and FakeClassifier.loads == loads
+    # Another model does not reuse those results
+    add_ceo_classification(df, FakeClassifier("other-model", labels=("match", "other")), cache)
+    assert len(FakeClassifier.batches) == 1
+    cache.close()
+
+    llama = LlamaCppClassifier("model.gguf", labels=("yes", "no"))
+    assert llama._parse_answers("1: Yes\n2. no\n4: maybe", 3) == [
+        ("yes", None),
+        ("no", None),
+        ("unknown", None),
+    ]
+
+def test_geocode_headquarters_against_gazetteer(tmp_path):
+    """Test postal, city and city-prefix matches from a GeoNames-format gazetteer."""
+    import pandas as pd
+
+    from src.pipeline import Gazetteer, geocode_headquarters, normalize_company_fields
+
+    rows = [
+        ("US", "78701", "Austin", "Texas", "TX", "Travis", "453", "", "", "30.27", "-97.74", "4"),
+        ("US", "78702", "Austin", "Texas", "TX", "Travis", "453", "", "", "30.26", "-97.72", "4"),
+        ("US", "63101", "Saint Louis", "Missouri", "MO", "St. Louis City", "510", "", "", "38.63", "-90.19", "4"),
+        ("US", "10001", "New York City", "New York", "NY", "New York", "061", "", "", "40.75", "-73.99", "4"),
+        ("CA", "H2X", "Montreal", "Quebec", "QC", "", "", "", "", "45.5", "-73.6", "4"),
+    ]
+    gazetteer_path = tmp_path / "US.txt"
+    gazetteer_path.write_text("\n".join("\t".join(row) for row in rows) + "\n")
+    gazetteer = Gazetteer(gazetteer_path)
+
+    df = normalize_company_fields(
+        pd.DataFrame(
+            {
+                "Headquarters": [
+                    "100 Congress Ave Austin, TX 78701-1234 United States",
+                    "1 Main St Saint Louis, MO United States",
+                    "5 Broadway New York, NY United States",
+                    "9 Pine St Austin 78702 United States",
+                    "1 Rue Peel Montreal, QC H2X Canada",
+                    "",
+                    "100 Congress Ave Austin, TX 78701-1234 United States",
+                ]
+            }
+        )
+    )
+    result = geocode_headquarters(df, gazetteer)
+
+    assert result["HQ Geocode Match"].tolist()[:4] == ["postal", "city", "city prefix", "postal"]
+    assert result["HQ Latitude"].iloc[0] == 30.27
+    assert result["HQ County"].iloc[1] == "St. Louis City"
+    assert result["HQ State"].iloc[3] == "TX"
+    assert result.iloc[4:6]["HQ Latitude"].isna().all()
+    assert result["HQ County"].iloc[6] == "Travis"
+    assert len(gazetteer._memo) == 4
+
+    latitude, longitude, state, county, match = gazetteer.resolve(state="Texas", city="austin")
+    assert (state, county, match) == ("TX", "Travis", "city")
+    assert abs(longitude - -97.73) < 1e-9
+    assert gazetteer.resolve(state="MO", city="St. Louis")[4] == "city"
+
+def test_chunked_mode_streams_every_chunk(tmp_path, monkeypatch):
+    """Test that --chunk-rows enriches the snapshot chunk by chunk into one streamed file."""
+    import json
+
+    import pandas as pd
+    import requests
+
+    from src.run import DataProcessor, main
+
+    class FakeResponse:
+        status_code = 200
+        content = (
+            b'<html><body><div class="CompanyProfile-officer"><div>Jane Doe</div>'
+            b'<div class="CompanyProfile-officerTitle">Chief Executive Officer</div>'
+            b"</div></body></html>"
+        )
+
+    chunk_sizes = []
+    process_batch = DataProcessor._process_companies_batch
+
+    def spy(self, df, planner=None, sink=None):
+        chunk_sizes.append(len(df))
+        return process_batch(self, df, planner, sink)
+
+    monkeypatch.setattr(DataProcessor, "_process_companies_batch", spy)
+    monkeypatch.setenv("AIE_RATE", "0")
+    monkeypatch.setenv("AIE_SCRAPERS", "cnbc")
+    monkeypatch.setattr(requests.Session, "get", lambda self, url, **kwargs: FakeResponse())
+    monkeypatch.chdir(tmp_path)
+    snapshot = tmp_path / "snapshot.csv"
+    snapshot.write_text(
+        "Symbol,Name,Market Capital\n"
+        + "".join(f"T{i},Company {i},{i}000\n" for i in range(5))
+    )
+
+    main(["--offline", str(snapshot), "--chunk-rows", "2"])
+
+    assert chunk_sizes == [2, 2, 1]
+    exports = list((tmp_path / "output").glob("nasdaq_screener_*.csv"))
+    assert len(exports) == 1
+    result = pd.read_csv(exports[0], dtype=str, keep_default_na=False)
+    assert sorted(result["Symbol"]) == [f"T{i}" for i in range(5)]
+    assert set(result["CEO"]) == {"Jane Doe"}
+    manifest = json.loads(exports[0].with_name(exports[0].name + ".manifest.json").read_text())
+    assert manifest["throughput"]["rows"] == 5
+    assert manifest["hit_rates"]["by_field"]["ceo"] == 1.0
+
+def test_chunked_deadline_run_writes_every_row(tmp_path, monkeypatch):
+    """Test that chunks read after the deadline are still written, with empty details."""
+    import json
+
+    import pandas as pd
+    import requests
+
+    from src.run import main
+
+    requested = []
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kwargs: requested.append(url)
+    )
+    monkeypatch.chdir(tmp_path)
+    snapshot = tmp_path / "snapshot.csv"
+    snapshot.write_text(
+        "Symbol,Name,Market Capital\n"
+        + "".join(f"T{i},Company {i},{i}000\n" for i in range(5))
+    )
+
+    main(["--offline", str(snapshot), "--chunk-rows", "2", "--deadline", "0"])
+
+    assert requested == []
+    exports = list((tmp_path / "output").glob("nasdaq_screener_*.csv"))
+    assert len(exports) == 1
+    result = pd.read_csv(exports[0], dtype=str, keep_default_na=False)
+    assert len(result) == 5
+    assert sorted(result["Symbol"]) == [f"T{i}" for i in range(5)]
+    assert set(result["CEO"]) == {""}
+    manifest = json.loads(exports[0].with_name(exports[0].name + ".manifest.json").read_text())
+    assert manifest["throughput"]["rows"] == 5
+
+def test_package_imports_stay_light():
+    """Importing the package, fetchers and entry points loads no heavy packages."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    # Checks every module in the benchmark's LIGHT_MODULES
+    result = subprocess.run(
+        [sys.executable, "benchmarks/import_time.py", "--check", "--repeat", "1"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    import src
+
+    assert src.CompanyDetails.__name__ == "CompanyDetails"
+
+def test_legacy_functions_share_one_fetcher():
+    """Test that legacy get_from_* calls reuse one fetcher and hit only their source."""
+    from src import fetch_company_details as legacy
+
+    fetcher = legacy.shared_fetcher()
+    requested = []
+    fetcher.http_client.get = lambda url, **kwargs: requested.append(url)
+    try:
+        legacy.get_from_cnbc("AAPL", {})
+        legacy.get_from_cnbc("MSFT", {})
+        legacy.get_from_gfinance_nyse("IBM", {})
+        details = legacy.get_from_yahoo_finance("BRK/B", {})
+        assert legacy.shared_fetcher() is fetcher
+        assert details.ticker == "BRKB"
+        assert requested == [
+            "https://www.cnbc.com/quotes/AAPL",
+            "https://www.cnbc.com/quotes/MSFT",
+            "https://www.google.com/finance/quote/IBM:NYSE?hl=en",
+            "https://finance.yahoo.com/quote/BRKB/profile/",
+        ]
+    finally:
+        legacy._shared_fetcher = None
+        legacy._legacy_scrapers.clear()
+
+def test_issuer_dedup_scrapes_one_listing_per_issuer():
+    """Test issuer grouping and that sibling listings reuse the scraped result."""
+    import pandas as pd
+
+    from src.models.company_details import CompanyDetails
+    from src.run import DataProcessor
+    from src.screener.issuers import issuer_key, issuer_representatives, symbol_root
+
+    assert issuer_key("Alphabet Inc. Class A Common Stock") == "alphabet inc"
+    assert symbol_root("ACAHW", "warrant") == "ACAH"
+    assert symbol_root("BRK/B") == "BRK"
+
+    df = pd.DataFrame(
+        {
+            "symbol": ["ACAHU", "ACAH", "ACAHW", "BRK/A", "BRK/B", "UAL", "ZZZ"],
+            "name": [
+                "Atlantic Coastal Acquisition Corp. Unit",
+                "Atlantic Coastal Acquisition Corp. Class A Common Stock",
+                "Atlantic Coastal Acquisition Corp. Warrant",
+                "Berkshire Hathaway Inc.",
+                "Berkshire Hathaway Inc.",
+                "United Airlines Holdings, Inc. Common Stock",
+                "Berkshire Hathaway Inc.",
+            ],
+        }
+    )
+    representatives = issuer_representatives(df["symbol"], df["name"])
+    # Same name but an unrelated symbol stays on its own
+    assert representatives.tolist() == [1, 1, 1, 3, 3, 5, 6]
+
+    processor = DataProcessor(max_workers=2, batch_size=10)
+    scraped = []
+
+    def fake_fetch(ticker, scrapers=None):
+        scraped.append(ticker)
+        return CompanyDetails(ceo=f"CEO of {ticker}", ticker=ticker)
+
+    processor.fetcher.fetch_company_details = fake_fetch
+    result = processor._process_companies_batch(processor._add_company_detail_columns(df))
+    processor.fetcher.close()
+    assert sorted(scraped) == ["ACAH", "BRK/A", "UAL", "ZZZ"]
+    assert result["CEO"].tolist() == ["CEO of ACAH"] * 3 + ["CEO of BRK/A"] * 2 + [
+        "CEO of UAL",
+        "CEO of ZZZ",
+    ]
+
+def test_negative_cache_skips_known_dead_ends(tmp_path, monkeypatch):
+    """Test that 404s, soft-404s and empty profiles are skipped on the next run."""
+    import requests
+
+    from src.config.settings import HostPolicy, Settings
+    from src.fetchers.company_details_fetcher import CompanyDetailsFetcher
+    from src.scrapers import NegativeCache
+
+    class FakeResponse:
+        def __init__(self, url, status_code=200, content=b"<html><body></body></html>"):
+            self.url = url
+            self.status_code = status_code
+            self.content = content
+
+    requested = []
+
+    def fake_get(self, url, **kwargs):
+        requested.append(url)
+        if "yahoo.com" in url:
+            return FakeResponse("https://finance.yahoo.com/lookup?s=DEAD")
+        if url.endswith("/DEAD"):
+            return FakeResponse(url, 404)
+        if url.endswith("/BUSY"):
+            return FakeResponse(url, 503)
+        if url.endswith("/EMPTY"):
+            return FakeResponse(url, content=b'<div class="CompanyProfile-profile"></div>')
+        # A consent wall or captcha: not a profile page, so not an empty profile
+        return FakeResponse(url)
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    path = tmp_path / "negative.sqlite"
+    settings = Settings(
+        scrapers=("yahoo", "cnbc"),
+        negative_cache=str(path),
+        http=HostPolicy(rate=0, max_retries=1),
+    )
+    tickers = ("DEAD", "EMPTY", "BUSY", "CONSENT")
+    fetcher = CompanyDetailsFetcher(settings=settings)
+    for ticker in tickers:
+        fetcher.fetch_company_details(ticker)
+    assert len(requested) == 8
+    # Yahoo soft-404 for all four, CNBC 404 and empty profile; the 503 and the
+    # unrecognized page are not cached
+    assert len(fetcher.negative_cache) == 6
+    fetcher.negative_cache.close()
+
+    requested.clear()
+    fetcher = CompanyDetailsFetcher(settings=settings)
+    for ticker in tickers:
+        fetcher.fetch_company_details(ticker)
+    assert requested == ["https://www.cnbc.com/quotes/BUSY", "https://www.cnbc.com/quotes/CONSENT"]
+    fetcher.negative_cache.close()
+
+    # An entry past its TTL no longer counts
+    expired = NegativeCache(tmp_path / "expired.sqlite", ttl_days=0)
+    expired.record("CNBCScraper", "DEAD", "not found")
+    assert not expired.is_dead("CNBCScraper", "DEAD")
+    expired.close()
+
+def test_throughput_benchmark_against_simulated_sites():
+    """Test that the benchmark harness drives the pipeline through the local server."""
+    import json
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [
+            sys.executable, "benchmarks/throughput.py", "--tickers", "6", "--rate", "0",
+            "--max-workers", "3", "--latency-ms", "0", "--page-kb", "1", "--json",
+        ],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout)
+    assert report["tickers"] == 6
+    assert report["ceo_hit_rate"] == 1.0
+    assert report["outcomes"]["useful"] >= 6
+    # Odd symbols are NYSE listings, so Google's NASDAQ page misses them first
+    assert report["outcomes"]["soft 404"] >= 3
+    assert report["wasted_requests"] == report["requests"] - report["outcomes"]["useful"]
+
 def setup_module():
     """Configure logging for test runs."""
     logging.basicConfig(level=logging.WARNING)